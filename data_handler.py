@@ -1,15 +1,219 @@
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import aiohttp
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_csv_to_parquet(data_dir='data', compression='zstd'):
+    """
+    One-off conversion of every CSV in `data_dir` to a Parquet file alongside it.
+    Args:
+        data_dir (str): Directory holding the `<source>.csv` inputs.
+        compression (str): Parquet compression codec.
+    Returns:
+        list: Paths of the Parquet files written.
+    """
+    written = []
+    for filename in sorted(os.listdir(data_dir)):
+        if not filename.endswith('.csv'):
+            continue
+        csv_path = os.path.join(data_dir, filename)
+        parquet_path = csv_path[:-len('.csv')] + '.parquet'
+        pd.read_csv(csv_path).to_parquet(parquet_path, compression=compression)
+        written.append(parquet_path)
+    return written
+
+
+_MISSING = object() # Sentinel distinguishing "not indexed" from a stored None
+
+def _value_series(keys, years, regions, values):
+    """
+    float64 Series of the values on a (key, year, region) MultiIndex. As in the batch value cube,
+    non-numeric values (labels, bools) become NaN, so range queries return usable numbers.
+    """
+    numeric = [v if isinstance(v, (int, float)) and not isinstance(v, bool) else np.nan for v in values]
+    return pd.Series(
+        numeric,
+        index=pd.MultiIndex.from_arrays([keys, years, regions], names=['key', 'year', 'region']),
+        dtype=np.float64,
+    )
+
+@dataclass(frozen=True, slots=True)
+class DataPoint:
+    """A single data value returned by EnergyDataHandler.get_data."""
+    value: object
+    unit: str | None
+    year: int | None
+    region: str | None
+    source: str
+
+
+# Same fields as functools' cache_info(), so both query caches report alike
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ClockCache:
+    """
+    Fixed-capacity CLOCK (second-chance) cache.
+
+    Approximates LRU with one reference bit per slot: a hit only sets the bit, and
+    eviction sweeps a hand over the slots, clearing set bits until it finds a clear one.
+    Writers are serialised by a lock; reads are lock-free and re-check the slot owner,
+    so a concurrent warmup thread can fill the cache while queries are served.
+    """
+    __slots__ = ('capacity', '_slots', '_keys', '_vals', '_ref', '_hand', '_lock', 'hits', 'misses')
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._slots = {} # key -> slot
+        self._keys = [_MISSING] * capacity
+        self._vals = [None] * capacity
+        self._ref = bytearray(capacity)
+        self._hand = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        slot = self._slots.get(key)
+        if slot is not None:
+            value = self._vals[slot]
+            # A concurrent set() may have reused the slot after it was looked up
+            if self._keys[slot] == key:
+                self.hits += 1
+                self._ref[slot] = 1
+                return value
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                if len(self._slots) < self.capacity:
+                    slot = len(self._slots)
+                else:
+                    while self._ref[self._hand]:
+                        self._ref[self._hand] = 0
+                        self._hand = (self._hand + 1) % self.capacity
+                    slot = self._hand
+                    del self._slots[self._keys[slot]]
+                    self._hand = (slot + 1) % self.capacity
+            # Invalidate the owner before swapping the value so lock-free readers never
+            # pair the new key with the old value; publish the slot mapping last.
+            self._keys[slot] = _MISSING
+            self._vals[slot] = value
+            self._keys[slot] = key
+            self._slots[key] = slot
+            self._ref[slot] = 1
+
+    def clear(self):
+        self._slots.clear()
+        self._keys = [_MISSING] * self.capacity
+        self._vals = [None] * self.capacity
+        self._ref = bytearray(self.capacity)
+        self._hand = 0
+        self.hits = self.misses = 0
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.capacity, len(self._slots))
+
+
 class EnergyDataHandler:
     """Handle energy data loading, preprocessing, and integration."""
+    __slots__ = (
+        'config', 'data_dir', 'data_format', 'precision', 'cache_dir',
+        '_default_hist_sources', '_default_api_conns',
+        'historical_data', '_hist_ro', '_l1', '_l2', '_tier_stats', '_year_rows', '_source_keys',
+        '_index', '_series', '_key_ids', '_year_ids', '_region_ids', '_values', '_cached_lookup',
+        'realtime_connections', '_lvc', '_lvc_ttl', '_realtime_series',
+    )
+
     def __init__(self, config):
         """
         Initialize the data handler.
         Args:
             config (dict): Configuration for data sources, paths, API keys etc.
+                           Optional keys:
+                           - data_dir: Directory holding `<source>.parquet` / `<source>.csv` files.
+                           - format: 'parquet' (default) or 'csv'. CSV is always used as a fallback.
+                           - columns: {source: [column, ...]} to restrict the columns read per source.
+                           - filters: {source: pyarrow filter expression} pushed down into Parquet reads.
+                           - schema: {source: {column: dtype}} for CSV sources, e.g.
+                             {'year': 'int32', 'region': 'category', 'gas_production': 'float32'}.
+                             Skips type inference and, unless `columns` is set, limits the read
+                             to the listed columns.
+                           - precision: 'fp32' (default) or 'fp64'. With 'fp32', float64 columns are
+                             stored as float32, 'year' as int16, other integers as int32 where the
+                             range allows, and 'region' dictionary-encoded. float32 carries a
+                             ~1e-7 relative error floor, so use 'fp64' for exact accounting totals.
+                           - io_workers: Number of threads used to load sources concurrently.
+                           - cache_dir: Directory of the on-disk Parquet cache (default ~/.cache/bd_energy).
+                           - l1_cache_entries: Loaded tables kept uncompressed in memory (default 16).
+                           - l2_cache_entries: Tables kept zstd-compressed in memory (default 256).
+                           - query_cache_size: Max entries memoized by get_data (default 65536).
+                           - clock_cache_threshold: Above this query_cache_size the exact LRU is
+                             replaced by a CLOCK pseudo-LRU (default 4096).
+                           - mmap_arrays: If True, get_column serves numeric columns from
+                             memory-mapped .npy files in cache_dir instead of heap arrays.
+                           - realtime_series: {data_key: (api_name, endpoint)} served by get_data
+                             from the last-value cache of real-time fetches.
+                           - lvc_count: Values kept per real-time series (default 64).
+                           - lvc_ttl: Seconds a cached real-time value stays valid (default 60).
+                           - units: {data_key: unit} for sources without a 'unit' column.
+                           - warmup: {'keys': [...], 'years': [...], 'regions': [...]} pre-fetched
+                             on a background thread once real-time integration completes.
         """
         self.config = config
+        self.data_dir = config.get('data_dir', 'data')
+        self.data_format = config.get('format', 'parquet')
+        self.precision = config.get('precision', 'fp32')
+        self.cache_dir = config.get('cache_dir', os.path.join(os.path.expanduser('~'), '.cache', 'bd_energy'))
+        self._default_hist_sources = tuple(config.get('historical_data_sources', ()))
+        self._default_api_conns = MappingProxyType(dict(config.get('realtime_api_connections', {})))
         self.historical_data = {}
+        self._hist_ro = MappingProxyType({}) # Frozen snapshot of historical_data for query paths
+        # Loaded tables are cached in three tiers, all keyed by _cache_key():
+        # L1 = uncompressed tables (LRU), L2 = zstd-compressed Arrow IPC bytes, L3 = Parquet in cache_dir.
+        self._l1 = OrderedDict()
+        self._l2 = OrderedDict()
+        self._tier_stats = {tier: [0, 0] for tier in ('l1', 'l2', 'l3')} # tier -> [hits, misses]
+        self._year_rows = {} # source -> {year: row indices}, for column slices by year
+        self._source_keys = {} # source -> cache key of the currently loaded table
+        self._index = {} # (data_key, year, region) -> value, rebuilt after each load
+        self._series = _value_series([], [], [], []) # Same values on a sorted (key, year, region) MultiIndex
+        # Dense numeric cube for batch queries: _values[key_id, year_id, region_id].
+        # The last slot on every axis is an all-NaN row that unknown labels map to.
+        self._key_ids, self._year_ids, self._region_ids = {}, {}, {}
+        self._values = np.full((1, 1, 1), np.nan)
+        self._cached_lookup = self._new_query_cache()
         self.realtime_connections = {}
-        print("EnergyDataHandler initialized.")
+        # Last-value cache: (api_name, endpoint) -> deque of (monotonic timestamp, payload)
+        lvc_count = config.get('lvc_count', 64)
+        self._lvc = defaultdict(lambda: deque(maxlen=lvc_count))
+        self._lvc_ttl = config.get('lvc_ttl', 60)
+        self._realtime_series = dict(config.get('realtime_series', {}))
+        logger.info("EnergyDataHandler initialized.")
 
     def load_historical_data(self, sources=None):
         """
@@ -18,38 +222,425 @@ class EnergyDataHandler:
             sources (list, optional): List of data sources to load.
                                       Defaults to sources specified in config.
         """
-        print("Loading historical data...")
-        if sources is None:
-            sources = self.config.get('historical_data_sources', [])
+        logger.info("Loading historical data...")
+        sources = self._default_hist_sources if sources is None else sources
 
+        pending = {}
         for source in sources:
-            print(f" - Loading data from {source}...")
-            # Placeholder: Actual data loading logic (e.g., reading CSVs, DB queries)
-            # self.historical_data[source] = pd.read_csv(f"data/{source}.csv")
-            self.historical_data[source] = {"placeholder": f"Data from {source}"}
+            path = self._source_path(source)
+            if path is None:
+                # Placeholder until the source file is available
+                self.historical_data[source] = {"placeholder": f"Data from {source}"}
+                continue
+            key = self._cache_key(source, path)
+            self._source_keys[source] = key
+            table = self._cache_get(key)
+            if table is not None:
+                logger.debug(" - Using cached data for %s", source)
+                self.historical_data[source] = table
+            else:
+                pending[source] = (path, key)
 
-        print("Historical data loading complete.")
+        # Sources are independent and I/O-bound, so read them concurrently.
+        # Results are only written into historical_data on this thread.
+        with ThreadPoolExecutor(max_workers=self.config.get('io_workers', 8)) as executor:
+            futures = {executor.submit(self._load_one, source, path, key): (source, key)
+                       for source, (path, key) in pending.items()}
+            for future in as_completed(futures):
+                source, key = futures[future]
+                logger.debug(" - Loaded data from %s", source)
+                table, from_disk_cache = future.result()
+                self._tier_stats['l3'][0 if from_disk_cache else 1] += 1
+                self._cache_put(key, table)
+                self.historical_data[source] = table
+
+        self._build_index()
+        logger.info("Historical data loading complete.")
         return self.historical_data
 
+    def _needed_cols(self, source):
+        # Column pushdown: only read the columns configured for this source (None = all)
+        return self.config.get('columns', {}).get(source)
+
+    def _needed_filters(self, source):
+        # Row filters are pushed down into Parquet reads only; CSV sources are read whole
+        return self.config.get('filters', {}).get(source)
+
+    def _source_path(self, source):
+        # Prefer Parquet unless CSV is configured; fall back to CSV if no Parquet file exists
+        if self.data_format == 'parquet':
+            parquet_path = os.path.join(self.data_dir, f"{source}.parquet")
+            if os.path.exists(parquet_path):
+                return parquet_path
+        csv_path = os.path.join(self.data_dir, f"{source}.csv")
+        if os.path.exists(csv_path):
+            return csv_path
+        return None
+
+    def _cache_key(self, source, path):
+        # The input file's mtime is part of the key, so edited inputs are re-read automatically
+        token = (f"{source}|{path}|{os.path.getmtime(path)}|{self._needed_cols(source)}|"
+                 f"{self._needed_filters(source)}|{self.config.get('schema', {}).get(source)}|{self.precision}")
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    def _load_one(self, source, path, key):
+        # Sources are kept as columnar Arrow tables, combined into one chunk per column
+        # so numeric columns can be handed out as zero-copy NumPy views.
+        cache_path = os.path.join(self.cache_dir, f"{key}.parquet")
+        # Parquet files are memory-mapped rather than read into a heap buffer first
+        if os.path.exists(cache_path):
+            return pq.read_table(cache_path, use_threads=True, memory_map=True).combine_chunks(), True
+
+        columns = self._needed_cols(source)
+        if path.endswith('.parquet'):
+            table = pq.read_table(path, columns=columns, filters=self._needed_filters(source),
+                                  use_threads=True, memory_map=True)
+        else:
+            table = pa_csv.read_csv(path, convert_options=self._csv_convert_options(source, columns))
+        table = table.combine_chunks()
+        if self.precision == 'fp32':
+            table = self._downcast(table)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        pq.write_table(table, cache_path)
+        return table, False
+
+    def _cache_get(self, key):
+        # L1 hit: refresh recency. L2 hit: decompress and promote to L1.
+        table = self._l1.get(key)
+        if table is not None:
+            self._l1.move_to_end(key)
+            self._tier_stats['l1'][0] += 1
+            return table
+        self._tier_stats['l1'][1] += 1
+
+        compressed = self._l2.pop(key, None)
+        if compressed is None:
+            self._tier_stats['l2'][1] += 1
+            return None
+        self._tier_stats['l2'][0] += 1
+        table = pa.ipc.open_stream(compressed).read_all()
+        self._cache_put(key, table)
+        return table
+
+    def _cache_put(self, key, table):
+        # Tables evicted from L1 are demoted to L2; L2 overflow is dropped (still on disk in L3)
+        self._l1[key] = table
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.config.get('l1_cache_entries', 16):
+            evicted_key, evicted = self._l1.popitem(last=False)
+            sink = pa.BufferOutputStream()
+            options = pa.ipc.IpcWriteOptions(compression='zstd')
+            with pa.ipc.new_stream(sink, evicted.schema, options=options) as writer:
+                writer.write_table(evicted)
+            self._l2[evicted_key] = sink.getvalue()
+            while len(self._l2) > self.config.get('l2_cache_entries', 256):
+                self._l2.popitem(last=False)
+
+    @staticmethod
+    def _downcast(table):
+        # Halve the footprint of numeric columns; the cache stores the downcast table
+        int32_info = np.iinfo(np.int32)
+        for i, field in enumerate(table.schema):
+            column = table.column(i)
+            if pa.types.is_float64(field.type):
+                column = column.cast(pa.float32())
+            elif field.name == 'year' and pa.types.is_integer(field.type):
+                column = column.cast(pa.int16())
+            elif pa.types.is_int64(field.type):
+                bounds = pc.min_max(column)
+                low, high = bounds['min'].as_py(), bounds['max'].as_py()
+                if low is not None and int32_info.min <= low and high <= int32_info.max:
+                    column = column.cast(pa.int32())
+            elif field.name == 'region' and (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                column = column.dictionary_encode()
+            else:
+                continue
+            table = table.set_column(i, field.name, column)
+        return table
+
+    def _csv_convert_options(self, source, columns):
+        schema = self.config.get('schema', {}).get(source)
+        if not schema:
+            return pa_csv.ConvertOptions(include_columns=columns)
+        column_types = {
+            column: pa.dictionary(pa.int32(), pa.string()) if dtype == 'category' else pa.type_for_alias(dtype)
+            for column, dtype in schema.items()
+        }
+        return pa_csv.ConvertOptions(column_types=column_types,
+                                     include_columns=columns if columns is not None else list(schema))
+
+    def _build_index(self):
+        """
+        Flatten every loaded source into (data_key, year, region) -> DataPoint lookups.
+
+        Long-format sources provide a 'value' column (and optionally 'key'; the source
+        name is used otherwise). In wide-format sources every column other than
+        key/year/region/unit is its own data key. Units come from a 'unit' column or
+        config['units']. Placeholder sources are indexed as (source, None, None).
+        """
+        # Freeze what was loaded; query paths read only from this snapshot, so they are
+        # unaffected by later edits to historical_data and safe to share across threads.
+        self._hist_ro = MappingProxyType({
+            source: MappingProxyType(data) if isinstance(data, dict) else data
+            for source, data in self.historical_data.items()
+        })
+
+        units = self.config.get('units', {})
+        index = {}
+        year_rows = {}
+        keys, years, regions, values = [], [], [], []
+        for source, data in self._hist_ro.items():
+            if not isinstance(data, pa.Table):
+                index[(source, None, None)] = DataPoint(data["placeholder"], None, None, None, source)
+                continue
+            n_rows = data.num_rows
+            names = data.column_names
+            year_col = data.column('year').to_pylist() if 'year' in names else [None] * n_rows
+            region_col = data.column('region').to_pylist() if 'region' in names else [None] * n_rows
+            unit_col = data.column('unit').to_pylist() if 'unit' in names else None
+            if 'value' in names:
+                value_cols = {None: data.column('value').to_pylist()}
+                key_col = data.column('key').to_pylist() if 'key' in names else [source] * n_rows
+            else:
+                value_cols = {col: data.column(col).to_pylist() for col in names if col not in ('key', 'year', 'region', 'unit')}
+                key_col = None
+            if 'year' in names:
+                rows_by_year = {}
+                for row, year in enumerate(year_col):
+                    rows_by_year.setdefault(year, []).append(row)
+                year_rows[source] = rows_by_year
+            for col, col_values in value_cols.items():
+                col_keys = key_col if key_col is not None else [col] * n_rows
+                col_units = unit_col if unit_col is not None else [units.get(k) for k in col_keys]
+                index.update(
+                    ((k, y, r), DataPoint(v, unit, y, r, source))
+                    for k, y, r, v, unit in zip(col_keys, year_col, region_col, col_values, col_units)
+                )
+                keys += col_keys
+                years += year_col
+                regions += region_col
+                values += col_values
+
+        self._index = index
+        self._year_rows = year_rows
+        self._cached_lookup = self._new_query_cache() # Invalidate memoized lookups
+        self._series = _value_series(keys, years, regions, values).sort_index()
+        self._build_value_cube(keys, years, regions, values)
+
+    def _build_value_cube(self, keys, years, regions, values):
+        key_ids = {k: i for i, k in enumerate(dict.fromkeys(keys))}
+        year_ids = {y: i for i, y in enumerate(dict.fromkeys(years))}
+        region_ids = {r: i for i, r in enumerate(dict.fromkeys(regions))}
+        cube = np.full((len(key_ids) + 1, len(year_ids) + 1, len(region_ids) + 1), np.nan)
+        for k, y, r, v in zip(keys, years, regions, values):
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                cube[key_ids[k], year_ids[y], region_ids[r]] = v
+        self._key_ids, self._year_ids, self._region_ids = key_ids, year_ids, region_ids
+        self._values = cube
+
+    def get_column(self, source, column, year=None):
+        """
+        Retrieve a whole column of a loaded source as a NumPy array.
+        Args:
+            source (str): Name of a loaded source.
+            column (str): Column name within the source.
+            year (int, optional): Only return the rows for this year.
+        Returns:
+            numpy.ndarray: Zero-copy view of the column where Arrow allows it
+                           (numeric, no nulls); otherwise a converted copy.
+        """
+        column_data = self._hist_ro[source].column(column)
+        is_numeric = pa.types.is_floating(column_data.type) or pa.types.is_integer(column_data.type)
+        if is_numeric and self.config.get('mmap_arrays', False):
+            array = self._mmap_column(source, column, column_data)
+        elif column_data.num_chunks == 1:
+            array = column_data.chunk(0).to_numpy(zero_copy_only=False)
+        else:
+            array = column_data.to_numpy()
+        if year is None:
+            return array
+        return array[self._year_rows.get(source, {}).get(year, [])]
+
+    def _mmap_column(self, source, column, column_data):
+        # Written once per (loaded table, column); later calls only map the file, so
+        # the OS pages the data in on demand instead of it living on the heap.
+        npy_path = os.path.join(self.cache_dir, f"{self._source_keys[source]}.{column}.npy")
+        if not os.path.exists(npy_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename, so a concurrent warmup never maps a half-written file
+            tmp_path = f"{npy_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, column_data.to_numpy())
+            os.replace(tmp_path, npy_path)
+        return np.load(npy_path, mmap_mode='r')
+
+    def warmup(self, keys, years, regions=(None,), background=False):
+        """
+        Pre-resolve likely queries so the first simulation years do not pay cold misses.
+        Fills the get_data query cache for every (key, year, region) combination and,
+        with mmap_arrays enabled, maps the numeric columns named in `keys`.
+        Args:
+            keys (sequence): Data keys the simulation will query.
+            years (sequence): Years that will be queried.
+            regions (sequence, optional): Regions that will be queried (default: no region).
+            background (bool, optional): Run on a daemon thread and return immediately.
+        Returns:
+            threading.Thread or None: The warmup thread when `background` is True.
+        """
+        if background:
+            thread = threading.Thread(target=self.warmup, args=(keys, years, regions),
+                                      name='data-warmup', daemon=True)
+            thread.start()
+            return thread
+
+        cached_lookup = self._cached_lookup
+        for key in keys:
+            for year in years:
+                for region in regions:
+                    cached_lookup(key, year, region)
+        if self.config.get('mmap_arrays', False):
+            wanted = set(keys)
+            for source, data in self._hist_ro.items():
+                if isinstance(data, pa.Table):
+                    for column in wanted.intersection(data.column_names):
+                        self.get_column(source, column)
+        logger.debug("Warmup complete for %d keys.", len(keys))
+        return None
+
+    def clear_cache(self):
+        """Drop the in-memory cache and delete all files in the on-disk Parquet cache."""
+        self._l1.clear()
+        self._l2.clear()
+        if os.path.isdir(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith(('.parquet', '.npy')):
+                    os.remove(os.path.join(self.cache_dir, filename))
+        logger.info("Data cache cleared.")
+
     def integrate_realtime_data(self, api_connections=None):
         """
         Set up connections to real-time data sources (if applicable).
+        Synchronous wrapper around integrate_realtime_data_async.
+        Args:
+            api_connections (dict, optional): Configuration for API connections.
+                                            Defaults to config settings.
+        """
+        return asyncio.run(self.integrate_realtime_data_async(api_connections))
+
+    async def integrate_realtime_data_async(self, api_connections=None):
+        """
+        Set up connections to real-time data sources, health-checking all APIs concurrently.
         Args:
             api_connections (dict, optional): Configuration for API connections.
+                                            Each may define a 'healthcheck' URL.
                                             Defaults to config settings.
         """
-        print("Setting up real-time data integration...")
-        if api_connections is None:
-            api_connections = self.config.get('realtime_api_connections', {})
+        logger.info("Setting up real-time data integration...")
+        api_connections = self._default_api_conns if api_connections is None else api_connections
 
-        for api_name, api_config in api_connections.items():
-            print(f" - Connecting to {api_name}...")
-            # Placeholder: Actual API connection logic
-            self.realtime_connections[api_name] = {"status": "connected", "config": api_config}
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as http:
+            statuses = await asyncio.gather(
+                *[self._connect(api_name, api_config, http) for api_name, api_config in api_connections.items()]
+            )
 
-        print("Real-time data integration setup complete.")
+        for (api_name, api_config), status in zip(api_connections.items(), statuses):
+            self.realtime_connections[api_name] = {
+                "status": status,
+                "config": api_config,
+                "session": self._open_session(api_config),
+                "base_url": api_config.get('url', ''),
+            }
+
+        logger.info("Real-time data integration setup complete.")
+        warmup_plan = self.config.get('warmup')
+        if warmup_plan:
+            # Overlap cache warming with the rest of the simulation setup
+            self.warmup(warmup_plan['keys'], warmup_plan['years'], warmup_plan.get('regions', (None,)),
+                        background=True)
         return self.realtime_connections
 
+    async def _connect(self, api_name, api_config, http):
+        logger.debug(" - Connecting to %s...", api_name)
+        healthcheck_url = api_config.get('healthcheck')
+        if healthcheck_url is None:
+            return "connected"
+        try:
+            async with http.get(healthcheck_url, timeout=aiohttp.ClientTimeout(total=api_config.get('timeout', 10))) as response:
+                return "connected" if response.ok else f"error: HTTP {response.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Health check for %s failed: %s", api_name, e)
+            return "unreachable"
+
+    def _open_session(self, api_config):
+        # One pooled session per API so repeated calls reuse TCP/TLS connections
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=api_config.get('pool_connections', 4),
+            pool_maxsize=api_config.get('pool_maxsize', 32),
+            max_retries=Retry(total=api_config.get('max_retries', 3), backoff_factor=0.3),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(api_config.get('headers', {}))
+        return session
+
+    def fetch_realtime_data(self, api_name, endpoint='', params=None):
+        """
+        Fetch a JSON payload from a connected real-time API.
+        Args:
+            api_name (str): Name of a connection set up by integrate_realtime_data.
+            endpoint (str, optional): Path appended to the API's base URL.
+            params (dict, optional): Query parameters.
+        Returns:
+            Decoded JSON response.
+        """
+        connection = self.realtime_connections[api_name]
+        response = connection["session"].get(
+            connection["base_url"] + endpoint,
+            params=params,
+            timeout=connection["config"].get('timeout', 10),
+        )
+        response.raise_for_status()
+        payload = response.json()
+        self._lvc[(api_name, endpoint)].append((time.monotonic(), payload))
+        return payload
+
+    def fetch_realtime_data_many(self, queries):
+        """
+        Fetch several real-time payloads concurrently.
+        Args:
+            queries (list): (api_name, endpoint, params) tuples.
+        Returns:
+            list: Decoded JSON responses, in the order of `queries`.
+        """
+        return asyncio.run(self._fetch_many(queries))
+
+    async def _fetch_many(self, queries):
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as http:
+            return await asyncio.gather(*[self._fetch_one(http, *query) for query in queries])
+
+    async def _fetch_one(self, http, api_name, endpoint='', params=None):
+        connection = self.realtime_connections[api_name]
+        async with http.get(
+            connection["base_url"] + endpoint,
+            params=params,
+            headers=connection["config"].get('headers', {}),
+            timeout=aiohttp.ClientTimeout(total=connection["config"].get('timeout', 10)),
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json()
+        self._lvc[(api_name, endpoint)].append((time.monotonic(), payload))
+        return payload
+
+    def close(self):
+        """Close all pooled real-time API sessions."""
+        for connection in self.realtime_connections.values():
+            connection["session"].close()
+            connection["status"] = "closed"
+
     def get_data(self, data_key, year=None, region=None):
         """
         Retrieve specific data point or series for the simulation.
@@ -58,15 +649,141 @@ class EnergyDataHandler:
             year (int, optional): Specific year required.
             region (str, optional): Specific region required.
         Returns:
-            Data value or series (e.g., float, dict, pandas Series).
+            DataPoint: The value with its unit, year, region and source, or None if not found.
+                       Real-time series return the latest cached payload as the value.
+        """
+        logger.debug("Retrieving data for key: %s, Year: %s, Region: %s", data_key, year, region)
+        series = self._realtime_series.get(data_key)
+        if series is not None:
+            latest = self.last_values(*series, count=1)
+            if latest:
+                return DataPoint(latest[0], self.config.get('units', {}).get(data_key), year, region, series[0])
+        return self._cached_lookup(data_key, year, region)
+
+    def last_values(self, api_name, endpoint='', count=None):
+        """
+        Return the most recent cached payloads of a real-time series, oldest first.
+        Entries older than the configured TTL are evicted on read.
+        Args:
+            api_name (str): Name of the real-time API.
+            endpoint (str, optional): Endpoint the values were fetched from.
+            count (int, optional): Return at most this many of the newest values.
+        Returns:
+            list: Cached payloads (empty if nothing fresh is cached).
+        """
+        values = self._lvc.get((api_name, endpoint))
+        if not values:
+            return []
+        expiry = time.monotonic() - self._lvc_ttl
+        while values and values[0][0] < expiry:
+            values.popleft()
+        payloads = [payload for _, payload in values]
+        return payloads if count is None else payloads[-count:]
+
+    def _new_query_cache(self):
+        # Memoize per instance (a module-level cache would pin every handler's index);
+        # a fresh cache is created whenever the index is rebuilt.
+        size = self.config.get('query_cache_size', 65536)
+        if size <= self.config.get('clock_cache_threshold', 4096):
+            return functools.lru_cache(maxsize=size)(self._lookup)
+
+        # Large caches use CLOCK: a hit costs one bit write instead of relinking LRU nodes
+        cache = ClockCache(size)
+        lookup = self._lookup
+
+        def cached_lookup(data_key, year, region):
+            key = (data_key, year, region)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = lookup(data_key, year, region)
+                cache.set(key, value)
+            return value
+
+        cached_lookup.cache_info = cache.cache_info
+        return cached_lookup
+
+    def _lookup(self, data_key, year, region):
+        value = self._index.get((data_key, year, region), _MISSING)
+        if value is _MISSING:
+            # Sources without a year/region breakdown are stored under (data_key, None, None)
+            value = self._index.get((data_key, None, None))
+        return value
+
+    def cache_stats(self):
+        """
+        Return hit/miss statistics of every cache.
+        Returns:
+            dict: CacheInfo tuples for 'query' (get_data memoization) and for the
+                  'l1', 'l2' and 'l3' tiers of the loaded-table cache.
+        """
+        return {
+            'query': self._cached_lookup.cache_info(),
+            'l1': CacheInfo(*self._tier_stats['l1'], self.config.get('l1_cache_entries', 16), len(self._l1)),
+            'l2': CacheInfo(*self._tier_stats['l2'], self.config.get('l2_cache_entries', 256), len(self._l2)),
+            'l3': CacheInfo(*self._tier_stats['l3'], None, None),
+        }
+
+    def get_many(self, queries, numeric=False):
+        """
+        Retrieve many historical data points in one call; preferred over repeated
+        get_data calls in simulation inner loops.
+        Args:
+            queries (sequence): (data_key, year, region) tuples.
+            numeric (bool, optional): If True, return a float64 array (NaN for missing
+                                      or non-numeric values) via get_data_batch.
+        Returns:
+            list or numpy.ndarray: DataPoints (None if not found) or raw floats,
+                                   in the order of `queries`.
+        """
+        if numeric:
+            if not queries:
+                return np.empty(0)
+            return self.get_data_batch(*zip(*queries))
+        index = self._index
+        results = [index.get(query, _MISSING) for query in queries]
+        for i, value in enumerate(results):
+            if value is _MISSING:
+                results[i] = index.get((queries[i][0], None, None))
+        return results
+
+    def get_data_batch(self, keys, years, regions):
+        """
+        Retrieve many numeric data points in one call.
+        Args:
+            keys (sequence): Data keys.
+            years (sequence): Years, aligned with `keys`.
+            regions (sequence): Regions, aligned with `keys` (None for no region).
+        Returns:
+            numpy.ndarray: float64 values; NaN where no numeric value is indexed.
+        """
+        # Labels are encoded once, then a single fancy-indexing gather runs in C
+        key_idx = np.fromiter((self._key_ids.get(k, -1) for k in keys), dtype=np.intp, count=len(keys))
+        year_idx = np.fromiter((self._year_ids.get(y, -1) for y in years), dtype=np.intp, count=len(years))
+        region_idx = np.fromiter((self._region_ids.get(r, -1) for r in regions), dtype=np.intp, count=len(regions))
+        return self._values[key_idx, year_idx, region_idx]
+
+    def get_data_range(self, data_key, start_year=None, end_year=None, region=None):
+        """
+        Retrieve a year range of values for a data key.
+        Args:
+            data_key (str): Identifier for the desired data.
+            start_year (int, optional): First year (inclusive). Open-ended if None.
+            end_year (int, optional): Last year (inclusive). Open-ended if None.
+            region (str, optional): Restrict to one region. All regions if None.
+        Returns:
+            pandas.Series: Values indexed by (key, year, region); empty if nothing matches.
         """
-        print(f"Retrieving data for key: {data_key}, Year: {year}, Region: {region}")
-        # Placeholder: Logic to find and return the correct data
-        # from historical_data or potentially real-time feeds
-        return self.historical_data.get(data_key, {}).get("placeholder", None)
+        if data_key not in self._series.index.get_level_values('key'):
+            return self._series.iloc[0:0]
+        selector = (data_key, slice(start_year, end_year)) if region is None else (data_key, slice(start_year, end_year), region)
+        try:
+            return self._series.loc[selector]
+        except KeyError: # e.g. a region the key has no values for
+            return self._series.iloc[0:0]
 
 # Example Usage:
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     data_config = {
         'historical_data_sources': ['bpdb_generation', 'breb_connections'],
         'realtime_api_connections': {'weather_api': {'key': 'dummy_key'}}
@@ -77,4 +794,5 @@ if __name__ == "__main__":
     rt_connections = data_handler.integrate_realtime_data()
     print("\nReal-time Connections:", rt_connections)
     sample_data = data_handler.get_data('bpdb_generation', year=2023)
-    print("\nSample Retrieved Data:", sample_data) 
\ No newline at end of file
+    print("\nSample Retrieved Data:", sample_data)
+    data_handler.close() 
\ No newline at end of file
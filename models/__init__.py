@@ -1,27 +1,34 @@
-from .generation_portfolio import GenerationPortfolioModel
-from .fuel_supply import FuelSupplyModel
-from .grid_infrastructure import GridInfrastructureModel
-from .demand import DemandModel
-from .market import MarketModel
-from .governance import GovernanceModel
-from .renewable_transition import RenewableTransitionModel
-from .energy_access import EnergyAccessModel
-from .climate_resilience import ClimateResilienceModel
-from .environmental_impact import EnvironmentalImpactModel
-from .innovation_ecosystem import InnovationEcosystemModel
-from .energy_finance import EnergyFinanceModel
+import logging
+from importlib import import_module
 
-__all__ = [
-    "GenerationPortfolioModel",
-    "FuelSupplyModel",
-    "GridInfrastructureModel",
-    "DemandModel",
-    "MarketModel",
-    "GovernanceModel",
-    "RenewableTransitionModel",
-    "EnergyAccessModel",
-    "ClimateResilienceModel",
-    "EnvironmentalImpactModel",
-    "InnovationEcosystemModel",
-    "EnergyFinanceModel",
-] 
\ No newline at end of file
+# Submodule loggers propagate to this one; silent unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Model class -> submodule defining it. Submodules are imported on first attribute
+# access (PEP 562), so importing the package does not pull in every model.
+_LAZY = {
+    "GenerationPortfolioModel": "generation_portfolio",
+    "FuelSupplyModel": "fuel_supply",
+    "GridInfrastructureModel": "grid_infrastructure",
+    "DemandModel": "demand",
+    "MarketModel": "market",
+    "GovernanceModel": "governance",
+    "RenewableTransitionModel": "renewable_transition",
+    "EnergyAccessModel": "energy_access",
+    "ClimateResilienceModel": "climate_resilience",
+    "EnvironmentalImpactModel": "environmental_impact",
+    "InnovationEcosystemModel": "innovation_ecosystem",
+    "EnergyFinanceModel": "energy_finance",
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module("." + _LAZY[name], __name__), name)
+        globals()[name] = value # Cache so later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,63 @@
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping, Set
+
+# Same fields as functools' cache_info()
+MemoInfo = namedtuple('MemoInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+def freeze(value):
+    """Hashable, key-order independent form of a nested config value (mappings, sequences, scalars)."""
+    if isinstance(value, Mapping):
+        return tuple(sorted(((key, freeze(item)) for key, item in value.items()), key=lambda pair: repr(pair[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, Set):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+class ResultMemo:
+    """
+    Bounded LRU memo of yearly model results, keyed on the inputs the result depends on.
+
+    Models build the key from their resolved drivers (plus any state the result depends
+    on) and their config scope (see scope()), so one memo can be shared by every model a
+    simulation builds: a scenario sweep that replays the same inputs on the same model
+    config reuses the stored summary. Cached summaries are shared between callers and
+    must be treated as read-only. maxsize=0 disables the memo.
+    """
+    __slots__ = ('_entries', '_scopes', 'maxsize', 'hits', 'misses')
+
+    def __init__(self, maxsize=256):
+        self._entries = OrderedDict()
+        self._scopes = {}
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def scope(self, config):
+        """
+        Small int identifying ``config`` by value within this memo, to lead a model's keys.
+        Models with equal configs get the same id, so they share entries; any difference
+        in the config gives a new id.
+        """
+        return self._scopes.setdefault(freeze(config), len(self._scopes))
+
+    def get(self, key):
+        """Returns the value stored under ``key`` (marking it recently used), or None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Stores ``value`` under ``key``, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def cache_info(self):
+        return MemoInfo(self.hits, self.misses, self.maxsize, len(self._entries))
@@ -1,5 +1,152 @@
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Hazard kernels: pure array arithmetic with no model state. Every argument may be a scalar
+# or an ndarray and arguments broadcast against each other, so years of shape (Y,) with
+# factors/scores of shape (N, 1) evaluate N hazard paths over Y years in one call.
+# run_ensemble uses them directly; simulate_climate_impacts repeats the formulas on scalars.
+
+def _hazard_indices(years, cyclone_factor, flood_factor, temp_factor, slr_factor):
+    """
+    Hazard levels for the given year(s); they increase over time (example).
+
+    Returns:
+        tuple: (cyclone intensity index, flood risk index, temperature increase in deg C,
+               sea-level rise in cm)
+    """
+    elapsed = np.asarray(years) - 2025
+    cyclone_intensity_index = 1.0 + 0.02 * elapsed * cyclone_factor
+    flood_risk_index = 1.0 + 0.015 * elapsed * flood_factor
+    temp_increase_deg_c = 0.05 * elapsed * temp_factor
+    slr_cm = 1.0 * elapsed * slr_factor # Example SLR rate
+    return cyclone_intensity_index, flood_risk_index, temp_increase_deg_c, slr_cm
+
+def _cyclone_kernel(cyclone_intensity_index, cyclone_protection_score):
+    # Placeholder: Model damage based on cyclone intensity, infrastructure vulnerability, and protection.
+    # Vulnerability decreases with adaptation (e.g., undergrounding, tower strength)
+    vulnerability_factor = np.maximum(0.1, 0.8 - np.asarray(cyclone_protection_score) * 0.5)
+    damage_cost = 50 * cyclone_intensity_index * vulnerability_factor # Example cost (Million USD/event)
+    outage_duration_hours = 24 * cyclone_intensity_index * vulnerability_factor # Example
+    return damage_cost, outage_duration_hours
+
+def _flood_kernel(flood_risk_index, flood_protection_score):
+    # Placeholder: Model damage based on flood depth/duration, substation elevation, defenses.
+    damage_cost = 30 * flood_risk_index * np.maximum(0.1, 1 - np.asarray(flood_protection_score)) # Example cost (Million USD/year)
+    return damage_cost
+
+def _temperature_kernel(temp_increase_deg_c, temp_adaptation_score):
+    # Placeholder: Model derating of lines/plants, cooling constraints, HVAC demand spikes.
+    derating_factor = 0.01 * temp_increase_deg_c # Example: 1% derating per degree C increase
+    # Adaptation (e.g., high-temp conductors) reduces impact
+    net_derating = np.maximum(0, derating_factor * (1 - np.asarray(temp_adaptation_score)))
+    cooling_stress_index = temp_increase_deg_c * 0.1 # Example
+    return net_derating, cooling_stress_index
+
+def _sea_level_rise_kernel(slr_cm, slr_adaptation_score):
+    # Placeholder: Model coastal inundation risk, salinity impacts, relocation needs.
+    assets_at_risk_pct = np.minimum(1.0, 0.05 + slr_cm * 0.01) # Example % assets vulnerable
+    net_risk_factor = np.maximum(0, assets_at_risk_pct * (1 - np.asarray(slr_adaptation_score)))
+    return net_risk_factor
+
+@dataclass(frozen=True, slots=True)
+class ClimateConfig:
+    """Scalar climate settings, resolved from the config dict once at initialisation."""
+    rcp: str | None = 'rcp45'
+    investment_effectiveness: float = 0.1
+    baseline_resilience: float = 0.4
+    sim_years: tuple = tuple(range(2025, 2051))
+
+    @classmethod
+    def from_config(cls, config):
+        """Reads the settings from a ClimateResilienceModel config dict, applying its defaults."""
+        return cls(
+            rcp=config.get('hazard_scenarios', {'rcp': 'rcp45'}).get('rcp'),
+            investment_effectiveness=config.get('adaptation_params', {'investment_effectiveness': 0.1}).get('investment_effectiveness', 0.1),
+            baseline_resilience=config.get('baseline_resilience', 0.4),
+            sim_years=tuple(config.get('sim_years', range(2025, 2051))),
+        )
+
+# Order of the per-hazard scaling factors in ClimateResilienceModel._hazard_factors_arr
+HAZARD_FACTOR_KEYS = ('cyclone_factor', 'flood_factor', 'temp_factor', 'slr_factor')
+
+@lru_cache(maxsize=4)
+def _rcp_factors(rcp):
+    """Hazard scaling factors for an RCP pathway, ordered as HAZARD_FACTOR_KEYS."""
+    # Simplified: RCP4.5 is the reference pathway, anything else scales each hazard up
+    return (1.0, 1.0, 1.0, 1.0) if rcp == 'rcp45' else (1.5, 1.3, 1.2, 1.4)
+
+@lru_cache(maxsize=16)
+def _hazard_level_table(rcp, years):
+    """
+    Hazard levels for an RCP pathway over a tuple of consecutive years, one row per year
+    ordered as _hazard_indices' outputs. Shared read-only by every model with the same
+    pathway and horizon, so a sweep builds it once.
+    """
+    table = np.column_stack(_hazard_indices(np.array(years), *_rcp_factors(rcp)))
+    table.flags.writeable = False
+    return table
+
+# Order of the per-hazard adaptation scores in ClimateResilienceModel._adapt_scores
+ADAPTATION_SCORE_KEYS = ('cyclone_protection_score', 'flood_protection_score', 'temp_adaptation_score', 'slr_adaptation_score')
+# Share of the overall resilience score credited to each hazard's adaptation (simplified)
+ADAPTATION_WEIGHTS = (0.8, 0.7, 0.5, 0.6)
+# Metrics along the last axis of run_ensemble's output and ClimateResilienceModel.climate_history()
+CLIMATE_METRICS = ('cyclone_damage_m_usd', 'cyclone_outage_hours', 'flood_damage_m_usd', 'avg_derating_factor',
+                   'cooling_stress_index', 'sea_level_rise_cm', 'slr_net_risk_factor', 'resilience_score')
+
+def run_ensemble(years, adaptation_investment, hazard_factors, base_resilience, investment_effectiveness=0.1):
+    """
+    Evaluates climate impacts for many independent scenarios at once.
+
+    The resilience score is the only year-to-year state, so it is stepped through the
+    years for all scenarios together; the hazard kernels then run once over the whole
+    (scenarios x years) grid.
+
+    Args:
+        years (array-like): Simulation years, shape (Y,).
+        adaptation_investment (array-like): Adaptation investment (Million USD) per scenario
+                                            and year, shape (N, Y).
+        hazard_factors (array-like): Hazard scaling factors per scenario, shape (N, 4), ordered
+                                     as HAZARD_FACTOR_KEYS (e.g. from _rcp_factors).
+        base_resilience (array-like): Starting resilience score per scenario, shape (N,).
+        investment_effectiveness (float or array-like): Resilience gained per $1bn of investment.
+
+    Returns:
+        np.ndarray: Shape (N, Y, len(CLIMATE_METRICS)), metrics ordered as CLIMATE_METRICS.
+    """
+    years = np.asarray(years)
+    investment = np.asarray(adaptation_investment, dtype=np.float64)
+    factors = np.asarray(hazard_factors, dtype=np.float64)
+    score = np.array(base_resilience, dtype=np.float64)
+    resilience = np.empty(investment.shape)
+    for y in range(years.size):
+        score = np.minimum(1.0, score + investment_effectiveness * (investment[:, y] / 1000) * (1 - score))
+        resilience[:, y] = score
+    scores = resilience[:, :, None] * np.array(ADAPTATION_WEIGHTS) # (N, Y, 4)
+    cyclone_intensity, flood_risk, temp_increase, slr_cm = _hazard_indices(years, *(factors[:, i:i + 1] for i in range(4)))
+    out = np.empty(investment.shape + (len(CLIMATE_METRICS),))
+    out[..., 0], out[..., 1] = _cyclone_kernel(cyclone_intensity, scores[..., 0])
+    out[..., 2] = _flood_kernel(flood_risk, scores[..., 1])
+    out[..., 3], out[..., 4] = _temperature_kernel(temp_increase, scores[..., 2])
+    out[..., 5] = slr_cm
+    out[..., 6] = _sea_level_rise_kernel(slr_cm, scores[..., 3])
+    out[..., 7] = resilience
+    return out
+
 class ClimateResilienceModel:
     """Model climate impacts on energy systems and adaptation"""
+    __slots__ = (
+        'config', 'vulnerability_params', 'hazard_scenarios', 'adaptation_params',
+        'current_resilience_score', 'cumulative_adaptation_investment',
+        '_cfg', '_hazard_factors_arr', '_hazard_factors_dict', '_years', '_hazard_levels', '_adapt_weights', '_adapt_scores',
+        '_climate_out',
+    )
+
     def __init__(self, config):
         """
         Initializes the climate resilience model.
@@ -10,71 +157,58 @@ class ClimateResilienceModel:
                            - hazard_scenarios: Projections for cyclone intensity, flood levels, temp increase, SLR.
                            - adaptation_params: Costs and effectiveness of adaptation measures.
                            - baseline_resilience: Initial resilience score or metrics.
+                           - sim_years: Years to precompute hazard levels for (default 2025-2050).
         """
         self.config = config
         self.vulnerability_params = config.get('vulnerability_params', {})
         self.hazard_scenarios = config.get('hazard_scenarios', {'rcp': 'rcp45'}) # Example scenario choice
         self.adaptation_params = config.get('adaptation_params', {'investment_effectiveness': 0.1})
+        # Scalar settings parsed once; the yearly step reads these instead of the nested dicts
+        self._cfg = ClimateConfig.from_config(config)
         # Store current resilience state
-        self.current_resilience_score = config.get('baseline_resilience', 0.4)
+        self.current_resilience_score = self._cfg.baseline_resilience
         self.cumulative_adaptation_investment = 0
+        # Hazard scaling factors depend only on the RCP choice, so they are fixed for the run
+        self._hazard_factors_arr = np.array(_rcp_factors(self._cfg.rcp))
+        self._hazard_factors_dict = dict(zip(HAZARD_FACTOR_KEYS, self._hazard_factors_arr.tolist()))
+        # With the factors fixed, hazard levels depend only on the year: one precomputed row per
+        # simulation year (cyclone intensity, flood risk, temp increase, SLR)
+        self._years = np.array(self._cfg.sim_years)
+        self._hazard_levels = _hazard_level_table(self._cfg.rcp, self._cfg.sim_years)
+        # Per-hazard adaptation weights and the resulting scores, both ordered as ADAPTATION_SCORE_KEYS
+        self._adapt_weights = np.array(ADAPTATION_WEIGHTS)
+        self._adapt_scores = np.zeros(len(ADAPTATION_SCORE_KEYS)) # Set by _simulate_climate_resilient_design
+        # Yearly outputs over sim_years, columns ordered as CLIMATE_METRICS (NaN until simulated)
+        self._climate_out = np.full((len(self._years), len(CLIMATE_METRICS)), np.nan)
 
-        print("ClimateResilienceModel initialized.")
-
-    def _simulate_cyclone_impacts(self, year, hazard_level, infrastructure_state, adaptation_measures):
-        # Placeholder: Model damage based on cyclone intensity, infrastructure vulnerability, and protection.
-        # Hazard level increases over time (example)
-        cyclone_intensity_index = 1.0 + 0.02 * (year - 2025) * hazard_level.get('cyclone_factor', 1.0)
-        # Vulnerability decreases with adaptation (e.g., undergrounding, tower strength)
-        vulnerability_factor = max(0.1, 0.8 - adaptation_measures.get('cyclone_protection_score', 0) * 0.5)
-        damage_cost = 50 * cyclone_intensity_index * vulnerability_factor # Example cost (Million USD/event)
-        outage_duration_hours = 24 * cyclone_intensity_index * vulnerability_factor # Example
-        print(f"  - Cyclone Impacts: Intensity {cyclone_intensity_index:.2f}, Vulnerability {vulnerability_factor:.2f}, Est. Damage ${damage_cost:.1f}M/event")
-        return {'estimated_damage_cost_per_event_m_usd': damage_cost, 'estimated_outage_hours_per_event': outage_duration_hours}
-
-    def _simulate_flooding_impacts(self, year, hazard_level, infrastructure_state, adaptation_measures):
-        # Placeholder: Model damage based on flood depth/duration, substation elevation, defenses.
-        flood_risk_index = 1.0 + 0.015 * (year - 2025) * hazard_level.get('flood_factor', 1.0)
-        protection_level = adaptation_measures.get('flood_protection_score', 0)
-        damage_cost = 30 * flood_risk_index * max(0.1, 1 - protection_level) # Example cost (Million USD/year)
-        print(f"  - Flooding Impacts: Risk Index {flood_risk_index:.2f}, Protection {protection_level:.2f}, Est. Damage ${damage_cost:.1f}M/year")
-        return {'estimated_annual_damage_cost_m_usd': damage_cost}
-
-    def _simulate_temperature_effects(self, year, hazard_level, infrastructure_state, adaptation_measures):
-        # Placeholder: Model derating of lines/plants, cooling constraints, HVAC demand spikes.
-        temp_increase_deg_c = 0.05 * (year - 2025) * hazard_level.get('temp_factor', 1.0)
-        derating_factor = 0.01 * temp_increase_deg_c # Example: 1% derating per degree C increase
-        # Adaptation (e.g., high-temp conductors) reduces impact
-        mitigation_factor = adaptation_measures.get('temp_adaptation_score', 0)
-        net_derating = max(0, derating_factor * (1 - mitigation_factor))
-        cooling_stress_index = temp_increase_deg_c * 0.1 # Example
-        print(f"  - Temperature Effects: Temp Increase {temp_increase_deg_c:.2f}C, Net Derating {net_derating*100:.2f}%")
-        return {'avg_derating_factor': net_derating, 'cooling_stress_index': cooling_stress_index}
-
-    def _simulate_sea_level_rise_impacts(self, year, hazard_level, infrastructure_state, adaptation_measures):
-        # Placeholder: Model coastal inundation risk, salinity impacts, relocation needs.
-        slr_cm = 1.0 * (year - 2025) * hazard_level.get('slr_factor', 1.0) # Example SLR rate
-        assets_at_risk_pct = min(1.0, 0.05 + slr_cm * 0.01) # Example % assets vulnerable
-        adaptation_level = adaptation_measures.get('slr_adaptation_score', 0)
-        net_risk_factor = max(0, assets_at_risk_pct * (1 - adaptation_level))
-        print(f"  - Sea Level Rise: SLR {slr_cm:.1f}cm, Net Risk Factor {net_risk_factor:.3f}")
-        return {'sea_level_rise_cm': slr_cm, 'net_risk_factor': net_risk_factor}
+        logger.info("ClimateResilienceModel initialized.")
+
+    def climate_history(self):
+        """
+        Returns the yearly outputs simulated so far over sim_years.
+
+        Returns:
+            tuple: (years array of shape (Y,), read-only array of shape (Y, len(CLIMATE_METRICS))
+                   with columns ordered as CLIMATE_METRICS and NaN rows for years not yet simulated)
+        """
+        out = self._climate_out.view()
+        out.flags.writeable = False
+        return self._years, out
 
     def _simulate_climate_resilient_design(self, year, adaptation_investment):
         # Placeholder: Model adoption of forward-looking standards, increasing resilience score.
+        investment_effectiveness = self._cfg.investment_effectiveness
+        score = self.current_resilience_score
         self.cumulative_adaptation_investment += adaptation_investment
-        investment_effectiveness = self.adaptation_params.get('investment_effectiveness', 0.1)
         # Resilience score increases with investment, but diminishing returns
-        resilience_increase = investment_effectiveness * (adaptation_investment / 1000) * (1 - self.current_resilience_score)
-        self.current_resilience_score = min(1.0, self.current_resilience_score + resilience_increase)
+        resilience_increase = investment_effectiveness * (adaptation_investment / 1000) * (1 - score)
+        score = min(1.0, score + resilience_increase)
+        self.current_resilience_score = score
         # Map resilience score to specific adaptation measures scores (simplified)
-        adaptation_scores = {
-            'cyclone_protection_score': self.current_resilience_score * 0.8,
-            'flood_protection_score': self.current_resilience_score * 0.7,
-            'temp_adaptation_score': self.current_resilience_score * 0.5,
-            'slr_adaptation_score': self.current_resilience_score * 0.6
-        }
-        print(f"  - Resilient Design: Investment ${adaptation_investment}M, New Resilience Score {self.current_resilience_score:.3f}")
+        np.multiply(self._adapt_weights, score, out=self._adapt_scores)
+        adaptation_scores = dict(zip(ADAPTATION_SCORE_KEYS, self._adapt_scores.tolist()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Resilient Design: Investment $%sM, New Resilience Score %.3f", adaptation_investment, self.current_resilience_score)
         return {'overall_resilience_score': self.current_resilience_score, 'adaptation_measures_scores': adaptation_scores}
 
     def simulate_climate_impacts(self, year, hazard_scenarios, infrastructure_vulnerability, adaptation_investment, infrastructure_state):
@@ -91,30 +225,53 @@ class ClimateResilienceModel:
         Returns:
             dict: Summary of climate impacts and resilience status for the year.
         """
-        print(f"Simulating climate impacts for year {year}...")
-
-        # Determine current hazard levels based on scenarios (e.g., RCP)
-        # Simplified: use factors from config
-        hazard_factors = {
-            'cyclone_factor': 1.0 if self.hazard_scenarios.get('rcp') == 'rcp45' else 1.5,
-            'flood_factor': 1.0 if self.hazard_scenarios.get('rcp') == 'rcp45' else 1.3,
-            'temp_factor': 1.0 if self.hazard_scenarios.get('rcp') == 'rcp45' else 1.2,
-            'slr_factor': 1.0 if self.hazard_scenarios.get('rcp') == 'rcp45' else 1.4,
-        }
+        logger.info("Simulating climate impacts for year %s...", year)
+
+        # Current hazard levels based on scenarios (e.g., RCP), resolved at initialisation
+        hazard_factors = self._hazard_factors_dict
+        cyclone_frequency = hazard_scenarios.get('cyclone_frequency', 0.5)
 
         # Simulate effect of adaptation investment
         resilience_results = self._simulate_climate_resilient_design(year, adaptation_investment)
-        adaptation_measures_scores = resilience_results['adaptation_measures_scores']
 
-        # Simulate impacts from different hazards
-        cyclone_results = self._simulate_cyclone_impacts(year, hazard_factors, infrastructure_state, adaptation_measures_scores)
-        flood_results = self._simulate_flooding_impacts(year, hazard_factors, infrastructure_state, adaptation_measures_scores)
-        temp_results = self._simulate_temperature_effects(year, hazard_factors, infrastructure_state, adaptation_measures_scores)
-        slr_results = self._simulate_sea_level_rise_impacts(year, hazard_factors, infrastructure_state, adaptation_measures_scores)
+        # Unpack the hazard levels and scores once as plain floats
+        idx = year - self._years[0]
+        in_horizon = 0 <= idx < len(self._years)
+        if in_horizon:
+            cyclone_intensity, flood_risk, temp_increase, slr_cm = self._hazard_levels[idx].tolist()
+        else:
+            cyclone_intensity, flood_risk, temp_increase, slr_cm = (float(v) for v in _hazard_indices(year, *(hazard_factors[k] for k in HAZARD_FACTOR_KEYS)))
+        cps, fps, tas, sas = self._adapt_scores.tolist()
+
+        # Simulate impacts from different hazards. Same formulas as the module-level kernels,
+        # written out on scalars so a single year costs no NumPy dispatch or extra call frames.
+        vulnerability_factor = 0.8 - cps * 0.5
+        vulnerability_factor = vulnerability_factor if vulnerability_factor > 0.1 else 0.1
+        cyclone_damage = 50 * cyclone_intensity * vulnerability_factor
+        cyclone_outage = 24 * cyclone_intensity * vulnerability_factor
+        flood_exposure = 1 - fps
+        flood_damage = 30 * flood_risk * (flood_exposure if flood_exposure > 0.1 else 0.1)
+        net_derating = 0.01 * temp_increase * (1 - tas)
+        net_derating = net_derating if net_derating > 0 else 0.0
+        cooling_stress = temp_increase * 0.1
+        assets_at_risk_pct = 0.05 + slr_cm * 0.01
+        slr_risk = (assets_at_risk_pct if assets_at_risk_pct < 1.0 else 1.0) * (1 - sas)
+        slr_risk = slr_risk if slr_risk > 0 else 0.0
+        if in_horizon:
+            self._climate_out[idx] = (cyclone_damage, cyclone_outage, flood_damage, net_derating,
+                                      cooling_stress, slr_cm, slr_risk, self.current_resilience_score)
+        cyclone_results = {'estimated_damage_cost_per_event_m_usd': cyclone_damage,
+                           'estimated_outage_hours_per_event': cyclone_outage}
+        flood_results = {'estimated_annual_damage_cost_m_usd': flood_damage}
+        temp_results = {'avg_derating_factor': net_derating, 'cooling_stress_index': cooling_stress}
+        slr_results = {'sea_level_rise_cm': slr_cm, 'net_risk_factor': slr_risk}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Hazards: Cyclone Damage $%.1fM/event, Flood Damage $%.1fM/year, Net Derating %.2f%%, SLR %.1fcm",
+                         cyclone_damage, flood_damage, net_derating * 100, slr_cm)
 
         # Combine results
         # Estimate total annual damage cost (very simplified)
-        total_damage_cost = cyclone_results['estimated_damage_cost_per_event_m_usd'] * hazard_scenarios.get('cyclone_frequency', 0.5) + \
+        total_damage_cost = cyclone_results['estimated_damage_cost_per_event_m_usd'] * cyclone_frequency + \
                           flood_results['estimated_annual_damage_cost_m_usd'] # Add other costs?
 
         climate_summary = {
@@ -127,7 +284,7 @@ class ClimateResilienceModel:
             'overall_resilience_score': self.current_resilience_score
         }
 
-        print(f"Climate impact simulation complete for {year}. Est. Annual Damage: ${total_damage_cost:.1f}M")
+        logger.info("Climate impact simulation complete for %s. Est. Annual Damage: $%.1fM", year, total_damage_cost)
         # Return structure similar to placeholder in main_simulation for now
         # return {
         #     "estimated_climate_damage_cost": total_damage_cost,
@@ -1,5 +1,31 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sector order of every per-sector array in DemandModel
+DEMAND_SECTORS = ('residential', 'industrial', 'commercial', 'agricultural', 'transport')
+
+def _project_all(base, growth, elast, eff):
+    """
+    Projects demand for all sectors in one expression.
+
+    All arguments are arrays with sectors on the last axis, so a leading axis of
+    regions or scenarios broadcasts through unchanged.
+
+    Returns:
+        np.ndarray: base * (1 + growth * elasticity) * (1 - efficiency).
+    """
+    return base * (1.0 + growth * elast) * (1.0 - eff)
+
 class DemandModel:
     """Model electricity consumption across sectors"""
+    __slots__ = (
+        'config', 'base_demand_twh', 'sector_params', 'elasticity_params',
+        '_labels', '_growth_defaults', '_elast', '_eff_defaults', '_eff_weights', 'current',
+    )
+
     def __init__(self, config):
         """
         Initializes the demand model.
@@ -15,59 +41,42 @@ class DemandModel:
         self.base_demand_twh = config.get('base_demand_twh', {})
         self.sector_params = config.get('sector_params', {})
         self.elasticity_params = config.get('elasticity_params', {})
-        # Store current demand state if needed for year-on-year changes
-        self.current_demand_twh = self.base_demand_twh.copy()
-        print("DemandModel initialized.")
-
-    def _project_residential_demand(self, year, drivers):
-        # Placeholder: Model appliance ownership, cooling demand, urbanization, efficiency.
-        base = self.current_demand_twh.get('residential', 50)
-        growth_factor = 1 + drivers.get('gdp_growth', 0.06) * self.elasticity_params.get('income_elasticity_residential', 0.8)
-        efficiency_factor = (1 - drivers.get('efficiency_improvement_residential', 0.01))
-        demand_twh = base * growth_factor * efficiency_factor
-        print(f"  - Residential Demand: {demand_twh:.2f} TWh")
-        return demand_twh
-
-    def _project_industrial_demand(self, year, drivers):
-        # Placeholder: Model manufacturing GDP, energy intensity, SEZs, efficiency.
-        base = self.current_demand_twh.get('industrial', 60)
-        growth_factor = 1 + drivers.get('industrial_gdp_growth', 0.07) * self.elasticity_params.get('gdp_elasticity_industrial', 1.0)
-        efficiency_factor = (1 - drivers.get('efficiency_improvement_industrial', 0.015))
-        demand_twh = base * growth_factor * efficiency_factor
-        print(f"  - Industrial Demand: {demand_twh:.2f} TWh")
-        return demand_twh
-
-    def _project_commercial_demand(self, year, drivers):
-        # Placeholder: Model service sector growth, floor space, HVAC, efficiency.
-        base = self.current_demand_twh.get('commercial', 30)
-        growth_factor = 1 + drivers.get('service_sector_growth', 0.08) * self.elasticity_params.get('gdp_elasticity_commercial', 0.9)
-        efficiency_factor = (1 - drivers.get('efficiency_improvement_commercial', 0.01))
-        demand_twh = base * growth_factor * efficiency_factor
-        print(f"  - Commercial Demand: {demand_twh:.2f} TWh")
-        return demand_twh
-
-    def _project_agricultural_demand(self, year, drivers):
-        # Placeholder: Model irrigation electrification, groundwater depth, solar pumps.
-        base = self.current_demand_twh.get('agricultural', 10)
-        # Less sensitive to GDP, more to specific programs/water levels
-        growth_factor = 1 + drivers.get('irrigation_expansion_rate', 0.02)
-        efficiency_factor = (1 - drivers.get('solar_pump_adoption_rate', 0.05) * 0.5) # Solar pumps replace grid/diesel
-        demand_twh = base * growth_factor * efficiency_factor
-        print(f"  - Agricultural Demand: {demand_twh:.2f} TWh")
-        return demand_twh
-
-    def _project_transport_electrification_demand(self, year, drivers):
-        # Placeholder: Model EV adoption scenarios, charging infrastructure.
-        base = self.current_demand_twh.get('transport', 1)
-        # Driven by EV adoption rates
-        ev_adoption_rate = drivers.get('ev_adoption_rate', 0.1) # Cumulative adoption % target for the year
-        base_transport_energy = 50 # Hypothetical total transport energy TWh (needs data)
-        electrified_share = ev_adoption_rate * 0.1 # Assume EVs are 10% of transport energy needs
-        demand_twh = base_transport_energy * electrified_share
-        # Simple growth on previous year might be better if tracking EVs directly
-        demand_twh = base * (1 + drivers.get('ev_fleet_growth', 0.30)) # Example 30% growth on previous year EV demand
-        print(f"  - Transport Electrification Demand: {demand_twh:.2f} TWh")
-        return demand_twh
+
+        # All sectors follow demand = base * (1 + growth * elasticity) * (1 - efficiency),
+        # so each sector is one position in a set of vectors aligned with DEMAND_SECTORS:
+        # sector: (label, default base TWh, (growth driver, default), elasticity, (efficiency driver, default, weight))
+        spec = {
+            'residential': ('Residential', 50, ('gdp_growth', 0.06),
+                            self.elasticity_params.get('income_elasticity_residential', 0.8), ('efficiency_improvement_residential', 0.01, 1.0)),
+            'industrial': ('Industrial', 60, ('industrial_gdp_growth', 0.07),
+                           self.elasticity_params.get('gdp_elasticity_industrial', 1.0), ('efficiency_improvement_industrial', 0.015, 1.0)),
+            'commercial': ('Commercial', 30, ('service_sector_growth', 0.08),
+                           self.elasticity_params.get('gdp_elasticity_commercial', 0.9), ('efficiency_improvement_commercial', 0.01, 1.0)),
+            # Less sensitive to GDP, more to specific programs/water levels; solar pumps replace grid/diesel
+            'agricultural': ('Agricultural', 10, ('irrigation_expansion_rate', 0.02),
+                             1.0, ('solar_pump_adoption_rate', 0.05, 0.5)),
+            # Driven by EV fleet growth on the previous year's EV demand
+            'transport': ('Transport Electrification', 1, ('ev_fleet_growth', 0.30),
+                          1.0, (None, 0.0, 0.0)), # No efficiency term
+        }
+        sectors = [spec[sector] for sector in DEMAND_SECTORS]
+        self._labels = tuple(s[0] for s in sectors)
+        self._growth_defaults = tuple(s[2] for s in sectors)
+        self._elast = np.array([s[3] for s in sectors], dtype=np.float64)
+        self._eff_defaults = tuple(s[4][:2] for s in sectors)
+        self._eff_weights = np.array([s[4][2] for s in sectors], dtype=np.float64)
+        # Current sector demand (TWh) carried year to year, aligned with DEMAND_SECTORS
+        self.current = np.array([self.base_demand_twh.get(sector, s[1]) for sector, s in zip(DEMAND_SECTORS, sectors)], dtype=np.float64)
+        logger.info("DemandModel initialized.")
+
+    @property
+    def current_demand_twh(self):
+        """Current demand by sector (TWh) as a dict; see as_dict()."""
+        return self.as_dict()
+
+    def as_dict(self):
+        """Returns the current sector demand (TWh) keyed by sector name."""
+        return dict(zip(DEMAND_SECTORS, self.current.tolist()))
 
     def project_demand(self, year, economic_growth_factors, structural_changes, efficiency_improvements, electrification_rates):
         """
@@ -79,11 +88,13 @@ class DemandModel:
             structural_changes (dict): Changes in economic structure (e.g., industrial share).
             efficiency_improvements (dict): Sectoral energy efficiency improvement rates.
             electrification_rates (dict): Rates of electrification in transport, agriculture etc.
+                                          Transport demand grows on the previous year's by
+                                          'ev_fleet_growth'; an EV adoption share is not used.
 
         Returns:
             dict: Projected electricity demand by sector and total for the year (e.g., in TWh).
         """
-        print(f"Projecting electricity demand for year {year}...")
+        logger.info("Projecting electricity demand for year %s...", year)
 
         # Consolidate drivers from inputs
         drivers = {
@@ -93,28 +104,23 @@ class DemandModel:
             **electrification_rates
         }
 
-        # Project demand for each sector
-        residential_demand = self._project_residential_demand(year, drivers)
-        industrial_demand = self._project_industrial_demand(year, drivers)
-        commercial_demand = self._project_commercial_demand(year, drivers)
-        agricultural_demand = self._project_agricultural_demand(year, drivers)
-        transport_demand = self._project_transport_electrification_demand(year, drivers)
+        # Project demand for all sectors in one vector operation
+        growth = np.array([drivers.get(k, d) for k, d in self._growth_defaults], dtype=np.float64)
+        eff = np.array([drivers.get(k, d) for k, d in self._eff_defaults], dtype=np.float64) * self._eff_weights
+        demand_twh = _project_all(self.current, growth, self._elast, eff)
+        sector_values = demand_twh.tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            for label, value in zip(self._labels, sector_values):
+                logger.debug("  - %s Demand: %.2f TWh", label, value)
 
-        # Aggregate results
-        projected_demand = {
-            'residential': residential_demand,
-            'industrial': industrial_demand,
-            'commercial': commercial_demand,
-            'agricultural': agricultural_demand,
-            'transport': transport_demand,
-            'total_demand': residential_demand + industrial_demand + commercial_demand + agricultural_demand + transport_demand
-        }
+        # Update current state for next year's calculation (sectoral only)
+        self.current = demand_twh
 
-        # Update current state for next year's calculation
-        self.current_demand_twh = projected_demand.copy()
-        del self.current_demand_twh['total_demand'] # Only store sectoral
+        # Aggregate results
+        projected_demand = dict(zip(DEMAND_SECTORS, sector_values))
+        projected_demand['total_demand'] = sum(sector_values)
 
-        print(f"Demand projection complete for {year}. Total Demand: {projected_demand['total_demand']:.2f} TWh")
+        logger.info("Demand projection complete for %s. Total Demand: %.2f TWh", year, projected_demand['total_demand'])
         # Return structure similar to placeholder in main_simulation for now
         # return {
         #     "total_demand": projected_demand['total_demand'],
@@ -126,4 +132,4 @@ class DemandModel:
         # }
         return projected_demand # Return the detailed structure
 
-    # Add methods for peak demand forecasting, regional disaggregation, etc. later 
\ No newline at end of file
+    # Add methods for peak demand forecasting, regional disaggregation, etc. later 
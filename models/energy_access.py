@@ -1,5 +1,15 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
 class EnergyAccessModel:
     """Model energy access expansion and equity dimensions"""
+    __slots__ = (
+        'config', 'access_params', 'offgrid_params', 'affordability_params', 'equity_params',
+        'current_national_access_rate', 'current_urban_access_rate', 'current_rural_access_rate',
+        'current_energy_poverty_index',
+    )
+
     def __init__(self, config):
         """
         Initializes the energy access model.
@@ -23,39 +33,50 @@ class EnergyAccessModel:
         self.current_rural_access_rate = config.get('baseline_access_rates', {}).get('rural', 0.90)
         self.current_energy_poverty_index = 0.2 # Example initial index
 
-        print("EnergyAccessModel initialized.")
+        logger.info("EnergyAccessModel initialized.")
 
     def _simulate_rural_electrification(self, year, grid_extension_plans, service_quality):
         # Placeholder: Model last-mile connections, quality improvements.
         target_rate = self.access_params.get('rural_target_access', 1.0)
+        rural_rate = self.current_rural_access_rate
         connection_rate_increase = 0.015 * (1 + service_quality * 0.2) # Faster if quality improves
-        self.current_rural_access_rate = min(target_rate, self.current_rural_access_rate + connection_rate_increase)
-        print(f"  - Rural Electrification: Access Rate {self.current_rural_access_rate*100:.1f}%")
-        return {'rural_access_rate': self.current_rural_access_rate}
+        rural_rate += connection_rate_increase
+        rural_rate = rural_rate if rural_rate < target_rate else target_rate
+        self.current_rural_access_rate = rural_rate
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Rural Electrification: Access Rate %.1f%%", rural_rate * 100)
+        return {'rural_access_rate': rural_rate}
 
     def _simulate_off_grid_solutions(self, year, market_maturity, grid_arrival_risk):
         # Placeholder: Model SHS saturation, mini-grid viability.
         shs_connections_added = 100000 * (0.9**(year - 2025)) # Example declining additions as market matures
         minigrid_connections_added = 20000 * (1 - grid_arrival_risk)
-        print(f"  - Off-Grid Solutions: SHS Additions {shs_connections_added:.0f}, Mini-grid Additions {minigrid_connections_added:.0f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Off-Grid Solutions: SHS Additions %.0f, Mini-grid Additions %.0f", shs_connections_added, minigrid_connections_added)
         # These would ideally contribute to the overall rural access rate calculation
         return {'shs_connections_added': shs_connections_added, 'minigrid_connections_added': minigrid_connections_added}
 
     def _simulate_energy_affordability(self, year, tariff_levels, subsidy_policies):
         # Placeholder: Model energy burden, effectiveness of lifeline tariffs.
-        avg_tariff_mwh = tariff_levels.get('average_retail_tariff_mwh', 100)
+        avg_tariff_mwh = tariff_levels.average_retail_tariff_mwh
         # Simple index: affordability decreases as tariff increases relative to income (assumed constant here)
-        affordability_score = max(0, 1 - (avg_tariff_mwh / 150)) # Example scaling
+        affordability_score = 1 - (avg_tariff_mwh / 150) # Example scaling
+        affordability_score = affordability_score if affordability_score > 0 else 0.0
         energy_burden = (avg_tariff_mwh / 1000) * 150 / 1000 # Example: (Avg kWh price * 150 kWh/month) / $1000 income
-        self.current_energy_poverty_index = energy_burden * 0.5 # Simplified link
-        print(f"  - Energy Affordability: Score {affordability_score:.2f}, Burden {energy_burden*100:.1f}%, Poverty Index {self.current_energy_poverty_index:.2f}")
-        return {'affordability_score': affordability_score, 'average_energy_burden': energy_burden, 'energy_poverty_index': self.current_energy_poverty_index}
+        energy_poverty_index = energy_burden * 0.5 # Simplified link
+        self.current_energy_poverty_index = energy_poverty_index
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Energy Affordability: Score %.2f, Burden %.1f%%, Poverty Index %.2f",
+                         affordability_score, energy_burden * 100, energy_poverty_index)
+        return {'affordability_score': affordability_score, 'average_energy_burden': energy_burden, 'energy_poverty_index': energy_poverty_index}
 
     def _simulate_gender_dimensions(self, year, gender_programs):
         # Placeholder: Model impact of women entrepreneurship programs, time poverty reduction.
         women_entrepreneurs_supported = gender_programs.get('support_level', 100) * 1.1 # Example growth
-        gender_impact_score = min(1.0, 0.3 + 0.03 * (year - 2025)) # Example score improvement
-        print(f"  - Gender Dimensions: Impact Score {gender_impact_score:.2f}")
+        gender_impact_score = 0.3 + 0.03 * (year - 2025) # Example score improvement
+        gender_impact_score = gender_impact_score if gender_impact_score < 1.0 else 1.0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Gender Dimensions: Impact Score %.2f", gender_impact_score)
         return {'women_entrepreneurs_supported': women_entrepreneurs_supported, 'gender_impact_score': gender_impact_score}
 
     def _simulate_just_transition(self, year, transition_policies, fossil_fuel_phaseout_rate):
@@ -63,7 +84,8 @@ class EnergyAccessModel:
         # Example: Score improves with active policies and depends on phaseout speed
         reskilling_effectiveness = transition_policies.get('reskilling_effectiveness', 0.5)
         just_transition_score = reskilling_effectiveness * (1 - fossil_fuel_phaseout_rate * 0.5)
-        print(f"  - Just Transition: Score {just_transition_score:.2f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Just Transition: Score %.2f", just_transition_score)
         return {'just_transition_score': just_transition_score}
 
     def simulate_access_expansion(self, year, grid_extension_plans, off_grid_developments, affordability_measures, equity_programs, market_outcomes, grid_outcomes, transition_outcomes):
@@ -74,22 +96,23 @@ class EnergyAccessModel:
             year (int): The simulation year.
             grid_extension_plans (dict): Plans for expanding the grid infrastructure.
             off_grid_developments (dict): Status of SHS market, mini-grid projects.
-            affordability_measures (dict): Subsidy levels, tariff structures from MarketModel.
+            affordability_measures (RetailTariffs): Subsidy levels, tariff structures from MarketModel.
             equity_programs (dict): Status of gender and just transition programs.
-            market_outcomes (dict): Output from MarketModel (tariffs).
+            market_outcomes (MarketSummary): Output from MarketModel (tariffs).
             grid_outcomes (dict): Output from GridInfrastructureModel (service quality metrics).
-            transition_outcomes (dict): Output from RenewableTransitionModel (e.g., pace of change).
+            transition_outcomes (TransitionSummary): Output from RenewableTransitionModel (e.g., pace of change).
 
         Returns:
             dict: Summary of energy access and equity status for the year.
         """
-        print(f"Simulating energy access expansion for year {year}...")
+        logger.info("Simulating energy access expansion for year %s...", year)
 
         # Extract drivers from inputs
         service_quality_metric = grid_outcomes.get('overall_saidi', 10) # Lower is better
-        service_quality_score = max(0, 1 - service_quality_metric / 20) # Example conversion to 0-1 score
-        tariff_levels_input = market_outcomes.get('retail_tariffs', {})
-        fossil_phaseout_rate = transition_outcomes.get('fossil_fuel_reduction_rate', 0.02) # Example needed input
+        service_quality_score = 1 - service_quality_metric / 20 # Example conversion to 0-1 score
+        service_quality_score = service_quality_score if service_quality_score > 0 else 0.0
+        tariff_levels_input = market_outcomes.retail_tariffs
+        fossil_phaseout_rate = getattr(transition_outcomes, 'fossil_fuel_reduction_rate', 0.02) # Example needed input, not produced yet
 
         # Simulate components
         rural_results = self._simulate_rural_electrification(year, grid_extension_plans, service_quality_score)
@@ -100,8 +123,13 @@ class EnergyAccessModel:
 
         # Update aggregate access rates (needs logic combining grid/offgrid)
         # Simplified update for national/urban based on rural improvement
-        self.current_national_access_rate = (self.current_rural_access_rate * 0.6 + self.current_urban_access_rate * 0.4) # Assuming 60% rural pop
-        self.current_urban_access_rate = min(1.0, self.current_urban_access_rate + 0.005) # Assume slow urban infill
+        rural_rate = self.current_rural_access_rate
+        urban_rate = self.current_urban_access_rate
+        national_rate = (rural_rate * 0.6 + urban_rate * 0.4) # Assuming 60% rural pop
+        urban_rate += 0.005 # Assume slow urban infill
+        urban_rate = urban_rate if urban_rate < 1.0 else 1.0
+        self.current_national_access_rate = national_rate
+        self.current_urban_access_rate = urban_rate
 
         # Combine results
         access_summary = {
@@ -111,13 +139,13 @@ class EnergyAccessModel:
             'gender_dimensions': gender_results,
             'just_transition': jt_results,
             'aggregate_access_rates': {
-                'national': self.current_national_access_rate,
-                'urban': self.current_urban_access_rate,
-                'rural': self.current_rural_access_rate # Already updated in sub-method
+                'national': national_rate,
+                'urban': urban_rate,
+                'rural': rural_rate # Already updated in sub-method
             }
         }
 
-        print(f"Energy access simulation complete for {year}.")
+        logger.info("Energy access simulation complete for %s.", year)
         # Return structure similar to placeholder in main_simulation for now
         # return {
         #     "national_access_rate": self.current_national_access_rate,
@@ -1,3 +1,104 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Fixed-layout results of simulate_financial_flows. Field names match the keys of the
+# former result dicts, so flattened result columns are unchanged.
+@dataclass(frozen=True, slots=True)
+class InvestmentNeeds:
+    total_investment_needs_m_usd: float
+
+@dataclass(frozen=True, slots=True)
+class PublicInvestment:
+    total_public_investment_m_usd: float
+
+@dataclass(frozen=True, slots=True)
+class PrivateInvestment:
+    total_private_investment_m_usd: float
+
+@dataclass(frozen=True, slots=True)
+class DevelopmentFinance:
+    total_development_finance_m_usd: float
+
+@dataclass(frozen=True, slots=True)
+class CommercialFinance:
+    total_commercial_finance_m_usd: float
+
+@dataclass(frozen=True, slots=True)
+class HouseholdInvestment:
+    total_household_investment_m_usd: float
+
+@dataclass(frozen=True, slots=True)
+class MobilizedBySource:
+    public: PublicInvestment
+    private: PrivateInvestment
+    development_finance: DevelopmentFinance
+    commercial: CommercialFinance
+    household: HouseholdInvestment
+
+@dataclass(frozen=True, slots=True)
+class FinanceSummary:
+    """Investment needs, mobilized funds by source and financing gap for one year."""
+    investment_needs: InvestmentNeeds
+    mobilized_by_source: MobilizedBySource
+    total_investment_mobilized_m_usd: float
+    financing_gap_m_usd: float
+    cumulative_investment_m_usd: float
+
+# Names of the values returned by _finance_kernel, in order
+FINANCE_KERNEL_OUTPUTS = (
+    'generation_investment_m_usd', 'total_investment_needs_m_usd',
+    'adp_allocation_m_usd', 'public_m_usd',
+    'potential_private_m_usd', 'private_m_usd',
+    'climate_finance_mobilized_m_usd', 'development_finance_m_usd',
+    'commercial_m_usd',
+    'household_solar_m_usd', 'household_m_usd',
+    'total_investment_mobilized_m_usd',
+)
+
+def _finance_kernel(capacity_expansion_mw, cost_per_mw_new, grid_investment_m_usd, adp_budget_m_usd, adp_share_energy,
+                    risk_factor, psp_environment_score, climate_finance_access_score, local_market_depth_score,
+                    rooftop_solar_mw_added, household_ee_investment_m_usd):
+    """
+    Investment needs and mobilized funds by source for one year.
+
+    Pure arithmetic on its arguments, so scalars give one year and broadcastable arrays
+    give many years (and scenarios) at once. The financing gap and the running total are
+    left to the caller, which holds the model state.
+
+    Returns:
+        tuple: Values ordered as FINANCE_KERNEL_OUTPUTS.
+    """
+    # Investment needs. Placeholder: Estimate from generation expansion and grid upgrades.
+    generation_investment = capacity_expansion_mw * cost_per_mw_new # M USD
+    total_needs = generation_investment + grid_investment_m_usd
+    # Public. Placeholder: Model ADP allocations, SOE balance sheets, public debt constraints.
+    adp_allocation = adp_budget_m_usd * adp_share_energy
+    soe_investment = 500 # Example M USD from SOE resources
+    public_investment = adp_allocation + soe_investment
+    # Private. Placeholder: IPP investment proportional to needs, adjusted by risk/climate score.
+    potential_private = total_needs * 0.6 # Assume private sector could cover 60%
+    private_investment = potential_private * risk_factor * psp_environment_score
+    # Development finance. Placeholder: Model MDB/bilateral flows, climate finance mobilization.
+    mdb_bilateral_base = 500 # Example M USD base lending
+    climate_finance_mobilized = total_needs * 0.1 * climate_finance_access_score # Example: 10% of needs via climate finance
+    dev_finance = mdb_bilateral_base + climate_finance_mobilized
+    # Commercial. Placeholder: Model domestic bank lending, capital market instruments; limited role initially.
+    commercial_lending = total_needs * 0.02 * local_market_depth_score # Example
+    # Household. Placeholder: Investment in rooftop solar and energy efficiency based on adoption rates.
+    household_solar_investment = rooftop_solar_mw_added * 1.0 # Example $1M / MW installed cost
+    total_household = household_solar_investment + household_ee_investment_m_usd
+    total_mobilized = public_investment + private_investment + dev_finance + commercial_lending + total_household
+    return (generation_investment, total_needs, adp_allocation, public_investment, potential_private, private_investment,
+            climate_finance_mobilized, dev_finance, commercial_lending, household_solar_investment, total_household,
+            total_mobilized)
+
+# Funding sources along the last axis of simulate_financial_flows_batch's 'sources' tensor
+FINANCE_SOURCES = ('public', 'private', 'development_finance', 'commercial', 'household')
+
 class EnergyFinanceModel:
     """Model energy sector investment and financing"""
     def __init__(self, config):
@@ -20,61 +121,33 @@ class EnergyFinanceModel:
         self.dev_finance_params = config.get('dev_finance_params', {'climate_finance_access_score': 0.6})
         self.commercial_finance_params = config.get('commercial_finance_params', {})
         self.household_finance_params = config.get('household_finance_params', {})
+        # Scalar parameters read every year, bound once
+        self._cost_per_mw_new = self.investment_needs_params.get('cost_per_mw_new', 1.5)
+        self._adp_share_energy = self.public_finance_params.get('adp_share_energy', 0.1)
+        self._risk_factor = max(0.1, 1 - self.private_finance_params.get('investor_risk_perception', 0.7)) # Lower risk -> higher factor
         # Store current finance state if needed
         self.cumulative_investment = 0
+        # Capacity additions (MW) by year, indexed from the project pipeline and rebuilt whenever
+        # its (year, capacity) entries change
+        self._pipeline_entries = None
+        self._capacity_by_year = {}
 
-        print("EnergyFinanceModel initialized.")
+        logger.info("EnergyFinanceModel initialized.")
 
-    def _estimate_investment_needs(self, year, capacity_expansion_mw, grid_investment_needs):
-        # Placeholder: Estimate total investment needed based on generation expansion and grid upgrades.
-        generation_investment = capacity_expansion_mw * self.investment_needs_params.get('cost_per_mw_new', 1.5) # M USD
-        grid_investment = grid_investment_needs.get('annual_investment_m_usd', 1000) # M USD
-        total_needs = generation_investment + grid_investment
-        print(f"  - Investment Needs: Generation ${generation_investment:.0f}M, Grid ${grid_investment:.0f}M, Total ${total_needs:.0f}M")
-        return {'total_investment_needs_m_usd': total_needs}
-
-    def _simulate_public_investment(self, year, total_needs, fiscal_space):
-        # Placeholder: Model ADP allocations, SOE balance sheets, public debt constraints.
-        adp_allocation = fiscal_space.get('total_adp_budget', 10000) * self.public_finance_params.get('adp_share_energy', 0.1)
-        soe_investment = 500 # Example M USD from SOE resources
-        public_investment = adp_allocation + soe_investment
-        print(f"  - Public Investment: ADP ${adp_allocation:.0f}M, SOE ${soe_investment:.0f}M, Total ${public_investment:.0f}M")
-        return {'total_public_investment_m_usd': public_investment}
-
-    def _simulate_private_investment(self, year, total_needs, investment_climate):
-        # Placeholder: Model IPP investments based on framework, risk perception, returns.
-        # Example: Private investment proportional to needs, adjusted by risk/climate score
-        risk_factor = max(0.1, 1 - self.private_finance_params.get('investor_risk_perception', 0.7)) # Lower risk -> higher factor
-        climate_score = investment_climate.get('psp_environment_score', 0.5) # From GovernanceModel
-        potential_private = total_needs * 0.6 # Assume private sector could cover 60%
-        private_investment = potential_private * risk_factor * climate_score
-        print(f"  - Private Investment: Potential ${potential_private:.0f}M, Actual ${private_investment:.0f}M (Risk: {risk_factor:.2f}, Climate: {climate_score:.2f})")
-        return {'total_private_investment_m_usd': private_investment}
-
-    def _simulate_development_finance(self, year, total_needs, climate_finance_access):
-        # Placeholder: Model MDB/bilateral flows, climate finance mobilization.
-        mdb_bilateral_base = 500 # Example M USD base lending
-        climate_finance_mobilized = total_needs * 0.1 * climate_finance_access # Example: 10% of needs via climate finance, scaled by access score
-        dev_finance = mdb_bilateral_base + climate_finance_mobilized
-        print(f"  - Development Finance: Base ${mdb_bilateral_base:.0f}M, Climate ${climate_finance_mobilized:.0f}M, Total ${dev_finance:.0f}M")
-        return {'total_development_finance_m_usd': dev_finance}
-
-    def _simulate_commercial_financing(self, year, total_needs, local_market_depth):
-        # Placeholder: Model domestic bank lending, capital market instruments.
-        # Assume limited role initially
-        commercial_lending = total_needs * 0.02 * local_market_depth.get('score', 0.3) # Example
-        print(f"  - Commercial Financing: Total ${commercial_lending:.0f}M")
-        return {'total_commercial_finance_m_usd': commercial_lending}
-
-    def _simulate_household_investment(self, year, rooftop_solar_adoption, ee_uptake):
-        # Placeholder: Model investment in rooftop solar, energy efficiency based on adoption rates.
-        # Needs cost assumptions for rooftop solar ($/kW) and EE measures
-        rooftop_mw_added = rooftop_solar_adoption.get('increase_mw', 100)
-        household_solar_investment = rooftop_mw_added * 1.0 # Example $1M / MW installed cost
-        household_ee_investment = ee_uptake.get('investment_m_usd', 50) # Example
-        total_household = household_solar_investment + household_ee_investment
-        print(f"  - Household Investment: Solar ${household_solar_investment:.0f}M, EE ${household_ee_investment:.0f}M, Total ${total_household:.0f}M")
-        return {'total_household_investment_m_usd': total_household}
+    def _capacity_expansion_mw(self, project_pipeline, year):
+        """
+        Capacity added in ``year`` by the pipeline. The per-year totals are rebuilt only when the
+        pipeline's (year, capacity) entries differ from the last call's, so a list that is edited
+        or appended to in place is picked up as well.
+        """
+        entries = tuple((item['year'], item['capacity']) for item in project_pipeline)
+        if entries != self._pipeline_entries:
+            capacity_by_year = {}
+            for item_year, capacity in entries:
+                capacity_by_year[item_year] = capacity_by_year.get(item_year, 0) + capacity
+            self._pipeline_entries = entries
+            self._capacity_by_year = capacity_by_year
+        return self._capacity_by_year.get(year, 0)
 
     def simulate_financial_flows(self, year, project_pipeline, financing_sources, risk_mitigation_tools, grid_investment_needs, fiscal_space, investment_climate, climate_finance_access, local_market_depth, household_adoption):
         """
@@ -93,56 +166,114 @@ class EnergyFinanceModel:
             household_adoption (dict): Results of household decisions on solar/EE (from specific agent model? or Access?).
 
         Returns:
-            dict: Summary of investment needs, mobilized funds by source, and financing gap.
+            FinanceSummary: Investment needs, mobilized funds by source, and financing gap.
         """
-        print(f"Simulating financial flows for year {year}...")
-
-        # 1. Estimate Investment Needs
-        # Needs total capacity expansion from GenerationPortfolioModel or RenewableTransitionModel
-        # Assuming it's passed via project_pipeline or calculated separately
-        capacity_expansion_mw = sum(item['capacity'] for item in project_pipeline if item['year'] == year) # Example extraction
-        needs_results = self._estimate_investment_needs(year, capacity_expansion_mw, grid_investment_needs)
-        total_needs = needs_results['total_investment_needs_m_usd']
-
-        # 2. Simulate Investment Mobilization by Source
-        public_inv = self._simulate_public_investment(year, total_needs, fiscal_space)
-        private_inv = self._simulate_private_investment(year, total_needs, investment_climate)
-        dev_fin = self._simulate_development_finance(year, total_needs, climate_finance_access.get('climate_finance_access_score', 0.6))
-        comm_fin = self._simulate_commercial_financing(year, total_needs, local_market_depth)
-        # Household investment might be separate or feed into needs calculation earlier
-        hh_inv = self._simulate_household_investment(year, household_adoption.get('rooftop_solar', {}), household_adoption.get('energy_efficiency', {}))
-
-        # 3. Calculate Total Mobilized and Gap
-        total_mobilized = public_inv['total_public_investment_m_usd'] + \
-                          private_inv['total_private_investment_m_usd'] + \
-                          dev_fin['total_development_finance_m_usd'] + \
-                          comm_fin['total_commercial_finance_m_usd'] + \
-                          hh_inv['total_household_investment_m_usd']
+        logger.info("Simulating financial flows for year %s...", year)
+
+        # Unpack the drivers once and evaluate needs and every funding source together
+        capacity_expansion_mw = self._capacity_expansion_mw(project_pipeline, year)
+        grid_investment = grid_investment_needs.get('annual_investment_m_usd', 1000) # M USD
+        climate_score = investment_climate.get('psp_environment_score', 0.5) # From GovernanceModel
+        rooftop_solar_adoption = household_adoption.get('rooftop_solar', {})
+        energy_efficiency = household_adoption.get('energy_efficiency', {})
+        (generation_investment, total_needs, adp_allocation, public_investment, potential_private, private_investment,
+         climate_finance_mobilized, dev_finance, commercial_lending, household_solar_investment, total_household,
+         total_mobilized) = _finance_kernel(
+            capacity_expansion_mw,
+            self._cost_per_mw_new,
+            grid_investment,
+            fiscal_space.get('total_adp_budget', 10000),
+            self._adp_share_energy,
+            self._risk_factor,
+            climate_score,
+            climate_finance_access.get('climate_finance_access_score', 0.6),
+            local_market_depth.get('score', 0.3),
+            rooftop_solar_adoption.get('increase_mw', 100),
+            energy_efficiency.get('investment_m_usd', 50),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Investment Needs: Generation $%.0fM, Grid $%.0fM, Total $%.0fM", generation_investment, grid_investment, total_needs)
+            logger.debug("  - Public Investment: ADP $%.0fM, SOE $%.0fM, Total $%.0fM", adp_allocation, public_investment - adp_allocation, public_investment)
+            logger.debug("  - Private Investment: Potential $%.0fM, Actual $%.0fM (Risk: %.2f, Climate: %.2f)", potential_private, private_investment, self._risk_factor, climate_score)
+            logger.debug("  - Development Finance: Base $%.0fM, Climate $%.0fM, Total $%.0fM", dev_finance - climate_finance_mobilized, climate_finance_mobilized, dev_finance)
+            logger.debug("  - Commercial Financing: Total $%.0fM", commercial_lending)
+            logger.debug("  - Household Investment: Solar $%.0fM, EE $%.0fM, Total $%.0fM", household_solar_investment, total_household - household_solar_investment, total_household)
+
         financing_gap = max(0, total_needs - total_mobilized)
         self.cumulative_investment += total_mobilized
 
         # Combine results
-        finance_summary = {
-            'investment_needs': needs_results,
-            'mobilized_by_source': {
-                'public': public_inv,
-                'private': private_inv,
-                'development_finance': dev_fin,
-                'commercial': comm_fin,
-                'household': hh_inv
-            },
-            'total_investment_mobilized_m_usd': total_mobilized,
-            'financing_gap_m_usd': financing_gap,
-            'cumulative_investment_m_usd': self.cumulative_investment
-        }
+        finance_summary = FinanceSummary(
+            investment_needs=InvestmentNeeds(total_needs),
+            mobilized_by_source=MobilizedBySource(
+                public=PublicInvestment(public_investment),
+                private=PrivateInvestment(private_investment),
+                development_finance=DevelopmentFinance(dev_finance),
+                commercial=CommercialFinance(commercial_lending),
+                household=HouseholdInvestment(total_household),
+            ),
+            total_investment_mobilized_m_usd=total_mobilized,
+            financing_gap_m_usd=financing_gap,
+            cumulative_investment_m_usd=self.cumulative_investment,
+        )
 
-        print(f"Financial flow simulation complete for {year}. Total Mobilized: ${total_mobilized:.0f}M, Gap: ${financing_gap:.0f}M")
+        logger.info("Financial flow simulation complete for %s. Total Mobilized: $%.0fM, Gap: $%.0fM", year, total_mobilized, financing_gap)
         # Return structure similar to placeholder in main_simulation for now
         # return {
         #     "total_investment_mobilized": total_mobilized,
         #     "financing_gap": financing_gap,
-        #     "fdi_inflow": private_inv['total_private_investment_m_usd'] # Assuming private = FDI for placeholder
+        #     "fdi_inflow": private_investment # Assuming private = FDI for placeholder
         # }
         return finance_summary # Return detailed summary
 
+    def simulate_financial_flows_batch(self, capacity_expansion_mw, grid_investment_m_usd, adp_budget_m_usd,
+                                       psp_environment_score, climate_finance_access_score=0.6, local_market_depth_score=0.3,
+                                       rooftop_solar_mw_added=100, household_ee_investment_m_usd=50):
+        """
+        Evaluates simulate_financial_flows' formulas over whole arrays of years (and scenarios).
+
+        Every driver may be a scalar or an array; arrays broadcast against each other, with
+        years on axis 0 (e.g. shape (n_years,) or (n_years, n_scenarios)). Model state
+        (cumulative_investment) is not read or updated.
+
+        Args:
+            capacity_expansion_mw: New generation capacity per year (MW).
+            grid_investment_m_usd: Grid investment needs per year (M USD).
+            adp_budget_m_usd: Total ADP budget per year (M USD).
+            psp_environment_score: Private sector participation environment score (0-1).
+            climate_finance_access_score: Access to climate finance (0-1).
+            local_market_depth_score: Local commercial finance capacity (0-1).
+            rooftop_solar_mw_added: Rooftop solar added per year (MW).
+            household_ee_investment_m_usd: Household energy-efficiency investment per year (M USD).
+
+        Returns:
+            dict: Arrays keyed 'total_investment_needs_m_usd', 'sources' (the drivers' broadcast shape
+                  plus a trailing axis ordered as FINANCE_SOURCES), one view of it per source name,
+                  'total_investment_mobilized_m_usd', 'financing_gap_m_usd' and
+                  'cumulative_investment_m_usd' (cumulative along axis 0).
+        """
+        (_, total_needs, _, public, _, private, _, development, commercial, _, household, total_mobilized) = _finance_kernel(
+            np.asarray(capacity_expansion_mw, dtype=np.float64),
+            self._cost_per_mw_new,
+            grid_investment_m_usd,
+            np.asarray(adp_budget_m_usd, dtype=np.float64),
+            self._adp_share_energy,
+            self._risk_factor,
+            psp_environment_score,
+            climate_finance_access_score,
+            local_market_depth_score,
+            np.asarray(rooftop_solar_mw_added, dtype=np.float64),
+            household_ee_investment_m_usd,
+        )
+        # (years, ..., sources) tensor; the per-source results below are views into it
+        sources = np.stack(np.broadcast_arrays(public, private, development, commercial, household), axis=-1)
+        return {
+            'total_investment_needs_m_usd': total_needs,
+            'sources': sources,
+            **{name: sources[..., k] for k, name in enumerate(FINANCE_SOURCES)},
+            'total_investment_mobilized_m_usd': total_mobilized,
+            'financing_gap_m_usd': np.maximum(0, total_needs - total_mobilized),
+            'cumulative_investment_m_usd': np.cumsum(total_mobilized, axis=0),
+        }
+
     # Add methods for specific financing instrument modeling (green bonds, blended finance) later 
\ No newline at end of file
@@ -1,6 +1,45 @@
+import logging
+from collections import ChainMap
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Column order of the per-technology factor matrices
+EMISSION_COLUMNS = ('co2eq_t_per_mwh', 'sox_t_per_mwh', 'nox_t_per_mwh', 'pm25_t_per_mwh')
+WATER_COLUMNS = ('withdrawal_m3_per_mwh', 'consumption_m3_per_mwh')
+# Config table -> its columns, in the column order of EnvironmentalImpactModel.factor_table
+FACTOR_GROUPS = (
+    ('emission_factors', EMISSION_COLUMNS),
+    ('water_factors', WATER_COLUMNS),
+    ('land_use_factors', ('sqkm_per_mw',)),
+    ('waste_factors', ('coal_ash_t_per_mwh',)),
+)
+FACTOR_COLUMNS = tuple(col for _, columns in FACTOR_GROUPS for col in columns)
+
+def _flat_factors(config):
+    """Flattens the config's {tech: {factor: value}} tables into one {(tech, factor column): value} dict."""
+    flat = {}
+    for group, columns in FACTOR_GROUPS:
+        for tech, tech_factors in config.get(group, {}).items():
+            for col in columns:
+                if col in tech_factors:
+                    flat[(tech, col)] = tech_factors[col]
+    return flat
+
+def _factor_matrix(flat_factors, tech_index):
+    """Lays {(tech, column): value} out as a (technologies x FACTOR_COLUMNS) array, missing entries as 0."""
+    column_index = {col: j for j, col in enumerate(FACTOR_COLUMNS)}
+    matrix = np.zeros((len(tech_index), len(FACTOR_COLUMNS)))
+    for (tech, col), value in flat_factors.items():
+        if tech in tech_index:
+            matrix[tech_index[tech], column_index[col]] = value
+    return matrix
+
 class EnvironmentalImpactModel:
     """Model environmental dimensions of energy system"""
-    def __init__(self, config):
+    def __init__(self, config, tech_index=None):
         """
         Initializes the environmental impact model.
 
@@ -11,6 +50,9 @@ class EnvironmentalImpactModel:
                            - land_use_factors: Land area per technology (e.g., sqkm/MW).
                            - waste_factors: Waste generation per technology (e.g., tonnes_ash/MWh).
                            - mitigation_params: Costs/effectiveness of mitigation measures (e.g., FGD, CCS).
+            tech_index (dict, optional): Technology -> position in per-technology arrays, normally
+                                         GenerationPortfolioModel.tech_index. Defaults to the sorted
+                                         technologies named in the factor tables.
         """
         self.config = config
         self.emission_factors = config.get('emission_factors', {})
@@ -18,61 +60,72 @@ class EnvironmentalImpactModel:
         self.land_use_factors = config.get('land_use_factors', {})
         self.waste_factors = config.get('waste_factors', {})
         self.mitigation_params = config.get('mitigation_params', {})
-        print("EnvironmentalImpactModel initialized.")
+        if tech_index is None:
+            techs = sorted(set(self.emission_factors) | set(self.water_factors) | set(self.land_use_factors) | set(self.waste_factors))
+            tech_index = {tech: i for i, tech in enumerate(techs)}
+        self.tech_index = tech_index
+        self._techs = sorted(tech_index, key=tech_index.get) # Technology at each array position
+        # All factors in one (technologies x FACTOR_COLUMNS) table, read-only. Each impact
+        # category is a single matrix-vector product against a column block of it.
+        self._flat_factors = _flat_factors(config) # One (tech, column) key per factor, single lookup
+        factors = _factor_matrix(self._flat_factors, tech_index)
+        factors.flags.writeable = False # Mitigation works on a copy; a stray in-place edit raises
+        self._factors_np = factors
+        self.factor_table = pd.DataFrame(factors, index=pd.Index(self._techs, name='tech'), columns=FACTOR_COLUMNS)
+        n_emission, n_water = len(EMISSION_COLUMNS), len(WATER_COLUMNS)
+        self._emission_matrix = factors[:, :n_emission]
+        self._water_matrix = factors[:, n_emission:n_emission + n_water]
+        self._land_use_vector = factors[:, FACTOR_COLUMNS.index('sqkm_per_mw')]
+        self._coal_ash_vector = factors[:, FACTOR_COLUMNS.index('coal_ash_t_per_mwh')]
+        # Mitigation parameters read every year, bound once
+        self._coal_index = tech_index.get('coal')
+        self._ccs_retained_share = 1 - self.mitigation_params.get('ccs_capture_rate', 0.9)
+        # Emission factors with the last seen mitigation state applied, rebuilt only when it changes
+        self._mitigation_state = False # No CCS: the base factors apply
+        self._effective_emission_matrix = self._emission_matrix
+        self.effective_factors = ChainMap({}, self._flat_factors) # Mitigation overrides layered over the base factors
+        logger.info("EnvironmentalImpactModel initialized.")
 
-    def _calculate_ghg_emissions(self, generation_mix_gwh, emission_factors):
+    def _to_vector(self, values_by_tech):
+        """Maps a {tech: value} dict onto tech_index; technologies outside the index carry no factors."""
+        return np.fromiter((values_by_tech.get(tech, 0.0) for tech in self._techs), dtype=np.float64, count=len(self._techs))
+
+    def _calculate_ghg_emissions(self, pollutant_totals):
         # Placeholder: Calculate CO2eq emissions based on generation and factors.
-        total_co2eq_tonnes = 0
-        for tech, gwh in generation_mix_gwh.items():
-             # Example factor: tonnes CO2eq / MWh
-             factor = emission_factors.get(tech, {}).get('co2eq_t_per_mwh', 0)
-             total_co2eq_tonnes += gwh * 1000 * factor # Convert GWh to MWh
-        print(f"  - GHG Emissions: {total_co2eq_tonnes / 1e6:.2f} Million tonnes CO2eq")
+        total_co2eq_tonnes = float(pollutant_totals[0])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - GHG Emissions: %.2f Million tonnes CO2eq", total_co2eq_tonnes / 1e6)
         return {'total_co2eq_tonnes': total_co2eq_tonnes}
 
-    def _calculate_air_quality_impacts(self, generation_mix_gwh, emission_factors):
+    def _calculate_air_quality_impacts(self, pollutant_totals):
         # Placeholder: Calculate SOx, NOx, PM2.5 emissions.
-        total_sox_tonnes = 0
-        total_nox_tonnes = 0
-        total_pm25_tonnes = 0
-        for tech, gwh in generation_mix_gwh.items():
-             tech_factors = emission_factors.get(tech, {})
-             total_sox_tonnes += gwh * 1000 * tech_factors.get('sox_t_per_mwh', 0)
-             total_nox_tonnes += gwh * 1000 * tech_factors.get('nox_t_per_mwh', 0)
-             total_pm25_tonnes += gwh * 1000 * tech_factors.get('pm25_t_per_mwh', 0)
-        print(f"  - Air Quality: SOx {total_sox_tonnes:.0f} t, NOx {total_nox_tonnes:.0f} t, PM2.5 {total_pm25_tonnes:.0f} t")
+        total_sox_tonnes, total_nox_tonnes, total_pm25_tonnes = pollutant_totals[1:].tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Air Quality: SOx %.0f t, NOx %.0f t, PM2.5 %.0f t", total_sox_tonnes, total_nox_tonnes, total_pm25_tonnes)
         return {'sox_tonnes': total_sox_tonnes, 'nox_tonnes': total_nox_tonnes, 'pm25_tonnes': total_pm25_tonnes}
 
-    def _calculate_water_energy_nexus(self, generation_mix_gwh, capacity_details_mw, water_factors):
+    def _calculate_water_energy_nexus(self, generation_mwh):
         # Placeholder: Calculate water withdrawal and consumption.
-        total_withdrawal_m3 = 0
-        total_consumption_m3 = 0
-        for tech, gwh in generation_mix_gwh.items():
-             tech_factors = water_factors.get(tech, {})
-             # Factors might be per MWh generated or per MW capacity installed (especially for hydro)
-             total_withdrawal_m3 += gwh * 1000 * tech_factors.get('withdrawal_m3_per_mwh', 0)
-             total_consumption_m3 += gwh * 1000 * tech_factors.get('consumption_m3_per_mwh', 0)
-        print(f"  - Water Nexus: Withdrawal {total_withdrawal_m3 / 1e6:.1f} Mm3, Consumption {total_consumption_m3 / 1e6:.1f} Mm3")
+        # Factors might be per MWh generated or per MW capacity installed (especially for hydro)
+        total_withdrawal_m3, total_consumption_m3 = (generation_mwh @ self._water_matrix).tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Water Nexus: Withdrawal %.1f Mm3, Consumption %.1f Mm3", total_withdrawal_m3 / 1e6, total_consumption_m3 / 1e6)
         return {'water_withdrawal_million_m3': total_withdrawal_m3 / 1e6, 'water_consumption_million_m3': total_consumption_m3 / 1e6}
 
-    def _calculate_land_use_impacts(self, capacity_details_mw, land_use_factors):
+    def _calculate_land_use_impacts(self, capacity_mw):
         # Placeholder: Calculate total land area occupied by generation facilities.
-        total_land_use_sqkm = 0
-        for tech, mw in capacity_details_mw.items():
-             factor = land_use_factors.get(tech, {}).get('sqkm_per_mw', 0)
-             total_land_use_sqkm += mw * factor
-        print(f"  - Land Use: Total {total_land_use_sqkm:.1f} sqkm")
+        total_land_use_sqkm = float(capacity_mw @ self._land_use_vector)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Land Use: Total %.1f sqkm", total_land_use_sqkm)
         return {'total_land_use_sqkm': total_land_use_sqkm}
 
-    def _calculate_waste_management(self, generation_mix_gwh, waste_factors):
+    def _calculate_waste_management(self, generation_mwh):
         # Placeholder: Calculate coal ash, nuclear waste, end-of-life panels/batteries.
-        coal_ash_tonnes = 0
+        coal_ash_tonnes = float(generation_mwh @ self._coal_ash_vector)
         nuclear_waste_tonnes = 0 # Placeholder for spent fuel etc.
-        for tech, gwh in generation_mix_gwh.items():
-             tech_factors = waste_factors.get(tech, {})
-             coal_ash_tonnes += gwh * 1000 * tech_factors.get('coal_ash_t_per_mwh', 0)
-             # Add other waste streams (solar panels, batteries based on retirement/replacement)
-        print(f"  - Waste Management: Coal Ash {coal_ash_tonnes:.0f} t")
+        # Add other waste streams (solar panels, batteries based on retirement/replacement)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Waste Management: Coal Ash %.0f t", coal_ash_tonnes)
         return {'coal_ash_tonnes': coal_ash_tonnes, 'nuclear_waste_tonnes': nuclear_waste_tonnes}
 
     def calculate_impacts(self, year, generation_dispatch_results, technology_parameters, mitigation_measures):
@@ -82,32 +135,55 @@ class EnvironmentalImpactModel:
         Args:
             year (int): The simulation year.
             generation_dispatch_results (dict): Output from GenerationPortfolioModel.simulate_dispatch,
-                                                containing 'generation_mix_gwh' and 'capacity_details'.
+                                                containing 'generation_mix_gwh' and 'capacity_details', and
+                                                optionally 'generation_mwh_arr' / 'capacity_mw_arr' aligned
+                                                with tech_index.
             technology_parameters (dict): Parameters of the current generation fleet.
             mitigation_measures (dict): Status of deployed mitigation tech (e.g., CCS readiness).
 
         Returns:
             dict: Summary of environmental impacts for the year.
         """
-        print(f"Calculating environmental impacts for year {year}...")
+        logger.info("Calculating environmental impacts for year %s...", year)
 
-        generation_mix_gwh = generation_dispatch_results.get('generation_mix_gwh', {})
-        capacity_details_mw = generation_dispatch_results.get('capacity_details', {})
+        # Generation (MWh) and capacity (MW) per technology, aligned with tech_index and built once
+        # for all impact categories. Dispatch supplies both directly; otherwise they are built from
+        # the generation mix and capacity dicts.
+        generation_mwh = generation_dispatch_results.get('generation_mwh_arr')
+        if generation_mwh is None:
+            generation_mwh = self._to_vector(generation_dispatch_results.get('generation_mix_gwh', {})) * 1000
+        capacity_mw = generation_dispatch_results.get('capacity_mw_arr')
+        if capacity_mw is None:
+            capacity_mw = self._to_vector(generation_dispatch_results.get('capacity_details', {}))
 
         # Apply mitigation effects to factors (simplified example)
         # In reality, this would adjust factors based on installed mitigation tech (FGD, SCR, CCS etc.)
-        mitigated_emission_factors = self.emission_factors.copy() # Start with base factors
-        # Example: If CCS is active on coal, reduce its CO2 factor
-        if mitigation_measures.get('ccs_on_coal', False):
-             if 'coal' in mitigated_emission_factors:
-                 mitigated_emission_factors['coal']['co2eq_t_per_mwh'] *= (1 - self.mitigation_params.get('ccs_capture_rate', 0.9))
+        ccs_active = bool(mitigation_measures.get('ccs_on_coal', False)) and self._coal_index is not None
+        if ccs_active != self._mitigation_state:
+            # Example: If CCS is active on coal, reduce its CO2 factor
+            overrides = {}
+            if ccs_active and ('coal', 'co2eq_t_per_mwh') in self._flat_factors:
+                overrides[('coal', 'co2eq_t_per_mwh')] = self._flat_factors[('coal', 'co2eq_t_per_mwh')] * self._ccs_retained_share
+            emission_matrix = self._emission_matrix # Start with base factors (read-only)
+            if overrides: # Copy only when something is actually overridden
+                emission_matrix = emission_matrix.copy()
+                for (tech, col), value in overrides.items():
+                    emission_matrix[self.tech_index[tech], EMISSION_COLUMNS.index(col)] = value
+                emission_matrix.flags.writeable = False
+            self._mitigation_state = ccs_active
+            self._effective_emission_matrix = emission_matrix
+            self.effective_factors = ChainMap(overrides, self._flat_factors)
+        emission_matrix = self._effective_emission_matrix
+
+        # All pollutant totals (tonnes) in one product, ordered as EMISSION_COLUMNS
+        pollutant_totals = generation_mwh @ emission_matrix
 
         # Calculate impacts for each category
-        ghg_results = self._calculate_ghg_emissions(generation_mix_gwh, mitigated_emission_factors)
-        air_quality_results = self._calculate_air_quality_impacts(generation_mix_gwh, mitigated_emission_factors)
-        water_results = self._calculate_water_energy_nexus(generation_mix_gwh, capacity_details_mw, self.water_factors)
-        land_use_results = self._calculate_land_use_impacts(capacity_details_mw, self.land_use_factors)
-        waste_results = self._calculate_waste_management(generation_mix_gwh, self.waste_factors)
+        ghg_results = self._calculate_ghg_emissions(pollutant_totals)
+        air_quality_results = self._calculate_air_quality_impacts(pollutant_totals)
+        water_results = self._calculate_water_energy_nexus(generation_mwh)
+        land_use_results = self._calculate_land_use_impacts(capacity_mw)
+        waste_results = self._calculate_waste_management(generation_mwh)
 
         # Combine results
         environmental_summary = {
@@ -118,7 +194,7 @@ class EnvironmentalImpactModel:
             'waste_management': waste_results
         }
 
-        print(f"Environmental impact calculation complete for {year}.")
+        logger.info("Environmental impact calculation complete for %s.", year)
         # Return structure similar to placeholder in main_simulation for now
         # return {
         #     "total_co2_emissions": ghg_results['total_co2eq_tonnes'] / 1e6, # Million tonnes CO2eq
@@ -128,4 +204,40 @@ class EnvironmentalImpactModel:
         # }
         return environmental_summary # Return detailed summary
 
+    def calculate_impacts_batch(self, generation_mwh, capacity_mw, factors=None, ccs_on_coal=False):
+        """
+        Evaluates calculate_impacts' totals for many scenarios (e.g. Monte Carlo draws) at once.
+
+        Args:
+            generation_mwh (array-like): Generation (MWh) per technology, shape (..., n_techs), aligned with tech_index.
+            capacity_mw (array-like): Capacity (MW) per technology, same shape as generation_mwh.
+            factors (array-like, optional): Sampled factor tables, shape (..., n_techs, len(FACTOR_COLUMNS)),
+                                            broadcasting against the scenario axes. Defaults to factor_table.
+            ccs_on_coal (bool): Apply the CCS capture rate to the coal CO2eq factor.
+
+        Returns:
+            dict: Arrays over the scenario axes, keyed as the numeric leaves of calculate_impacts'
+                  categories ('total_co2eq_tonnes', 'sox_tonnes', ..., 'coal_ash_tonnes').
+        """
+        generation_mwh = np.asarray(generation_mwh, dtype=np.float64)
+        capacity_mw = np.asarray(capacity_mw, dtype=np.float64)
+        factors = self._factors_np if factors is None else np.asarray(factors, dtype=np.float64)
+        if ccs_on_coal and self._coal_index is not None:
+            factors = factors.copy()
+            factors[..., self._coal_index, 0] *= self._ccs_retained_share
+        # One (1 x techs) @ (techs x columns) product per scenario; stacked matmul broadcasts the scenario axes
+        per_generation = np.matmul(generation_mwh[..., None, :], factors)[..., 0, :]
+        per_capacity = np.matmul(capacity_mw[..., None, :], factors)[..., 0, :]
+        column = FACTOR_COLUMNS.index
+        return {
+            'total_co2eq_tonnes': per_generation[..., column('co2eq_t_per_mwh')],
+            'sox_tonnes': per_generation[..., column('sox_t_per_mwh')],
+            'nox_tonnes': per_generation[..., column('nox_t_per_mwh')],
+            'pm25_tonnes': per_generation[..., column('pm25_t_per_mwh')],
+            'water_withdrawal_million_m3': per_generation[..., column('withdrawal_m3_per_mwh')] / 1e6,
+            'water_consumption_million_m3': per_generation[..., column('consumption_m3_per_mwh')] / 1e6,
+            'total_land_use_sqkm': per_capacity[..., column('sqkm_per_mw')],
+            'coal_ash_tonnes': per_generation[..., column('coal_ash_t_per_mwh')],
+        }
+
     # Add methods for lifecycle assessment, biodiversity impacts later 
\ No newline at end of file
@@ -1,3 +1,74 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Names of the values returned by _fuel_kernel, in order
+FUEL_KERNEL_OUTPUTS = (
+    'gas_production_mcf', 'gas_price_usd_mmbtu',
+    'lng_avg_price_usd_mmbtu', 'lng_availability',
+    'coal_delivered_price_usd_tonne', 'coal_reliability',
+    'hfo_price_usd_bbl', 'diesel_price_usd_bbl', 'liquid_availability',
+    'avg_solar_cf', 'avg_wind_cf',
+)
+
+# Fields of the sampled market/climate factors accepted by simulate_fuel_conditions_mc,
+# with the value used when a field is absent (the same defaults as simulate_fuel_conditions)
+FUEL_SAMPLE_DTYPE = np.dtype([
+    ('gas_factor', 'f8'), ('lng_factor', 'f8'), ('coal_factor', 'f8'), ('oil_factor', 'f8'),
+    ('solar_factor', 'f8'), ('wind_factor', 'f8'),
+])
+FUEL_SAMPLE_DEFAULTS = {
+    'gas_factor': 1.0, 'lng_factor': 1.2, 'coal_factor': 1.0, 'oil_factor': 1.0,
+    'solar_factor': 1.0, 'wind_factor': 1.0,
+}
+
+# Domestic gas production decline. Placeholder: Model exploration success, field depletion, etc.
+GAS_BASE_YEAR = 2025
+GAS_BASE_PRODUCTION_MCF = 500.0
+GAS_ANNUAL_DECLINE = 0.98
+
+def _gas_production_mcf(year):
+    """Domestic gas production for a year (or array of years) on the exponential decline."""
+    return GAS_BASE_PRODUCTION_MCF * np.power(GAS_ANNUAL_DECLINE, np.subtract(year, GAS_BASE_YEAR))
+
+def _fuel_kernel(production_mcf, gas_price_factor, lng_spot_factor, coal_price_factor, oil_price_factor,
+                 solar_irradiance_factor, wind_speed_factor):
+    """
+    Fuel prices, availability and renewable resource levels for one year.
+
+    Pure arithmetic on its arguments, so scalars give one year and broadcastable arrays
+    (e.g. sampled market factors) give many paths at once. Domestic gas production is an
+    input rather than derived from the year, see _gas_production_mcf.
+
+    Returns:
+        tuple: Values ordered as FUEL_KERNEL_OUTPUTS.
+    """
+    # Domestic gas. Production is looked up by the caller from the decline table and passed through.
+    gas_price_usd_mmbtu = 4.0 + gas_price_factor
+    # LNG imports. Placeholder: Model terminal capacity, contract vs spot, price volatility.
+    spot_share = 0.3
+    contract_price = 8.0
+    spot_price = 10.0 * lng_spot_factor
+    lng_price_usd_mmbtu = (1 - spot_share) * contract_price + spot_share * spot_price
+    lng_availability = 0.95 # Reliability factor
+    # Coal supply. Placeholder: Model import dependency, source diversification, logistics.
+    global_coal_price = 100 * coal_price_factor
+    logistics_cost = 20
+    delivered_price_usd_tonne = global_coal_price + logistics_cost
+    coal_reliability = 0.98
+    # Liquid fuels. Placeholder: Model import terminals, refining, distribution.
+    hfo_price_usd_bbl = 70 * oil_price_factor
+    diesel_price_usd_bbl = hfo_price_usd_bbl + 10
+    liquid_availability = 0.99
+    # Renewable resources. Placeholder: Model resource variability (solar, wind), land use.
+    avg_solar_cf = 0.18 * solar_irradiance_factor
+    avg_wind_cf = 0.25 * wind_speed_factor
+    return (production_mcf, gas_price_usd_mmbtu, lng_price_usd_mmbtu, lng_availability,
+            delivered_price_usd_tonne, coal_reliability, hfo_price_usd_bbl, diesel_price_usd_bbl,
+            liquid_availability, avg_solar_cf, avg_wind_cf)
+
 class FuelSupplyModel:
     """Model fuel availability, pricing, and security"""
     def __init__(self, config):
@@ -19,50 +90,19 @@ class FuelSupplyModel:
         self.coal_params = config.get('coal_params', {})
         self.liquid_fuel_params = config.get('liquid_fuel_params', {})
         self.renewable_resource_params = config.get('renewable_resource_params', {})
-        print("FuelSupplyModel initialized.")
-
-    def _simulate_domestic_gas(self, year, market_conditions):
-        # Placeholder: Model declining production, exploration success, etc.
-        production_mcf = 500 * (0.98**(year - 2025)) # Example exponential decline
-        price_usd_mmbtu = 4.0 + market_conditions.get('global_gas_price_factor', 1.0)
-        print(f"  - Domestic Gas: Production {production_mcf:.0f} BCF (example), Price ${price_usd_mmbtu:.2f}/MMBtu")
-        return {'production_mcf': production_mcf, 'price_usd_mmbtu': price_usd_mmbtu}
-
-    def _simulate_lng_imports(self, year, market_conditions):
-        # Placeholder: Model terminal capacity, contract vs spot, price volatility.
-        terminal_capacity_mtpa = self.lng_params.get('terminal_capacity', 10) # Million Tonnes Per Annum
-        spot_share = 0.3
-        contract_price = 8.0
-        spot_price = 10.0 * market_conditions.get('global_lng_spot_factor', 1.2)
-        avg_price_usd_mmbtu = (1 - spot_share) * contract_price + spot_share * spot_price
-        availability_factor = 0.95 # Reliability factor
-        print(f"  - LNG Imports: Avg Price ${avg_price_usd_mmbtu:.2f}/MMBtu, Availability {availability_factor:.2f}")
-        return {'avg_price_usd_mmbtu': avg_price_usd_mmbtu, 'availability': availability_factor, 'capacity_mtpa': terminal_capacity_mtpa}
-
-    def _simulate_coal_supply(self, year, market_conditions):
-        # Placeholder: Model import dependency, source diversification, logistics.
-        import_dependency = 0.95
-        global_coal_price = 100 * market_conditions.get('global_coal_price_factor', 1.0)
-        logistics_cost = 20
-        delivered_price_usd_tonne = global_coal_price + logistics_cost
-        supply_reliability = 0.98
-        print(f"  - Coal Supply: Delivered Price ${delivered_price_usd_tonne:.2f}/tonne, Reliability {supply_reliability:.2f}")
-        return {'delivered_price_usd_tonne': delivered_price_usd_tonne, 'reliability': supply_reliability}
-
-    def _simulate_liquid_fuel_logistics(self, year, market_conditions):
-        # Placeholder: Model import terminals, refining, distribution.
-        hfo_price_usd_bbl = 70 * market_conditions.get('global_oil_price_factor', 1.0)
-        diesel_price_usd_bbl = hfo_price_usd_bbl + 10
-        availability_factor = 0.99
-        print(f"  - Liquid Fuels: HFO Price ${hfo_price_usd_bbl:.2f}/bbl, Availability {availability_factor:.2f}")
-        return {'hfo_price_usd_bbl': hfo_price_usd_bbl, 'diesel_price_usd_bbl': diesel_price_usd_bbl, 'availability': availability_factor}
-
-    def _assess_renewable_resources(self, year, climate_conditions):
-        # Placeholder: Model resource variability (solar, wind), land use.
-        avg_solar_cf = 0.18 * climate_conditions.get('solar_irradiance_factor', 1.0)
-        avg_wind_cf = 0.25 * climate_conditions.get('wind_speed_factor', 1.0)
-        print(f"  - Renewables: Avg Solar CF {avg_solar_cf:.2f}, Avg Wind CF {avg_wind_cf:.2f}")
-        return {'avg_solar_capacity_factor': avg_solar_cf, 'avg_wind_capacity_factor': avg_wind_cf}
+        # Gas decline over the configured horizon, looked up by year offset instead of a pow per call
+        self._gas_year0 = int(config.get('start_year', GAS_BASE_YEAR))
+        self._gas_decline = _gas_production_mcf(np.arange(self._gas_year0, int(config.get('end_year', 2100)) + 1))
+        self._gas_decline.flags.writeable = False
+        self._lng_terminal_capacity_mtpa = self.lng_params.get('terminal_capacity', 10) # Million Tonnes Per Annum
+        logger.info("FuelSupplyModel initialized.")
+
+    def _gas_production(self, year):
+        """Domestic gas production for ``year`` from the decline table, or the formula outside it."""
+        offset = year - self._gas_year0
+        if 0 <= offset < len(self._gas_decline):
+            return float(self._gas_decline[offset])
+        return float(_gas_production_mcf(year))
 
     def simulate_fuel_conditions(self, year, global_markets, domestic_production_status, infrastructure_constraints, climate_conditions):
         """
@@ -78,14 +118,34 @@ class FuelSupplyModel:
         Returns:
             dict: A dictionary summarizing fuel conditions (prices, availability) for the year.
         """
-        print(f"Simulating fuel conditions for year {year}...")
+        logger.info("Simulating fuel conditions for year %s...", year)
 
-        # Simulate each fuel source
-        domestic_gas = self._simulate_domestic_gas(year, global_markets)
-        lng_imports = self._simulate_lng_imports(year, global_markets)
-        coal_supply = self._simulate_coal_supply(year, global_markets)
-        liquid_fuels = self._simulate_liquid_fuel_logistics(year, global_markets)
-        renewable_resources = self._assess_renewable_resources(year, climate_conditions)
+        production_mcf = self._gas_production(year)
+
+        # Unpack the market and climate drivers once and evaluate all fuel sources together
+        (production_mcf, gas_price, lng_price, lng_availability, coal_price, coal_reliability,
+         hfo_price, diesel_price, liquid_availability, avg_solar_cf, avg_wind_cf) = _fuel_kernel(
+            production_mcf,
+            global_markets.get('global_gas_price_factor', 1.0),
+            global_markets.get('global_lng_spot_factor', 1.2),
+            global_markets.get('global_coal_price_factor', 1.0),
+            global_markets.get('global_oil_price_factor', 1.0),
+            climate_conditions.get('solar_irradiance_factor', 1.0),
+            climate_conditions.get('wind_speed_factor', 1.0),
+        )
+        terminal_capacity_mtpa = self._lng_terminal_capacity_mtpa
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Domestic Gas: Production %.0f BCF (example), Price $%.2f/MMBtu", production_mcf, gas_price)
+            logger.debug("  - LNG Imports: Avg Price $%.2f/MMBtu, Availability %.2f", lng_price, lng_availability)
+            logger.debug("  - Coal Supply: Delivered Price $%.2f/tonne, Reliability %.2f", coal_price, coal_reliability)
+            logger.debug("  - Liquid Fuels: HFO Price $%.2f/bbl, Availability %.2f", hfo_price, liquid_availability)
+            logger.debug("  - Renewables: Avg Solar CF %.2f, Avg Wind CF %.2f", avg_solar_cf, avg_wind_cf)
+
+        domestic_gas = {'production_mcf': production_mcf, 'price_usd_mmbtu': gas_price}
+        lng_imports = {'avg_price_usd_mmbtu': lng_price, 'availability': lng_availability, 'capacity_mtpa': terminal_capacity_mtpa}
+        coal_supply = {'delivered_price_usd_tonne': coal_price, 'reliability': coal_reliability}
+        liquid_fuels = {'hfo_price_usd_bbl': hfo_price, 'diesel_price_usd_bbl': diesel_price, 'availability': liquid_availability}
+        renewable_resources = {'avg_solar_capacity_factor': avg_solar_cf, 'avg_wind_capacity_factor': avg_wind_cf}
 
         # Combine results into a single dictionary
         fuel_summary = {
@@ -97,7 +157,26 @@ class FuelSupplyModel:
             # Add aggregated metrics if needed (e.g., overall gas price considering domestic/LNG mix)
         }
 
-        print(f"Fuel condition simulation complete for {year}.")
+        logger.info("Fuel condition simulation complete for %s.", year)
         return fuel_summary
 
+    def simulate_fuel_conditions_mc(self, year, factor_samples):
+        """
+        Evaluates the year's fuel conditions for many sampled market/climate paths at once.
+
+        Args:
+            year (int): The simulation year.
+            factor_samples (np.ndarray): Structured array with (a subset of) the fields of
+                                         FUEL_SAMPLE_DTYPE, one element per path. Absent fields
+                                         take FUEL_SAMPLE_DEFAULTS.
+
+        Returns:
+            dict: FUEL_KERNEL_OUTPUTS name -> array shaped like factor_samples.
+        """
+        names = factor_samples.dtype.names or ()
+        factors = [factor_samples[name] if name in names else FUEL_SAMPLE_DEFAULTS[name] for name in FUEL_SAMPLE_DTYPE.names]
+        production_mcf = self._gas_production(year)
+        outputs = _fuel_kernel(production_mcf, *factors)
+        return {name: np.broadcast_to(value, factor_samples.shape) for name, value in zip(FUEL_KERNEL_OUTPUTS, outputs)}
+
     # Add more detailed methods for specific fuel source modeling aspects later 
\ No newline at end of file
@@ -1,4 +1,58 @@
-import pandas as pd # Assuming parameters might be in DataFrames
+import logging
+from types import MappingProxyType
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def _dispatch_kernel(capacity_mw, total_capacity_mw, target_generation_gwh):
+    """
+    Allocates generation across technologies already arranged in merit order.
+
+    Each technology receives its capacity share of the target, capped so the running
+    total never exceeds the target; technologies after the target is met are not
+    dispatched.
+
+    Args:
+        capacity_mw (np.ndarray): Capacity per technology, in merit order.
+        total_capacity_mw (float): Total installed capacity (denominator of the shares).
+        target_generation_gwh (float): Generation to be met.
+
+    Returns:
+        tuple: (generation_gwh array aligned with capacity_mw, number of technologies
+               dispatched, total generation in GWh)
+    """
+    potential = capacity_mw / total_capacity_mw * target_generation_gwh
+    generation = np.empty_like(potential)
+    cumulative = np.cumsum(potential)
+    # Generation already dispatched before each technology
+    before = np.concatenate(([0.0], cumulative[:-1]))
+    np.minimum(potential, target_generation_gwh - before, out=generation)
+    # A technology is dispatched only while the target has not yet been met
+    n_dispatched = int(np.searchsorted(before >= target_generation_gwh, True))
+    generated = float(np.cumsum(generation[:n_dispatched])[-1]) if n_dispatched else 0
+    return generation, n_dispatched, generated
+
+def _hourly_dispatch_kernel(capacity_mw, demand_mw):
+    """
+    Loads technologies in merit order against an hourly demand profile, all hours at once.
+
+    Each hour, every technology runs at whatever part of its capacity is still needed after
+    the technologies ahead of it in merit order; unit commitment (ramp rates, minimum load)
+    is not modelled.
+
+    Args:
+        capacity_mw (np.ndarray): Available capacity per technology, in merit order.
+        demand_mw (np.ndarray): Demand per hour.
+
+    Returns:
+        tuple: (generation_mw array of shape (hours, technologies), unserved_mw array per hour)
+    """
+    loaded_before = np.concatenate(([0.0], np.cumsum(capacity_mw)[:-1]))
+    residual = demand_mw[:, None] - loaded_before # Demand left for each technology, per hour
+    generation = np.clip(residual, 0.0, capacity_mw)
+    unserved = np.maximum(demand_mw - capacity_mw.sum(), 0.0)
+    return generation, unserved
 
 class GenerationPortfolioModel:
     """Model power generation mix and capacity evolution"""
@@ -22,29 +76,73 @@ class GenerationPortfolioModel:
             operational_constraints (dict): System-wide or technology-specific constraints.
                                             Example: {'min_gas_take': ..., 'max_coal_utilization': ...}
         """
-        self.current_capacity = base_year_capacity.copy() # Active capacity in the current simulation year
+        self.current_capacity = dict(base_year_capacity) # Active capacity in the current simulation year
+        self.total_capacity_mw = sum(self.current_capacity.values()) # Running total, maintained by update_capacity
+        self._capacity_dirty = True # Set whenever current_capacity changes; see capacity_snapshot()
+        self._capacity_snapshot = None
         self.technology_parameters = technology_parameters
-        # Convert pipeline/retirement schedules for easier lookup (e.g., DataFrame or dict keyed by year)
-        self.expansion_pipeline_df = pd.DataFrame(expansion_pipeline)
-        self.retirement_schedule_df = pd.DataFrame(retirement_schedule)
+        # Pipeline/retirement schedules combined by year once: year -> {tech: [added MW, retired MW]}
+        self._capacity_changes_by_year = self._changes_by_year(expansion_pipeline, retirement_schedule)
         self.dispatch_merit_order = dispatch_merit_order
         self.operational_constraints = operational_constraints
-        self.detailed_fleet = self._initialize_detailed_fleet(base_year_capacity, technology_parameters)
-
-        print(f"GenerationPortfolioModel initialized with base capacity: {self.current_capacity}")
-
-    def _initialize_detailed_fleet(self, base_capacity, tech_params):
-        # Placeholder: In a real model, this would represent individual plants/units
-        # with their specific parameters (age, efficiency, location etc.)
-        # For now, aggregate by technology type.
-        fleet = {}
-        for tech, capacity in base_capacity.items():
-             fleet[tech] = {
-                 'total_capacity': capacity,
-                 'parameters': tech_params.get(tech, {})
-                 # Add more details like number of units, average age etc. later
-             }
-        return fleet
+        # Fixed technology ordering shared by all per-technology arrays (dispatch, emissions)
+        self.tech_order = sorted(set(technology_parameters) | set(base_year_capacity) | set(dispatch_merit_order)
+                                 | {item['tech'] for item in expansion_pipeline})
+        self.tech_index = {tech: i for i, tech in enumerate(self.tech_order)}
+        # Per-technology parameters as arrays aligned with tech_order (missing values as 0)
+        self.efficiency = self._parameter_array('efficiency')
+        self.vom_cost = self._parameter_array('vom_cost')
+        self.heat_rate = self._parameter_array('heat_rate_btu_kwh')
+        self.ramp_rate = self._parameter_array('ramp_rate_mw_min')
+        self.min_load = self._parameter_array('min_load')
+        self.co2_factor = self._parameter_array('co2_factor_t_mwh')
+        # Capacity (MW) aligned with tech_order, kept in sync with current_capacity by update_capacity
+        self.capacity_arr = np.zeros(len(self.tech_order))
+        # Which technologies currently have an entry in current_capacity (dispatch skips the rest)
+        self._in_service = np.zeros(len(self.tech_order), dtype=bool)
+        for tech, capacity in self.current_capacity.items():
+            self.capacity_arr[self.tech_index[tech]] = capacity
+            self._in_service[self.tech_index[tech]] = True
+        # Merit order as positions into the per-technology arrays; fixed for the run
+        self.merit_perm = np.array([self.tech_index[tech] for tech in dispatch_merit_order], dtype=np.intp)
+        self._tech_names = np.array(self.tech_order, dtype=object) # For mapping positions back to names in bulk
+        self._refresh_merit_order()
+
+        logger.info("GenerationPortfolioModel initialized with base capacity: %s", self.current_capacity)
+
+    @staticmethod
+    def _changes_by_year(expansion_pipeline, retirement_schedule):
+        """Sums schedule records into {year: {tech: [added, retired]}}, techs in order of first appearance."""
+        by_year = {}
+        for column, schedule in enumerate((expansion_pipeline, retirement_schedule)):
+            for item in schedule:
+                change = by_year.setdefault(item['year'], {}).setdefault(item['tech'], [0, 0])
+                change[column] += item['capacity']
+        return by_year
+
+    def _parameter_array(self, name):
+        """Collects one technology parameter into an array aligned with tech_order."""
+        return np.array([self.technology_parameters.get(tech, {}).get(name, 0) for tech in self.tech_order], dtype=np.float64)
+
+    @property
+    def detailed_fleet(self):
+        """
+        Per-technology fleet view built from the fleet arrays: {tech: {'total_capacity', 'parameters'}}.
+
+        The fleet itself is held as arrays aligned with tech_order (capacity_arr, efficiency,
+        ramp_rate, min_load, ...); plant-level detail (age, units) would be added as further
+        arrays of the same layout.
+        """
+        return {
+            tech: {'total_capacity': capacity, 'parameters': self.technology_parameters.get(tech, {})}
+            for tech, capacity in zip(self._tech_names[self._in_service].tolist(), self.capacity_arr[self._in_service].tolist())
+        }
+
+    def _refresh_merit_order(self):
+        """Caches the in-service merit order (positions into tech_order) and its capacities for dispatch."""
+        self._merit_idx = self.merit_perm[self._in_service[self.merit_perm]]
+        self._merit_capacity = self.capacity_arr[self._merit_idx]
+        self._merit_capacity.flags.writeable = False
 
     def update_capacity(self, year):
         """
@@ -53,44 +151,46 @@ class GenerationPortfolioModel:
         Args:
             year (int): The simulation year for which to update capacity.
         """
-        print(f"Updating capacity for year {year}...")
-
-        # Add new capacity from expansion pipeline
-        expansions_this_year = self.expansion_pipeline_df[self.expansion_pipeline_df['year'] == year]
-        for _, project in expansions_this_year.iterrows():
-            tech = project['tech']
-            capacity_addition = project['capacity']
-            self.current_capacity[tech] = self.current_capacity.get(tech, 0) + capacity_addition
-            # Update detailed fleet (simplified)
-            if tech in self.detailed_fleet:
-                 self.detailed_fleet[tech]['total_capacity'] += capacity_addition
-            else:
-                 self.detailed_fleet[tech] = {
-                     'total_capacity': capacity_addition,
-                     'parameters': self.technology_parameters.get(tech, {})
-                 }
-            print(f"  + Added {capacity_addition} MW of {tech} capacity.")
-
-        # Remove retired capacity
-        retirements_this_year = self.retirement_schedule_df[self.retirement_schedule_df['year'] == year]
-        for _, retirement in retirements_this_year.iterrows():
-            tech = retirement['tech']
-            capacity_reduction = retirement['capacity']
-            if tech in self.current_capacity:
-                self.current_capacity[tech] -= capacity_reduction
-                if self.current_capacity[tech] <= 0:
-                    del self.current_capacity[tech] # Remove tech if capacity is zero or less
-                # Update detailed fleet (simplified)
-                if tech in self.detailed_fleet:
-                     self.detailed_fleet[tech]['total_capacity'] -= capacity_reduction
-                     if self.detailed_fleet[tech]['total_capacity'] <= 0:
-                         del self.detailed_fleet[tech]
-
-                print(f"  - Retired {capacity_reduction} MW of {tech} capacity.")
+        logger.info("Updating capacity for year %s...", year)
+
+        # Apply the year's additions and retirements in one pass, as a net change per technology
+        changes = self._capacity_changes_by_year.get(year, {})
+        for tech, (capacity_addition, capacity_reduction) in changes.items():
+            previous = self.current_capacity.get(tech)
+            if previous is None and not capacity_addition:
+                logger.warning("Attempted to retire %s MW of %s in %s, but no capacity found.", capacity_reduction, tech, year)
+                continue
+            position = self.tech_index[tech]
+            remaining = (previous or 0) + capacity_addition - capacity_reduction
+            if remaining <= 0 and capacity_reduction:
+                self.total_capacity_mw -= previous or 0
+                self.current_capacity.pop(tech, None) # Remove tech if capacity is zero or less
+                self.capacity_arr[position] = 0
+                self._in_service[position] = False
             else:
-                print(f"  ! Warning: Attempted to retire {capacity_reduction} MW of {tech}, but no capacity found.")
+                self.current_capacity[tech] = remaining
+                self.total_capacity_mw += capacity_addition - capacity_reduction
+                self.capacity_arr[position] = remaining
+                self._in_service[position] = True
+            self._capacity_dirty = True
+        if changes and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Capacity changes for %s (MW added, retired): %s", year, changes)
 
-        print(f"Updated capacity for {year}: {self.current_capacity}")
+        if self._capacity_dirty:
+            self._refresh_merit_order()
+        logger.info("Updated capacity for %s: %s", year, self.current_capacity)
+
+    def capacity_snapshot(self):
+        """
+        Returns a read-only snapshot of the current capacity by technology.
+
+        The same snapshot object is handed out until update_capacity changes the
+        fleet, so years without additions or retirements share one mapping.
+        """
+        if self._capacity_dirty:
+            self._capacity_snapshot = MappingProxyType(dict(self.current_capacity))
+            self._capacity_dirty = False
+        return self._capacity_snapshot
 
     def simulate_dispatch(self, year, demand_profile, fuel_conditions, grid_constraints):
         """
@@ -106,7 +206,7 @@ class GenerationPortfolioModel:
         Returns:
             dict: Dispatch results, including generation mix, costs, unserved energy, etc.
         """
-        print(f"Simulating dispatch for year {year}...")
+        logger.info("Simulating dispatch for year %s...", year)
         # Placeholder: This requires a sophisticated dispatch model (e.g., unit commitment/economic dispatch)
         # Inputs: self.current_capacity, self.dispatch_merit_order, self.technology_parameters,
         #         self.operational_constraints, demand_profile, fuel_conditions, grid_constraints.
@@ -117,10 +217,12 @@ class GenerationPortfolioModel:
         total_demand = demand_profile.get('total_demand', 100) # Get total demand from profile (e.g., TWh)
         target_generation = total_demand * 1.1 # Assume 10% reserve margin needed
 
-        total_available_capacity = sum(self.current_capacity.values())
+        total_available_capacity = self.total_capacity_mw
         if total_available_capacity == 0:
              return {
                 'generation_mix_gwh': {}, # GWh by tech
+                'generation_mwh_arr': np.zeros(len(self.tech_order)), # MWh aligned with tech_order
+                'capacity_mw_arr': self.capacity_arr.copy(), # MW aligned with tech_order
                 'total_generation_gwh': 0,
                 'variable_cost': 0,
                 'unserved_energy_gwh': target_generation, # Assuming TWh demand needs conversion
@@ -129,35 +231,49 @@ class GenerationPortfolioModel:
 
 
         # Extremely simplified generation allocation based on capacity share
-        generation_mix_gwh = {}
-        generated_gwh = 0
         # Convert TWh demand to GWh for this example
         target_generation_gwh = target_generation * 1000
-
-        for tech in self.dispatch_merit_order:
-            if tech in self.current_capacity:
-                 # Simplified: Assign generation proportional to capacity share up to the target
-                 # In reality, needs simulation over time (e.g. 8760 hours) with capacity factors, ramp rates etc.
-                 potential_gen = (self.current_capacity[tech] / total_available_capacity) * target_generation_gwh
-                 actual_gen = min(potential_gen, target_generation_gwh - generated_gwh) # Don't exceed target
-                 generation_mix_gwh[tech] = actual_gen
-                 generated_gwh += actual_gen
-                 if generated_gwh >= target_generation_gwh:
-                     break
+        # In reality, needs simulation over time (e.g. 8760 hours) with capacity factors, ramp rates etc.
+        merit_idx = self._merit_idx
+        generation_gwh, n_dispatched, generated_gwh = _dispatch_kernel(self._merit_capacity, total_available_capacity, target_generation_gwh)
+        dispatched_idx = merit_idx[:n_dispatched]
+        generation_mix_gwh = dict(zip(self._tech_names[dispatched_idx].tolist(), generation_gwh[:n_dispatched].tolist()))
+        generation_mwh_arr = np.zeros(len(self.tech_order))
+        generation_mwh_arr[dispatched_idx] = generation_gwh[:n_dispatched] * 1000
 
         unserved_energy_gwh = max(0, target_generation_gwh - generated_gwh)
 
         dispatch_results = {
             'generation_mix_gwh': generation_mix_gwh, # GWh by tech
+            'generation_mwh_arr': generation_mwh_arr, # MWh aligned with tech_order, for vectorised consumers
             'total_generation_gwh': generated_gwh,
             'variable_cost': generated_gwh * 50, # Example cost ($/MWh) -> total $
             'unserved_energy_gwh': unserved_energy_gwh,
              'curtailment_gwh': 0, # Placeholder
-             'capacity_details': self.current_capacity.copy() # Snapshot of capacity for this year
+             'capacity_details': self.capacity_snapshot(), # Read-only snapshot for this year; shared until the fleet changes
+             'capacity_mw_arr': self.capacity_arr.copy() # Same snapshot as MW aligned with tech_order
         }
-        print(f"Dispatch simulation complete for {year}. Total Generation: {generated_gwh:.2f} GWh")
+        logger.info("Dispatch simulation complete for %s. Total Generation: %.2f GWh", year, generated_gwh)
         return dispatch_results
 
+    def simulate_hourly_dispatch(self, demand_mw):
+        """
+        Merit-order dispatch of the in-service fleet against an hourly demand profile.
+
+        Args:
+            demand_mw (array-like): Demand (MW) for each hour, e.g. 8760 values.
+
+        Returns:
+            dict: 'generation_mwh_arr' (energy per technology over the profile, aligned with
+                  tech_order) and 'unserved_energy_mwh'.
+        """
+        demand_mw = np.asarray(demand_mw, dtype=np.float64)
+        merit_idx = self._merit_idx
+        generation_mw, unserved_mw = _hourly_dispatch_kernel(self._merit_capacity, demand_mw)
+        generation_mwh_arr = np.zeros(len(self.tech_order))
+        generation_mwh_arr[merit_idx] = generation_mw.sum(axis=0) # One-hour steps: MW per hour -> MWh
+        return {'generation_mwh_arr': generation_mwh_arr, 'unserved_energy_mwh': float(unserved_mw.sum())}
+
     # Add methods for specific fleet modeling details (aging curves, maintenance) later if needed.
 
     # Add methods for specific fleet modeling (Natural Gas, Coal, etc.) later 
\ No newline at end of file
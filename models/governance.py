@@ -1,5 +1,41 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Unbundling score for each level of sector unbundling
+UNBUNDLING_LEVEL_SCORES = {'partial': 0.5, 'functional': 0.7, 'structural': 0.9}
+# Reform agenda switches along the last axis of simulate_governance_impacts_batch's reform_flags
+GOVERNANCE_REFORM_FLAGS = ('unbundling_push', 'adopt_irp', 'improve_ppp_rules')
+# Scores along the last axis of simulate_governance_impacts_batch's output
+GOVERNANCE_SCORE_KEYS = ('unbundling_score', 'regulatory_effectiveness_score', 'planning_adherence_score', 'psp_environment_score')
+
+@dataclass(frozen=True, slots=True)
+class GovernanceConfig:
+    """Scalar governance settings, resolved from the config dict once at initialisation."""
+    unbundling_level: str = 'partial'
+    regulatory_capacity: float = 0.5
+    irp_adopted: bool = False
+    ppp_clarity: float = 0.6
+
+    @classmethod
+    def from_config(cls, config):
+        """Reads the settings from a GovernanceModel config dict, applying its defaults."""
+        return cls(
+            unbundling_level=config.get('unbundling_status', {'level': 'partial'}).get('level', 'partial'),
+            regulatory_capacity=config.get('regulatory_params', {'capacity_score': 0.5}).get('capacity_score', 0.5),
+            irp_adopted=config.get('planning_params', {'irp_adopted': False}).get('irp_adopted', False),
+            ppp_clarity=config.get('ppp_framework', {'clarity_score': 0.6}).get('clarity_score', 0.6),
+        )
+
 class GovernanceModel:
     """Model institutional arrangements and governance quality"""
+    __slots__ = ('config', '_cfg', 'unbundling_status', 'regulatory_params', 'planning_params', 'ppp_framework',
+                 'current_regulatory_effectiveness', 'current_planning_adherence',
+                 '_unbundling_base', '_irp_adopted', '_ppp_clarity')
+
     def __init__(self, config):
         """
         Initializes the governance model.
@@ -17,56 +53,17 @@ class GovernanceModel:
         self.regulatory_params = config.get('regulatory_params', {'capacity_score': 0.5})
         self.planning_params = config.get('planning_params', {'irp_adopted': False})
         self.ppp_framework = config.get('ppp_framework', {'clarity_score': 0.6})
+        self._cfg = cfg = GovernanceConfig.from_config(config)
         # Store current governance state/scores
-        self.current_regulatory_effectiveness = self.regulatory_params.get('capacity_score', 0.5)
-        self.current_planning_adherence = 0.5 if not self.planning_params.get('irp_adopted') else 0.7
+        self.current_regulatory_effectiveness = cfg.regulatory_capacity
+        self.current_planning_adherence = 0.5 if not cfg.irp_adopted else 0.7
+        # IRP adoption and framework clarity evolve as model state rather than being
+        # written back into the config
+        self._unbundling_base = UNBUNDLING_LEVEL_SCORES.get(cfg.unbundling_level, 0.5)
+        self._irp_adopted = cfg.irp_adopted
+        self._ppp_clarity = cfg.ppp_clarity
 
-        print("GovernanceModel initialized.")
-
-    def _simulate_sector_unbundling(self, year, reform_agenda):
-        # Placeholder: Model progress on unbundling based on reform agenda.
-        # Example: Score improves if reform is active
-        current_level = self.unbundling_status.get('level', 'partial')
-        unbundling_score = {'partial': 0.5, 'functional': 0.7, 'structural': 0.9}.get(current_level, 0.5)
-        if reform_agenda.get('unbundling_push', False):
-            unbundling_score = min(1.0, unbundling_score + 0.05)
-        print(f"  - Unbundling: Score {unbundling_score:.2f}")
-        return {'unbundling_score': unbundling_score}
-
-    def _simulate_regulatory_framework(self, year, reform_agenda, implementation_capacity):
-        # Placeholder: Model evolution of regulatory capacity, independence, decision quality.
-        # Example: Capacity increases with investment/TA, influenced by political factors
-        base_capacity = self.current_regulatory_effectiveness
-        capacity_change = reform_agenda.get('regulatory_strengthening', 0.02) * implementation_capacity.get('regulator_capacity', 0.5)
-        self.current_regulatory_effectiveness = min(1.0, base_capacity + capacity_change)
-        print(f"  - Regulatory Framework: Effectiveness Score {self.current_regulatory_effectiveness:.2f}")
-        return {'regulatory_effectiveness_score': self.current_regulatory_effectiveness}
-
-    def _simulate_planning_processes(self, year, reform_agenda, data_availability):
-        # Placeholder: Model adoption of IRP, forecasting accuracy improvements.
-        # Example: Adherence improves if IRP adopted and data quality is good
-        irp_adopted = self.planning_params.get('irp_adopted', False)
-        if reform_agenda.get('adopt_irp', False):
-             irp_adopted = True
-             self.planning_params['irp_adopted'] = True # Update state
-
-        base_adherence = self.current_planning_adherence
-        adherence_improvement = 0.03 if irp_adopted and data_availability > 0.6 else 0.01
-        self.current_planning_adherence = min(1.0, base_adherence + adherence_improvement)
-        print(f"  - Planning Processes: IRP Adopted: {irp_adopted}, Adherence Score {self.current_planning_adherence:.2f}")
-        return {'irp_adopted': irp_adopted, 'planning_adherence_score': self.current_planning_adherence}
-
-    def _simulate_private_sector_participation(self, year, reform_agenda, investor_confidence):
-        # Placeholder: Model clarity of PPP framework, investor risk perception.
-        # Example: Framework clarity improves with reforms
-        base_clarity = self.ppp_framework.get('clarity_score', 0.6)
-        clarity_change = 0.05 if reform_agenda.get('improve_ppp_rules', False) else 0
-        new_clarity_score = min(1.0, base_clarity + clarity_change)
-        self.ppp_framework['clarity_score'] = new_clarity_score # Update state
-        # Combine framework clarity and confidence into an overall score
-        psp_environment_score = new_clarity_score * investor_confidence # Example combination
-        print(f"  - Private Participation: Framework Clarity {new_clarity_score:.2f}, Environment Score {psp_environment_score:.2f}")
-        return {'framework_clarity_score': new_clarity_score, 'psp_environment_score': psp_environment_score}
+        logger.info("GovernanceModel initialized.")
 
     def simulate_governance_impacts(self, year, reform_agenda, implementation_capacity, political_economy_constraints, external_factors):
         """
@@ -82,35 +79,105 @@ class GovernanceModel:
         Returns:
             dict: A summary of governance indicators and scores for the year.
         """
-        print(f"Simulating governance impacts for year {year}...")
+        logger.info("Simulating governance impacts for year %s...", year)
 
         # These inputs would drive the simulations below
         # Example: Extract investor confidence from external factors
         investor_confidence = external_factors.get('investor_confidence', 0.7)
         data_availability = external_factors.get('data_availability_score', 0.6)
 
-        # Simulate components
-        unbundling_results = self._simulate_sector_unbundling(year, reform_agenda)
-        regulatory_results = self._simulate_regulatory_framework(year, reform_agenda, implementation_capacity)
-        planning_results = self._simulate_planning_processes(year, reform_agenda, data_availability)
-        psp_results = self._simulate_private_sector_participation(year, reform_agenda, investor_confidence)
+        # Sector unbundling. Placeholder: Score improves if reform is active
+        unbundling_score = self._unbundling_base
+        if reform_agenda.get('unbundling_push', False):
+            unbundling_score += 0.05
+            unbundling_score = unbundling_score if unbundling_score < 1.0 else 1.0
+
+        # Regulatory framework. Placeholder: Capacity increases with investment/TA, influenced by political factors
+        capacity_change = reform_agenda.get('regulatory_strengthening', 0.02) * implementation_capacity.get('regulator_capacity', 0.5)
+        regulatory_effectiveness = self.current_regulatory_effectiveness + capacity_change
+        regulatory_effectiveness = regulatory_effectiveness if regulatory_effectiveness < 1.0 else 1.0
+        self.current_regulatory_effectiveness = regulatory_effectiveness
+
+        # Planning processes. Placeholder: Adherence improves if IRP adopted and data quality is good
+        if reform_agenda.get('adopt_irp', False):
+            self._irp_adopted = True
+        irp_adopted = self._irp_adopted
+        adherence_improvement = 0.03 if irp_adopted and data_availability > 0.6 else 0.01
+        planning_adherence = self.current_planning_adherence + adherence_improvement
+        planning_adherence = planning_adherence if planning_adherence < 1.0 else 1.0
+        self.current_planning_adherence = planning_adherence
+
+        # Private sector participation. Placeholder: Framework clarity improves with reforms,
+        # combined with investor confidence into an overall environment score
+        clarity_change = 0.05 if reform_agenda.get('improve_ppp_rules', False) else 0
+        clarity_score = self._ppp_clarity + clarity_change
+        clarity_score = clarity_score if clarity_score < 1.0 else 1.0
+        self._ppp_clarity = clarity_score
+        psp_environment_score = clarity_score * investor_confidence # Example combination
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Unbundling: Score %.2f", unbundling_score)
+            logger.debug("  - Regulatory Framework: Effectiveness Score %.2f", regulatory_effectiveness)
+            logger.debug("  - Planning Processes: IRP Adopted: %s, Adherence Score %.2f", irp_adopted, planning_adherence)
+            logger.debug("  - Private Participation: Framework Clarity %.2f, Environment Score %.2f", clarity_score, psp_environment_score)
 
         # Combine results
         governance_summary = {
-            'unbundling': unbundling_results,
-            'regulatory_framework': regulatory_results,
-            'planning_processes': planning_results,
-            'private_sector_participation': psp_results,
+            'unbundling': {'unbundling_score': unbundling_score},
+            'regulatory_framework': {'regulatory_effectiveness_score': regulatory_effectiveness},
+            'planning_processes': {'irp_adopted': irp_adopted, 'planning_adherence_score': planning_adherence},
+            'private_sector_participation': {'framework_clarity_score': clarity_score, 'psp_environment_score': psp_environment_score},
             # Aggregate score (example)
-            'overall_governance_score': (unbundling_results['unbundling_score'] +
-                                        regulatory_results['regulatory_effectiveness_score'] +
-                                        planning_results['planning_adherence_score'] +
-                                        psp_results['psp_environment_score']) / 4
+            'overall_governance_score': (unbundling_score + regulatory_effectiveness + planning_adherence + psp_environment_score) / 4
         }
 
-        print(f"Governance impact simulation complete for {year}.")
+        logger.info("Governance impact simulation complete for %s.", year)
         # Return structure similar to placeholder in main_simulation for now
-        # return {"regulatory_effectiveness": regulatory_results['regulatory_effectiveness_score'], "planning_adherence": planning_results['planning_adherence_score']}
+        # return {"regulatory_effectiveness": regulatory_effectiveness, "planning_adherence": planning_adherence}
         return governance_summary # Return detailed summary
 
-    # Add methods for specific governance aspect modeling (e.g., political economy feedback loops) later 
\ No newline at end of file
+    def simulate_governance_impacts_batch(self, reform_flags, regulatory_strengthening=0.02, regulator_capacity=0.5,
+                                          investor_confidence=0.7, data_availability_score=0.6):
+        """
+        Evaluates simulate_governance_impacts over consecutive years for many scenarios at once.
+
+        Years run along the last axis of the drivers (e.g. shape (n_scenarios, n_years)); the
+        yearly min(1, score + delta) steps become one cumulative sum per score, starting from the
+        model's current state. The state is not updated. Assumes non-negative regulatory
+        strengthening, as in the scalar path's placeholder.
+
+        Args:
+            reform_flags (array-like): Reform switches, shape (..., n_years, len(GOVERNANCE_REFORM_FLAGS))
+                                       ordered as GOVERNANCE_REFORM_FLAGS.
+            regulatory_strengthening: Regulatory strengthening per year (scalar or broadcastable array).
+            regulator_capacity: Regulator implementation capacity per year.
+            investor_confidence: Investor confidence per year.
+            data_availability_score: Data availability score per year.
+
+        Returns:
+            tuple: (scores with a trailing axis ordered as GOVERNANCE_SCORE_KEYS,
+                    overall_governance_score as their mean)
+        """
+        flags = np.asarray(reform_flags, dtype=bool)
+        unbundling_push, adopt_irp, improve_ppp = (flags[..., k] for k in range(len(GOVERNANCE_REFORM_FLAGS)))
+        shape = np.broadcast_shapes(unbundling_push.shape, np.shape(regulatory_strengthening), np.shape(regulator_capacity),
+                                    np.shape(investor_confidence), np.shape(data_availability_score))
+
+        def accumulate(initial, deltas):
+            # Running initial + deltas summed in year order, capped at 1
+            steps = np.concatenate((np.full(shape[:-1] + (1,), initial), np.broadcast_to(deltas, shape)), axis=-1)
+            totals = np.cumsum(steps, axis=-1)[..., 1:]
+            return np.minimum(totals, 1.0, out=totals)
+
+        scores = np.empty(shape + (len(GOVERNANCE_SCORE_KEYS),))
+        scores[..., 0] = np.where(unbundling_push, np.minimum(1.0, self._unbundling_base + 0.05), self._unbundling_base)
+        scores[..., 1] = accumulate(self.current_regulatory_effectiveness,
+                                    np.multiply(regulatory_strengthening, regulator_capacity))
+        irp_adopted = np.logical_or.accumulate(np.broadcast_to(adopt_irp, shape), axis=-1) | self._irp_adopted
+        scores[..., 2] = accumulate(self.current_planning_adherence,
+                                    np.where(irp_adopted & (np.asarray(data_availability_score) > 0.6), 0.03, 0.01))
+        clarity = accumulate(self._ppp_clarity, np.where(improve_ppp, 0.05, 0))
+        scores[..., 3] = clarity * investor_confidence
+        return scores, scores.sum(axis=-1) / 4
+
+    # Add methods for specific governance aspect modeling (e.g., political economy feedback loops) later
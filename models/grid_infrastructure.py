@@ -1,8 +1,141 @@
-import networkx as nx # Example: for network topology if needed
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+GRID_BASE_YEAR = 2025
+
+@dataclass(frozen=True, slots=True)
+class GridConfig:
+    """
+    Scalar grid settings, resolved from the config dict once at initialisation.
+    start_year is the first simulated year: import capacity and losses evolve from it.
+    """
+    transmission_capacity_gw: float = 50
+    distribution_loss: float = 0.12
+    technical_loss: float = 0.08
+    non_technical_loss: float = 0.04
+    base_import_capacity_mw: float = 1000
+    smart_meter_target: float = 1.0
+    start_year: int = GRID_BASE_YEAR
+    end_year: int = 2100
+
+    @classmethod
+    def from_config(cls, config):
+        """Reads the settings from a GridInfrastructureModel config dict, applying its defaults."""
+        loss_params = config.get('loss_params', {})
+        return cls(
+            transmission_capacity_gw=config.get('transmission_params', {}).get('base_capacity_gw', 50),
+            distribution_loss=loss_params.get('base_distribution_loss', 0.12),
+            technical_loss=loss_params.get('base_technical_loss', 0.08),
+            non_technical_loss=loss_params.get('base_non_technical_loss', 0.04),
+            base_import_capacity_mw=config.get('interconnection_params', {}).get('base_import_capacity_mw', 1000),
+            smart_meter_target=config.get('smart_grid_params', {}).get('target_penetration', 1.0),
+            start_year=int(config.get('start_year', GRID_BASE_YEAR)),
+            end_year=int(config.get('end_year', 2100)),
+        )
+
+# Order of the mutable grid state in GridInfrastructureModel.state (one float64 row per model,
+# so an ensemble driver can hand each model a row of one (n_scenarios, len(GRID_STATE_FIELDS)) array)
+GRID_STATE_FIELDS = ('transmission_capacity_gw', 'distribution_losses', 'technical_losses',
+                     'non_technical_losses', 'cross_border_capacity_mw')
+
+def _state_field(index, doc):
+    """Float attribute stored at ``index`` of the model's state array."""
+    def fget(self):
+        return self.state[index].item()
+    def fset(self, value):
+        self.state[index] = value
+    return property(fget, fset, doc=doc)
+
+def _grid_rollout(year, smart_meter_target, base_import_capacity_mw, start_year):
+    """
+    Smart grid rollout and cross-border import capacity as functions of the year.
+
+    The rollout follows the calendar (from GRID_BASE_YEAR); import capacity grows from its base
+    level at the simulation's start_year. Pure arithmetic, so a scalar year gives one year and
+    an array of years the whole trajectory.
+
+    Returns:
+        tuple: (smart_meter_penetration, automation_level, import_capacity_mw)
+    """
+    elapsed = np.subtract(year, GRID_BASE_YEAR)
+    smart_meter_penetration = np.minimum(smart_meter_target, 0.1 + 0.05 * elapsed) # Example linear rollout
+    automation_level = np.minimum(1.0, 0.05 + 0.03 * elapsed) # Example
+    # Example annual increase, including this year's
+    import_capacity_mw = base_import_capacity_mw + 100 * (np.subtract(year, start_year) + 1)
+    return smart_meter_penetration, automation_level, import_capacity_mw
+
+def _loss_fractions(base_technical, base_non_technical, smart_meter_penetration):
+    """
+    Technical and non-technical loss fractions over consecutive years (axis 0).
+
+    Each year technical losses fall by 1% and non-technical losses by a tenth of that year's
+    smart meter penetration, starting from the base levels. The running products are taken
+    with multiply.accumulate, i.e. in the same order as applying the reductions year by year.
+    Further axes of smart_meter_penetration (e.g. scenarios) broadcast.
+
+    Returns:
+        tuple: (technical_losses, non_technical_losses) arrays shaped like smart_meter_penetration.
+    """
+    smart_meter_penetration = np.asarray(smart_meter_penetration, dtype=np.float64)
+    n_years, rest = smart_meter_penetration.shape[0], smart_meter_penetration.shape[1:]
+    technical_steps = np.full((n_years + 1,) + rest, 0.99)
+    technical_steps[0] = base_technical
+    non_technical_steps = np.empty((n_years + 1,) + rest)
+    non_technical_steps[0] = base_non_technical
+    non_technical_steps[1:] = 1 - (smart_meter_penetration * 0.1) # Example linkage
+    technical = np.multiply.accumulate(technical_steps, axis=0)[1:]
+    non_technical = np.multiply.accumulate(non_technical_steps, axis=0)[1:]
+    return technical, non_technical
+
+def _csr_bus_admittance(n_buses, from_bus, to_bus, admittance):
+    """
+    Assembles the bus admittance matrix of a set of branches in CSR form.
+
+    Each branch adds its admittance to both end buses' diagonal entries and subtracts it from
+    the two off-diagonal entries; parallel branches are summed.
+
+    Returns:
+        tuple: (data, indices, indptr) of the n_buses x n_buses CSR matrix.
+    """
+    rows = np.concatenate((from_bus, to_bus, from_bus, to_bus))
+    cols = np.concatenate((from_bus, to_bus, to_bus, from_bus))
+    values = np.concatenate((admittance, admittance, -admittance, -admittance))
+    order = np.lexsort((cols, rows)) # Row-major, columns ascending within a row
+    rows, cols, values = rows[order], cols[order], values[order]
+    if len(rows) == 0:
+        return values, cols, np.zeros(n_buses + 1, dtype=np.intp)
+    # Sum duplicate (row, col) entries
+    new_entry = np.concatenate(([True], (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])))
+    starts = np.flatnonzero(new_entry)
+    data = np.add.reduceat(values, starts)
+    indices = cols[starts]
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows[starts], minlength=n_buses))))
+    return data, indices, indptr
+
+def _csr_matvec(data, indices, indptr, x):
+    """Product of a CSR matrix (data, indices, indptr) with a dense vector."""
+    products = data * x[indices]
+    out = np.zeros(len(indptr) - 1, dtype=np.result_type(data, x))
+    nonempty = indptr[:-1] < indptr[1:]
+    out[nonempty] = np.add.reduceat(products, indptr[:-1][nonempty]) if len(products) else 0
+    return out
 
 class GridInfrastructureModel:
     """Model transmission and distribution networks"""
-    def __init__(self, config):
+    # Positions in the state array, ordered as GRID_STATE_FIELDS
+    IDX_TRANSMISSION, IDX_DISTRIBUTION_LOSS, IDX_TECH_LOSS, IDX_NT_LOSS, IDX_CROSS_BORDER = range(len(GRID_STATE_FIELDS))
+
+    current_transmission_capacity_gw = _state_field(IDX_TRANSMISSION, "HV transmission capacity (GW).")
+    current_distribution_losses = _state_field(IDX_DISTRIBUTION_LOSS, "Distribution loss fraction.")
+    current_technical_losses = _state_field(IDX_TECH_LOSS, "Technical loss fraction.")
+    current_non_technical_losses = _state_field(IDX_NT_LOSS, "Non-technical loss fraction.")
+    cross_border_capacity_mw = _state_field(IDX_CROSS_BORDER, "Base cross-border import capacity (MW).")
+
+    def __init__(self, config, state_view=None):
         """
         Initializes the grid infrastructure model.
 
@@ -14,6 +147,11 @@ class GridInfrastructureModel:
                            - smart_grid_params: Rollout plans for smart meters, automation.
                            - interconnection_params: Capacity and plans for cross-border links.
                            - initial_topology: Representation of the grid network (optional).
+                           - start_year, end_year: Simulated horizon; import capacity and losses
+                             evolve from start_year (default 2025).
+            state_view (np.ndarray, optional): float64 array of len(GRID_STATE_FIELDS) to hold the
+                                               model state, e.g. one row of an ensemble-wide array.
+                                               It is overwritten with the initial state.
         """
         self.config = config
         self.transmission_params = config.get('transmission_params', {})
@@ -21,23 +159,55 @@ class GridInfrastructureModel:
         self.loss_params = config.get('loss_params', {})
         self.smart_grid_params = config.get('smart_grid_params', {})
         self.interconnection_params = config.get('interconnection_params', {})
-        # Example: Initialize grid state (capacity, losses)
-        self.current_transmission_capacity_gw = self.transmission_params.get('base_capacity_gw', 50)
-        self.current_distribution_losses = self.loss_params.get('base_distribution_loss', 0.12)
-        self.current_technical_losses = self.loss_params.get('base_technical_loss', 0.08)
-        self.current_non_technical_losses = self.loss_params.get('base_non_technical_loss', 0.04)
-        self.cross_border_capacity_mw = self.interconnection_params.get('base_import_capacity_mw', 1000)
+        self._cfg = cfg = GridConfig.from_config(config)
+        # Example: Initialize grid state (capacity, losses), ordered as GRID_STATE_FIELDS
+        self.state = np.empty(len(GRID_STATE_FIELDS)) if state_view is None else state_view
+        self.state[:] = (cfg.transmission_capacity_gw, cfg.distribution_loss, cfg.technical_loss,
+                         cfg.non_technical_loss, cfg.base_import_capacity_mw)
+        # Smart grid and interconnection trajectories depend only on the year, so build them once
+        # over the simulated horizon: rows are (smart meter penetration, automation, import capacity)
+        self._rollout_year0 = cfg.start_year
+        years = np.arange(cfg.start_year, cfg.end_year + 1)
+        self._rollout = np.array(_grid_rollout(years, cfg.smart_meter_target, cfg.base_import_capacity_mw, cfg.start_year),
+                                 dtype=np.float64)
+        self._rollout.flags.writeable = False
+        # Loss fractions follow from the base levels and the smart meter rollout alone, so they are
+        # tabulated over the same horizon (rows: technical, non-technical)
+        self._loss_table = np.array(_loss_fractions(cfg.technical_loss, cfg.non_technical_loss, self._rollout[0]))
+        self._loss_table.flags.writeable = False
+
+        # Optional: Load/initialize grid topology as branch arrays plus a CSR bus admittance matrix
+        self.grid_topology = None
+        if config.get('initial_topology'):
+            self.grid_topology = self._load_topology(config['initial_topology'])
 
-        # Optional: Load/initialize grid topology
-        # self.grid_topology = self._load_topology(config.get('initial_topology'))
+        logger.info("GridInfrastructureModel initialized.")
 
-        print("GridInfrastructureModel initialized.")
+    @staticmethod
+    def _load_topology(topology_data):
+        """
+        Builds the network arrays from {'buses': [...], 'lines': [{'from', 'to', 'admittance'}, ...]}.
 
-    # def _load_topology(self, topology_data):
-    #     # Placeholder: Load grid network data (e.g., from file, NetworkX format)
-    #     G = nx.Graph()
-    #     # ... add nodes (substations) and edges (lines) with parameters
-    #     return G
+        Lines become parallel branch arrays and the bus admittance matrix is assembled once in
+        CSR form (data, indices, indptr), the layout future power-flow kernels work on.
+        """
+        buses = list(topology_data.get('buses', ()))
+        lines = topology_data.get('lines', ())
+        for line in lines: # Buses only named by a line are appended in order of appearance
+            for end in (line['from'], line['to']):
+                if end not in buses:
+                    buses.append(end)
+        bus_index = {bus: i for i, bus in enumerate(buses)}
+        from_bus = np.array([bus_index[line['from']] for line in lines], dtype=np.intp)
+        to_bus = np.array([bus_index[line['to']] for line in lines], dtype=np.intp)
+        admittance = np.array([line.get('admittance', 1.0) for line in lines], dtype=np.complex128)
+        return {
+            'bus_index': bus_index,
+            'from_bus': from_bus,
+            'to_bus': to_bus,
+            'branch_admittance': admittance,
+            'ybus': _csr_bus_admittance(len(buses), from_bus, to_bus, admittance),
+        }
 
     def _simulate_hv_transmission(self, year, generation_dispatch, demand_patterns):
         # Placeholder: Model power flow, congestion, N-1 security, expansion.
@@ -45,47 +215,92 @@ class GridInfrastructureModel:
         congestion_hours = 100 # Example: Hours of congestion per year
         avg_loading_percent = 0.6 # Example
         # Simulate capacity expansion based on plans
-        self.current_transmission_capacity_gw *= 1.05 # Example simple growth
-        print(f"  - HV Transmission: Capacity {self.current_transmission_capacity_gw:.1f} GW, Congestion {congestion_hours} hrs")
-        return {'congestion_hours': congestion_hours, 'avg_loading': avg_loading_percent, 'capacity_gw': self.current_transmission_capacity_gw}
+        self.state[self.IDX_TRANSMISSION] *= 1.05 # Example simple growth
+        capacity_gw = self.current_transmission_capacity_gw
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - HV Transmission: Capacity %.1f GW, Congestion %s hrs", capacity_gw, congestion_hours)
+        return {'congestion_hours': congestion_hours, 'avg_loading': avg_loading_percent, 'capacity_gw': capacity_gw}
 
     def _simulate_distribution_network(self, year, demand_patterns):
         # Placeholder: Model feeder loading, reliability, upgrades.
         feeders_overloaded_percent = 0.05 # Example
         saisi = 10 # System Average Interruption Severity Index (hours/customer/year) - example
         # Simulate improvements
-        self.current_distribution_losses *= 0.98 # Example reduction
-        print(f"  - Distribution Network: Overload {feeders_overloaded_percent*100:.1f}%, SAIDI {saisi:.1f} hrs")
+        self.state[self.IDX_DISTRIBUTION_LOSS] *= 0.98 # Example reduction
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Distribution Network: Overload %.1f%%, SAIDI %.1f hrs", feeders_overloaded_percent*100, saisi)
         return {'overloaded_feeders_pct': feeders_overloaded_percent, 'saidi': saisi}
 
-    def _calculate_system_losses(self, year, generation_total, smart_meter_penetration):
+    def _calculate_system_losses(self, year, generation_total):
         # Placeholder: Model technical and non-technical loss reduction.
-        # Technical losses might depend on loading, non-technical on policy/metering.
-        self.current_technical_losses *= 0.99 # Slow reduction
-        # Non-technical loss reduction linked to smart meter rollout
-        self.current_non_technical_losses *= (1 - (smart_meter_penetration * 0.1)) # Example linkage
-        total_losses = self.current_technical_losses + self.current_non_technical_losses
+        # Technical losses might depend on loading, non-technical on policy/metering (smart meter rollout).
+        # Both are tabulated by year in __init__ from the model's own rollout trajectory, starting at the
+        # base levels in the first simulated year; use calculate_losses_trajectory for other penetrations.
+        offset = year - self._rollout_year0
+        if 0 <= offset < self._loss_table.shape[1]:
+            technical, non_technical = self._loss_table[:, offset].tolist()
+        elif offset < 0:
+            technical, non_technical = self._cfg.technical_loss, self._cfg.non_technical_loss
+        else:
+            years = np.arange(self._rollout_year0, year + 1)
+            penetration = _grid_rollout(years, self._cfg.smart_meter_target, self._cfg.base_import_capacity_mw, self._rollout_year0)[0]
+            technical, non_technical = (float(losses[-1]) for losses in _loss_fractions(
+                self._cfg.technical_loss, self._cfg.non_technical_loss, penetration))
+        self.state[self.IDX_TECH_LOSS:self.IDX_NT_LOSS + 1] = technical, non_technical
+        total_losses = technical + non_technical
         lost_energy_gwh = generation_total * total_losses # Estimate based on total generation
-        print(f"  - System Losses: Technical {self.current_technical_losses*100:.2f}%, Non-Technical {self.current_non_technical_losses*100:.2f}%, Total {total_losses*100:.2f}%")
-        return {'technical_losses_pct': self.current_technical_losses, 'non_technical_losses_pct': self.current_non_technical_losses, 'total_losses_pct': total_losses, 'lost_energy_gwh': lost_energy_gwh}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - System Losses: Technical %.2f%%, Non-Technical %.2f%%, Total %.2f%%", technical*100, non_technical*100, total_losses*100)
+        return {'technical_losses_pct': technical, 'non_technical_losses_pct': non_technical, 'total_losses_pct': total_losses, 'lost_energy_gwh': lost_energy_gwh}
+
+    def calculate_losses_trajectory(self, generation_gwh, smart_meter_penetration):
+        """
+        System losses over consecutive years from the base loss levels, in one pass.
+
+        Args:
+            generation_gwh (array-like): Total generation per year (axis 0), optionally with
+                                         further axes such as scenarios.
+            smart_meter_penetration (array-like): Smart meter penetration per year, broadcastable
+                                                  against generation_gwh.
+
+        Returns:
+            dict: Arrays keyed as _calculate_system_losses' result ('technical_losses_pct',
+                  'non_technical_losses_pct', 'total_losses_pct', 'lost_energy_gwh').
+        """
+        generation_gwh = np.asarray(generation_gwh, dtype=np.float64)
+        penetration = np.broadcast_to(smart_meter_penetration, np.broadcast_shapes(np.shape(smart_meter_penetration), generation_gwh.shape))
+        technical, non_technical = _loss_fractions(self._cfg.technical_loss, self._cfg.non_technical_loss, penetration)
+        total_losses = technical + non_technical
+        return {
+            'technical_losses_pct': technical,
+            'non_technical_losses_pct': non_technical,
+            'total_losses_pct': total_losses,
+            'lost_energy_gwh': generation_gwh * total_losses,
+        }
+
+    def _rollout_for(self, year):
+        """(smart meter penetration, automation level, import capacity MW) for ``year``."""
+        offset = year - self._rollout_year0
+        if 0 <= offset < self._rollout.shape[1]:
+            return self._rollout[:, offset].tolist()
+        return [float(value) for value in _grid_rollout(year, self._cfg.smart_meter_target, self._cfg.base_import_capacity_mw,
+                                                        self._rollout_year0)]
 
     def _simulate_smart_grid_development(self, year):
         # Placeholder: Model rollout of AMI, automation, etc.
-        smart_meter_target = self.smart_grid_params.get('target_penetration', 1.0)
-        current_penetration = min(smart_meter_target, 0.1 + 0.05 * (year - 2025)) # Example linear rollout
-        automation_level = min(1.0, 0.05 + 0.03 * (year - 2025)) # Example
-        print(f"  - Smart Grid: AMI Penetration {current_penetration*100:.1f}%, Automation {automation_level*100:.1f}%")
+        current_penetration, automation_level, _ = self._rollout_for(year)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Smart Grid: AMI Penetration %.1f%%, Automation %.1f%%", current_penetration*100, automation_level*100)
         return {'smart_meter_penetration': current_penetration, 'automation_level': automation_level}
 
     def _simulate_cross_border_interconnections(self, year):
         # Placeholder: Model capacity expansion, import/export flows.
         # Flows would depend on market model/regional dispatch.
-        potential_import_mw = self.cross_border_capacity_mw
+        import_capacity_mw = self._rollout_for(year)[2]
         potential_export_mw = 200 # Example fixed export potential
-        # Simulate capacity expansion based on plans
-        self.cross_border_capacity_mw += 100 # Example annual increase
-        print(f"  - Interconnections: Import Capacity {self.cross_border_capacity_mw} MW")
-        return {'import_capacity_mw': self.cross_border_capacity_mw, 'export_capacity_mw': potential_export_mw}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Interconnections: Import Capacity %s MW", import_capacity_mw)
+        return {'import_capacity_mw': import_capacity_mw, 'export_capacity_mw': potential_export_mw}
 
     def simulate_grid_operations(self, year, generation_dispatch, demand_patterns, network_constraints, weather_conditions):
         """
@@ -101,7 +316,7 @@ class GridInfrastructureModel:
         Returns:
             dict: A summary of grid state and performance for the year.
         """
-        print(f"Simulating grid operations for year {year}...")
+        logger.info("Simulating grid operations for year %s...", year)
 
         # Simulate sub-components
         smart_grid_status = self._simulate_smart_grid_development(year)
@@ -109,8 +324,11 @@ class GridInfrastructureModel:
         distribution_results = self._simulate_distribution_network(year, demand_patterns)
         interconnection_status = self._simulate_cross_border_interconnections(year)
         # Pass total generation (ensure units match - e.g., GWh)
-        total_generation_gwh = generation_dispatch.get('total_generation_gwh', sum(generation_dispatch.get('generation_mix_gwh', {}).values()))
-        loss_results = self._calculate_system_losses(year, total_generation_gwh, smart_grid_status['smart_meter_penetration'])
+        # simulate_dispatch always reports the total; only sum the mix for other callers' results
+        total_generation_gwh = generation_dispatch.get('total_generation_gwh')
+        if total_generation_gwh is None:
+            total_generation_gwh = sum(generation_dispatch.get('generation_mix_gwh', {}).values())
+        loss_results = self._calculate_system_losses(year, total_generation_gwh)
 
         # Combine results
         grid_summary = {
@@ -123,11 +341,26 @@ class GridInfrastructureModel:
             'overall_saidi': distribution_results.get('saidi') # Example
         }
 
-        print(f"Grid operations simulation complete for {year}.")
+        logger.info("Grid operations simulation complete for %s.", year)
         # Return placeholder from prompt for compatibility with main loop structure (will be replaced by grid_summary)
         # return {"transmission_losses": loss_results['technical_losses_pct'], "distribution_losses": loss_results['non_technical_losses_pct'], "congestion_events": hv_transmission_results['congestion_hours']}
         return grid_summary # Return the detailed summary
 
+    def bus_injections(self, voltages):
+        """
+        Complex power injected at each bus, S = V * conj(Ybus @ V), for the loaded topology.
+
+        Args:
+            voltages (array-like): Complex bus voltages (p.u.), ordered as the topology's bus_index.
+
+        Returns:
+            np.ndarray: Complex power injection per bus.
+        """
+        if self.grid_topology is None:
+            raise ValueError("No grid topology loaded; pass 'initial_topology' in the grid config.")
+        voltages = np.asarray(voltages, dtype=np.complex128)
+        return voltages * np.conj(_csr_matvec(*self.grid_topology['ybus'], voltages))
+
     # Add detailed power flow, stability analysis methods later
 
     # Add methods for specific grid component modeling later 
\ No newline at end of file
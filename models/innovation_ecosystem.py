@@ -1,6 +1,137 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._memo import ResultMemo
+
+logger = logging.getLogger(__name__)
+
+# Fixed-layout results of simulate_innovation. Field names match the keys of the
+# former result dicts, so flattened result columns are unchanged.
+@dataclass(frozen=True, slots=True)
+class TechnologyAdaptation:
+    tech_adaptation_score: float
+
+@dataclass(frozen=True, slots=True)
+class LocalManufacturing:
+    local_manufacturing_share: float
+
+@dataclass(frozen=True, slots=True)
+class InnovativeBusinessModels:
+    business_model_innovation_score: float
+
+@dataclass(frozen=True, slots=True)
+class DigitalEnergySolutions:
+    digitalization_level: float
+
+@dataclass(frozen=True, slots=True)
+class InnovationSummary:
+    """Innovation scores by area and their weighted aggregate for one year."""
+    technology_adaptation: TechnologyAdaptation
+    local_manufacturing: LocalManufacturing
+    innovative_business_models: InnovativeBusinessModels
+    digital_energy_solutions: DigitalEnergySolutions
+    overall_innovation_score: float
+
+# Order of InnovationEcosystemModel.state, with the cap on each score
+INNOVATION_STATE_KEYS = ('tech_adaptation_score', 'local_manufacturing_share', 'business_model_innovation_score', 'digitalization_level')
+INNOVATION_CAPS = (1.0, 0.5, 1.0, 1.0) # Local manufacturing capped at 50% example
+# Yearly drivers feeding the state update, in input-vector order
+INNOVATION_INPUT_KEYS = ('rd_spending_pct_gdp', 'overall_governance_score', 'manufacturing_policy_push',
+                         'total_investment_mobilized', 'enable_new_models', 'grid_modernization_investment')
+# Contribution of each driver (columns) to each score's yearly change (rows)
+INNOVATION_INPUT_COEFFS = (
+    (10 * 0.1, 0.05 * 0.1, 0, 0, 0, 0), # R&D and institutional capacity, dampened
+    (0, 0, 0.02, 0.02 / 50000, 0, 0), # Policy push and market pull (investment relative to total market)
+    (0, 0, 0, 0, 0.05, 0), # Policy enabling new business models
+    (0, 0, 0, 0, 0, 0.05 / 500), # Digital investment relative to target investment
+)
+# Within-year links: digitalization builds on this year's adaptation score, business models on this
+# year's digitalization level. Applied in INNOVATION_UPDATE_ORDER so each uses an already updated score.
+INNOVATION_COUPLING = (
+    (0, 0, 0, 0),
+    (0, 0, 0, 0),
+    (0, 0, 0, 0.03),
+    (0.02, 0, 0, 0),
+)
+INNOVATION_UPDATE_ORDER = (0, 1, 3, 2)
+# Weight of each score in the overall innovation score (weighting example: manufacturing counts double)
+INNOVATION_SCORE_WEIGHTS = (1.0, 2.0, 1.0, 1.0)
+
+def _innovation_step(state, inputs, input_coeffs, coupling, caps):
+    """
+    One year's update of the innovation scores, all four in a single pass.
+
+    Each score moves by a linear combination of the drivers (input_coeffs), then the within-year
+    links (coupling) are added in INNOVATION_UPDATE_ORDER and every score is capped. Leading axes
+    of state (..., 4) and inputs (..., len(INNOVATION_INPUT_KEYS)) broadcast, e.g. over scenarios.
+
+    Returns:
+        np.ndarray: The updated state, shaped like the broadcast of state and the score changes.
+    """
+    updated = state + inputs @ input_coeffs.T
+    for i in INNOVATION_UPDATE_ORDER:
+        updated[..., i] = np.minimum(caps[i], updated[..., i] + updated @ coupling[i])
+    return updated
+
+# Fixed-point scale of quantized scores: int16 units of 1/10000 (0..10000 for 0.0..1.0)
+INNOVATION_SCORE_SCALE = 10000
+
+def innovation_trajectories(initial_state, inputs, quantize=False):
+    """
+    Steps the innovation scores through consecutive years for many scenarios at once.
+
+    Args:
+        initial_state (array-like): Starting scores, shape (..., 4) ordered as INNOVATION_STATE_KEYS.
+        inputs (array-like): Yearly drivers, shape (..., n_years, len(INNOVATION_INPUT_KEYS)).
+        quantize (bool): Store the scores as int16 in units of 1/INNOVATION_SCORE_SCALE, rounding
+                         after every year. Quarters the memory of large scenario grids compared with
+                         float64, at ~1e-4 resolution, so results differ slightly from the
+                         unquantized path.
+
+    Returns:
+        np.ndarray: Scores after each year, shape (..., n_years, 4); int16 when quantized
+                    (divide by INNOVATION_SCORE_SCALE for the float scores).
+    """
+    inputs = np.asarray(inputs, dtype=np.float64)
+    input_coeffs, coupling, caps = np.array(INNOVATION_INPUT_COEFFS), np.array(INNOVATION_COUPLING), np.array(INNOVATION_CAPS)
+    state = np.broadcast_to(np.asarray(initial_state, dtype=np.float64), inputs.shape[:-2] + (len(INNOVATION_STATE_KEYS),))
+    out = np.empty(state.shape[:-1] + (inputs.shape[-2], len(INNOVATION_STATE_KEYS)),
+                   dtype=np.int16 if quantize else np.float64)
+    if quantize:
+        state = np.rint(state * INNOVATION_SCORE_SCALE) / INNOVATION_SCORE_SCALE
+    for y in range(inputs.shape[-2]):
+        state = _innovation_step(state, inputs[..., y, :], input_coeffs, coupling, caps)
+        if quantize:
+            out[..., y, :] = np.rint(state * INNOVATION_SCORE_SCALE)
+            state = out[..., y, :] / INNOVATION_SCORE_SCALE
+        else:
+            out[..., y, :] = state
+    return out
+
+def overall_innovation_score(scores, weights=None):
+    """Weighted aggregate of scores shaped (..., 4) (e.g. innovation_trajectories output), one matmul for any batch."""
+    if weights is None:
+        weights = np.array(INNOVATION_SCORE_WEIGHTS) / sum(INNOVATION_SCORE_WEIGHTS)
+    return scores @ weights
+
+def _state_field(index, doc):
+    """Float attribute stored at ``index`` of the model's state vector."""
+    def fget(self):
+        return self.state[index].item()
+    def fset(self, value):
+        self.state[index] = value
+    return property(fget, fset, doc=doc)
+
 class InnovationEcosystemModel:
     """Model energy technology innovation dynamics"""
-    def __init__(self, config):
+    current_tech_adaptation_score = _state_field(0, "Technology adaptation score.")
+    current_local_manufacturing_share = _state_field(1, "Local manufacturing share.")
+    current_business_model_innovation_score = _state_field(2, "Business model innovation score.")
+    current_digitalization_level = _state_field(3, "Digitalization level.")
+
+    def __init__(self, config, memo=None):
         """
         Initializes the innovation ecosystem model.
 
@@ -11,56 +142,32 @@ class InnovationEcosystemModel:
                            - business_model_params: Support for ESCOs, P2P trading pilots.
                            - digital_params: Investment in grid digitalization, AI.
                            - baseline_innovation_scores: Initial scores for innovation capacity.
+            memo (ResultMemo, optional): Memo for the yearly summaries, e.g. one shared by the models a
+                                         simulation rebuilds for each scenario. Defaults to a private one.
         """
         self.config = config
         self.adaptation_params = config.get('adaptation_params', {})
         self.manufacturing_params = config.get('manufacturing_params', {})
         self.business_model_params = config.get('business_model_params', {})
         self.digital_params = config.get('digital_params', {})
-        # Store current innovation state
-        self.current_tech_adaptation_score = config.get('baseline_innovation_scores', {}).get('adaptation', 0.4)
-        self.current_local_manufacturing_share = config.get('baseline_innovation_scores', {}).get('local_mfg_share', 0.05)
-        self.current_business_model_innovation_score = config.get('baseline_innovation_scores', {}).get('biz_model', 0.3)
-        self.current_digitalization_level = config.get('baseline_innovation_scores', {}).get('digital', 0.2)
-
-        print("InnovationEcosystemModel initialized.")
-
-    def _simulate_technology_adaptation(self, year, investment_rd, institutional_capacity):
-        # Placeholder: Model effectiveness of tech transfer, local customization.
-        # Score increases with R&D and institutional capacity
-        base_score = self.current_tech_adaptation_score
-        improvement = (investment_rd.get('rd_spending_pct_gdp', 0.001) * 10 + institutional_capacity.get('overall_governance_score', 0.5) * 0.05)
-        self.current_tech_adaptation_score = min(1.0, base_score + improvement * 0.1) # Dampened effect
-        print(f"  - Tech Adaptation: Score {self.current_tech_adaptation_score:.3f}")
-        return {'tech_adaptation_score': self.current_tech_adaptation_score}
-
-    def _simulate_local_manufacturing(self, year, industrial_policy, market_size):
-        # Placeholder: Model growth in local manufacturing share based on policy and market demand.
-        base_share = self.current_local_manufacturing_share
-        policy_push = self.manufacturing_params.get('local_content_target', 0.1) * industrial_policy.get('effectiveness', 0.5)
-        market_pull = (market_size.get('total_investment_mobilized', 4000) / 50000) # Example pull factor relative to total market
-        growth_factor = 0.02 * (policy_push + market_pull)
-        self.current_local_manufacturing_share = min(0.5, base_share + growth_factor) # Capped at 50% example
-        print(f"  - Local Manufacturing: Share {self.current_local_manufacturing_share*100:.1f}%")
-        return {'local_manufacturing_share': self.current_local_manufacturing_share}
-
-    def _simulate_innovative_business_models(self, year, policy_support, digitalization_level):
-        # Placeholder: Model emergence of ESCOs, P2P trading, PAYG based on policy and tech enablers.
-        base_score = self.current_business_model_innovation_score
-        policy_effect = policy_support.get('enable_new_models', False) * 0.05
-        digital_effect = digitalization_level * 0.03
-        self.current_business_model_innovation_score = min(1.0, base_score + policy_effect + digital_effect)
-        print(f"  - Business Models: Innovation Score {self.current_business_model_innovation_score:.3f}")
-        return {'business_model_innovation_score': self.current_business_model_innovation_score}
-
-    def _simulate_digital_energy_solutions(self, year, investment_digital, tech_adaptation_score):
-        # Placeholder: Model adoption of IoT, AI, blockchain based on investment and adaptation capacity.
-        base_level = self.current_digitalization_level
-        investment_effect = (investment_digital.get('grid_modernization_investment', 100) / 500) * 0.05 # Relative to target investment
-        adaptation_effect = tech_adaptation_score * 0.02
-        self.current_digitalization_level = min(1.0, base_level + investment_effect + adaptation_effect)
-        print(f"  - Digital Solutions: Level {self.current_digitalization_level:.3f}")
-        return {'digitalization_level': self.current_digitalization_level}
+        # Store current innovation state, ordered as INNOVATION_STATE_KEYS
+        baseline = config.get('baseline_innovation_scores', {})
+        self.state = np.array([baseline.get('adaptation', 0.4), baseline.get('local_mfg_share', 0.05),
+                               baseline.get('biz_model', 0.3), baseline.get('digital', 0.2)], dtype=np.float64)
+        self._caps = np.array(INNOVATION_CAPS)
+        self._input_coeffs = np.array(INNOVATION_INPUT_COEFFS)
+        self._coupling = np.array(INNOVATION_COUPLING)
+        self._weights = np.array(INNOVATION_SCORE_WEIGHTS) / sum(INNOVATION_SCORE_WEIGHTS)
+        # Yearly summaries keyed on (config scope, drivers, state before the update)
+        self._memo = ResultMemo(config.get('memo_size', 256)) if memo is None else memo
+        self._memo_scope = self._memo.scope(config)
+
+        logger.info("InnovationEcosystemModel initialized.")
+
+    def _step(self, inputs):
+        """Advances the state by one year for the drivers ``inputs`` (ordered as INNOVATION_INPUT_KEYS)."""
+        self.state[:] = _innovation_step(self.state, inputs, self._input_coeffs, self._coupling, self._caps)
+        return self.state
 
     def simulate_innovation(self, year, r_and_d_investment, market_pull_factors, institutional_capacity, industrial_policy, policy_support, investment_digital):
         """
@@ -69,38 +176,54 @@ class InnovationEcosystemModel:
         Args:
             year (int): The simulation year.
             r_and_d_investment (dict): Spending on R&D, tech transfer programs.
-            market_pull_factors (dict): Market size, price signals favoring innovation (e.g., from MarketModel).
+            market_pull_factors (dict): Market size, price signals favoring innovation.
             institutional_capacity (dict): Governance quality, regulatory support for innovation (e.g., from GovernanceModel).
             industrial_policy (dict): Policies aimed at local manufacturing.
             policy_support (dict): General policy support for new business models, etc.
             investment_digital (dict): Investment in digital infrastructure.
 
         Returns:
-            dict: Summary of innovation ecosystem status for the year.
+            InnovationSummary: Innovation ecosystem status for the year. Repeated inputs return the
+                               memoized (immutable) summary.
         """
-        print(f"Simulating innovation ecosystem for year {year}...")
+        logger.info("Simulating innovation ecosystem for year %s...", year)
+
+        # Yearly drivers, ordered as INNOVATION_INPUT_KEYS
+        inputs = np.array([
+            r_and_d_investment.get('rd_spending_pct_gdp', 0.001),
+            institutional_capacity.get('overall_governance_score', 0.5),
+            self.manufacturing_params.get('local_content_target', 0.1) * industrial_policy.get('effectiveness', 0.5),
+            market_pull_factors.get('total_investment_mobilized', 4000),
+            policy_support.get('enable_new_models', False),
+            investment_digital.get('grid_modernization_investment', 100),
+        ], dtype=np.float64)
+        key = (self._memo_scope, inputs.tobytes(), self.state.tobytes())
+        cached = self._memo.get(key)
+        if cached is not None:
+            innovation_summary, self.state[:] = cached
+            return innovation_summary
 
-        # Simulate components
-        adaptation_results = self._simulate_technology_adaptation(year, r_and_d_investment, institutional_capacity)
-        manufacturing_results = self._simulate_local_manufacturing(year, industrial_policy, market_pull_factors)
-        # Pass digitalization level to business model simulation
-        digital_results = self._simulate_digital_energy_solutions(year, investment_digital, adaptation_results['tech_adaptation_score'])
-        business_model_results = self._simulate_innovative_business_models(year, policy_support, digital_results['digitalization_level'])
+        # Placeholder dynamics: all four scores advance together from the drivers, see _innovation_step
+        state = self._step(inputs)
+        adaptation, manufacturing, business_models, digital = scores = state.tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Tech Adaptation: Score %.3f", adaptation)
+            logger.debug("  - Local Manufacturing: Share %.1f%%", manufacturing*100)
+            logger.debug("  - Digital Solutions: Level %.3f", digital)
+            logger.debug("  - Business Models: Innovation Score %.3f", business_models)
 
         # Combine results
-        innovation_summary = {
-            'technology_adaptation': adaptation_results,
-            'local_manufacturing': manufacturing_results,
-            'innovative_business_models': business_model_results,
-            'digital_energy_solutions': digital_results,
-            # Aggregate score (example)
-            'overall_innovation_score': (adaptation_results['tech_adaptation_score'] +
-                                         manufacturing_results['local_manufacturing_share'] * 2 + # Weighting example
-                                         business_model_results['business_model_innovation_score'] +
-                                         digital_results['digitalization_level']) / 5
-        }
-
-        print(f"Innovation ecosystem simulation complete for {year}.")
+        innovation_summary = InnovationSummary(
+            technology_adaptation=TechnologyAdaptation(adaptation),
+            local_manufacturing=LocalManufacturing(manufacturing),
+            innovative_business_models=InnovativeBusinessModels(business_models),
+            digital_energy_solutions=DigitalEnergySolutions(digital),
+            # Aggregate score (example), weighted by INNOVATION_SCORE_WEIGHTS
+            overall_innovation_score=float(overall_innovation_score(state, self._weights)),
+        )
+
+        self._memo.put(key, (innovation_summary, scores))
+        logger.info("Innovation ecosystem simulation complete for %s.", year)
         # Return structure similar to placeholder in main_simulation for now
         # return {
         #     "local_manufacturing_share": manufacturing_results['local_manufacturing_share'],
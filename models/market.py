@@ -1,6 +1,83 @@
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from ._memo import ResultMemo
+
+logger = logging.getLogger(__name__)
+
+# Year the PPA price and feed-in tariff declines start from
+MARKET_BASE_YEAR = 2025
+PPA_ANNUAL_DECLINE = 0.99
+FIT_ANNUAL_DECLINE = 0.95
+
+# Fixed-layout results of simulate_market_operations. Field names match the keys of the
+# former result dicts, so flattened result columns are unchanged.
+@dataclass(frozen=True, slots=True)
+class WholesaleMarket:
+    wholesale_price_mwh: float
+
+@dataclass(frozen=True, slots=True)
+class RetailTariffs:
+    average_retail_tariff_mwh: float
+    subsidy_level: float
+
+@dataclass(frozen=True, slots=True)
+class PPAs:
+    average_ppa_price_mwh: float
+
+@dataclass(frozen=True, slots=True)
+class RESupport:
+    feed_in_tariff_solar_mwh: float
+    auction_price_solar_mwh: float
+
+@dataclass(frozen=True, slots=True)
+class MarketSummary:
+    """Wholesale and retail prices, PPA prices and RE support levels for one year."""
+    wholesale_market: WholesaleMarket
+    retail_tariffs: RetailTariffs
+    ppas: PPAs
+    re_support: RESupport
+
+def _cost_array(generation_costs):
+    """Generation costs ($/MWh) as a float array, from a {technology/plant: cost} mapping or an array."""
+    if isinstance(generation_costs, Mapping):
+        return np.fromiter(generation_costs.values(), dtype=np.float64, count=len(generation_costs))
+    return np.asarray(generation_costs, dtype=np.float64)
+
+def _single_buyer_price(costs):
+    """Cost-plus wholesale price: average generation cost plus a small markup/admin fee."""
+    avg_gen_cost = float(costs.mean()) if costs.size else 50 # $/MWh example
+    return avg_gen_cost * 1.05
+
+def _merit_order_price(costs):
+    """Basic merit order clearing price: median (upper median for an even count) cost, by partial sort."""
+    # This would need sorted generation costs and demand to find the actual clearing price
+    mid = costs.size // 2
+    return float(np.partition(costs, mid)[mid]) if costs.size else 60
+
+def _wholesale_pricing(market_type):
+    """Wholesale price function for a market structure type; anything other than a single buyer clears on merit order."""
+    return _single_buyer_price if market_type == 'single_buyer' else _merit_order_price
+
+@lru_cache(maxsize=16)
+def _decline_table(start_year, end_year):
+    """
+    PPA and FiT decline factors for each year of start_year..end_year (rows: PPA, FiT).
+    They depend only on the year, so every model with the same horizon shares one
+    read-only table and a scenario sweep builds it once.
+    """
+    elapsed = np.arange(start_year, end_year + 1) - MARKET_BASE_YEAR
+    table = np.array([PPA_ANNUAL_DECLINE**elapsed, FIT_ANNUAL_DECLINE**elapsed])
+    table.flags.writeable = False
+    return table
+
 class MarketModel:
     """Model energy pricing, trading, and market structures"""
-    def __init__(self, config):
+    def __init__(self, config, memo=None):
         """
         Initializes the market model.
 
@@ -10,28 +87,43 @@ class MarketModel:
                            - tariff_params: Details on retail tariff structures, subsidies.
                            - ppa_params: Common terms and evolution of PPAs.
                            - re_support_params: Details on FiTs, auctions, net metering.
+            memo (ResultMemo, optional): Memo for the yearly summaries, e.g. one shared by the models a
+                                         simulation rebuilds for each scenario. Defaults to a private one.
         """
         self.config = config
         self.market_structure_params = config.get('market_structure_params', {'type': 'single_buyer'})
         self.tariff_params = config.get('tariff_params', {'avg_retail_markup': 1.2, 'subsidy_level': 0.1})
         self.ppa_params = config.get('ppa_params', {'avg_ppa_price': 60})
         self.re_support_params = config.get('re_support_params', {'fit_solar': 80})
+        # The market structure is fixed for a run, so its pricing rule is chosen once
+        self._price_wholesale = _wholesale_pricing(self.market_structure_params.get('type'))
         # Store current market state
         self.current_wholesale_price = 0
         self.current_retail_tariff = 0
-        print("MarketModel initialized.")
+        # PPA and FiT decline factors over the configured horizon, looked up by year offset
+        # instead of a pow per call
+        self._decline_year0 = int(config.get('start_year', MARKET_BASE_YEAR))
+        self._decline_factors = _decline_table(self._decline_year0, int(config.get('end_year', 2100)))
+        # Yearly summaries keyed on (config scope, year, generation costs); the rest of the inputs are fixed config
+        self._memo = ResultMemo(config.get('memo_size', 256)) if memo is None else memo
+        self._memo_scope = self._memo.scope(config)
+        logger.info("MarketModel initialized.")
+
+    def _decline_factor(self, row, year, annual_decline):
+        """Decline factor for ``year`` from row ``row`` of the table, or the formula outside its horizon."""
+        offset = year - self._decline_year0
+        if 0 <= offset < self._decline_factors.shape[1]:
+            return float(self._decline_factors[row, offset])
+        return annual_decline**(year - MARKET_BASE_YEAR)
 
     def _simulate_wholesale_market(self, year, generation_costs, market_structure):
         # Placeholder: Model wholesale price based on structure (cost-plus, merit order, etc.)
-        if market_structure.get('type') == 'single_buyer':
-            # Simple cost-plus based on average generation cost
-            avg_gen_cost = sum(generation_costs.values()) / len(generation_costs) if generation_costs else 50 # $/MWh example
-            wholesale_price = avg_gen_cost * 1.05 # Small markup/admin fee
-        else: # Assume a basic merit order market
-            # This would need sorted generation costs and demand to find clearing price
-            wholesale_price = sorted(generation_costs.values())[len(generation_costs)//2] if generation_costs else 60 # Simplistic: median cost
-        print(f"  - Wholesale Market: Type '{market_structure.get('type')}', Price ${wholesale_price:.2f}/MWh")
-        return {'wholesale_price_mwh': wholesale_price}
+        price_wholesale = (self._price_wholesale if market_structure is self.market_structure_params
+                           else _wholesale_pricing(market_structure.get('type')))
+        wholesale_price = price_wholesale(_cost_array(generation_costs))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Wholesale Market: Type '%s', Price $%.2f/MWh", market_structure.get('type'), wholesale_price)
+        return WholesaleMarket(wholesale_price)
 
     def _simulate_retail_tariffs(self, year, wholesale_price, tariff_params):
         # Placeholder: Model retail price based on wholesale, network costs, subsidies.
@@ -40,23 +132,26 @@ class MarketModel:
         cost_reflective_tariff = wholesale_price + network_cost_component
         average_retail_tariff = cost_reflective_tariff * (1 - subsidy_level)
         # Could add differentiation by customer class
-        print(f"  - Retail Tariffs: Avg Tariff ${average_retail_tariff:.2f}/MWh (Subsidy: {subsidy_level*100:.1f}%)")
-        return {'average_retail_tariff_mwh': average_retail_tariff, 'subsidy_level': subsidy_level}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Retail Tariffs: Avg Tariff $%.2f/MWh (Subsidy: %.1f%%)", average_retail_tariff, subsidy_level*100)
+        return RetailTariffs(average_retail_tariff, subsidy_level)
 
     def _simulate_ppa_dynamics(self, year, ppa_params):
         # Placeholder: Model average PPA price evolution, renegotiation risk etc.
         # Assume PPA prices decrease slightly over time due to competition/tech improvements
-        avg_ppa_price = ppa_params.get('avg_ppa_price', 60) * (0.99**(year - 2025))
-        print(f"  - PPAs: Average Price ${avg_ppa_price:.2f}/MWh")
-        return {'average_ppa_price_mwh': avg_ppa_price}
+        avg_ppa_price = ppa_params.get('avg_ppa_price', 60) * self._decline_factor(0, year, PPA_ANNUAL_DECLINE)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - PPAs: Average Price $%.2f/MWh", avg_ppa_price)
+        return PPAs(avg_ppa_price)
 
     def _simulate_re_support(self, year, re_support_params):
         # Placeholder: Model effectiveness of FiTs, auctions.
         # Example: Feed-in Tariff for solar decreases over time
-        fit_solar = re_support_params.get('fit_solar', 80) * (0.95**(year - 2025))
+        fit_solar = re_support_params.get('fit_solar', 80) * self._decline_factor(1, year, FIT_ANNUAL_DECLINE)
         auction_solar_price = fit_solar * 0.8 # Assume auctions yield lower prices
-        print(f"  - RE Support: Solar FiT ${fit_solar:.2f}/MWh, Auction Price ${auction_solar_price:.2f}/MWh")
-        return {'feed_in_tariff_solar_mwh': fit_solar, 'auction_price_solar_mwh': auction_solar_price}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - RE Support: Solar FiT $%.2f/MWh, Auction Price $%.2f/MWh", fit_solar, auction_solar_price)
+        return RESupport(fit_solar, auction_solar_price)
 
     def simulate_market_operations(self, year, supply_costs, policy_interventions, institutional_arrangements, generation_dispatch):
         """
@@ -64,42 +159,53 @@ class MarketModel:
 
         Args:
             year (int): The simulation year.
-            supply_costs (dict): Variable generation costs by technology/plant (e.g., $/MWh).
-                                This should come from the generation dispatch simulation.
+            supply_costs (dict or np.ndarray): Variable generation costs by technology/plant (e.g., $/MWh),
+                                               as a mapping or a cost array. This should come from the
+                                               generation dispatch simulation.
             policy_interventions (dict): Specific policies affecting market (e.g., tax changes).
             institutional_arrangements (dict): Current state of market rules, regulator actions.
             generation_dispatch (dict): Results from generation model, potentially including costs.
 
         Returns:
-            dict: Summary of market outcomes (prices, support levels).
+            MarketSummary: Market outcomes (prices, support levels). Repeated inputs return the
+                           memoized (immutable) summary.
         """
-        print(f"Simulating market operations for year {year}...")
+        logger.info("Simulating market operations for year %s...", year)
 
         # Extract relevant generation costs if available from dispatch
         # Using placeholder if not passed explicitly
         generation_costs = generation_dispatch.get('variable_costs_mwh', supply_costs)
-        if not generation_costs:
+        if generation_costs is None or len(generation_costs) == 0:
              generation_costs = {'default': 50} # Fallback placeholder
+        costs = _cost_array(generation_costs)
+        key = (self._memo_scope, year, costs.tobytes())
+        cached = self._memo.get(key)
+        if cached is not None:
+            market_summary = cached
+            self.current_wholesale_price = market_summary.wholesale_market.wholesale_price_mwh
+            self.current_retail_tariff = market_summary.retail_tariffs.average_retail_tariff_mwh
+            return market_summary
 
         # Simulate components
-        wholesale_results = self._simulate_wholesale_market(year, generation_costs, self.market_structure_params)
-        retail_results = self._simulate_retail_tariffs(year, wholesale_results['wholesale_price_mwh'], self.tariff_params)
+        wholesale_results = self._simulate_wholesale_market(year, costs, self.market_structure_params)
+        retail_results = self._simulate_retail_tariffs(year, wholesale_results.wholesale_price_mwh, self.tariff_params)
         ppa_results = self._simulate_ppa_dynamics(year, self.ppa_params)
         re_support_results = self._simulate_re_support(year, self.re_support_params)
 
         # Update market state
-        self.current_wholesale_price = wholesale_results['wholesale_price_mwh']
-        self.current_retail_tariff = retail_results['average_retail_tariff_mwh']
+        self.current_wholesale_price = wholesale_results.wholesale_price_mwh
+        self.current_retail_tariff = retail_results.average_retail_tariff_mwh
 
         # Combine results
-        market_summary = {
-            'wholesale_market': wholesale_results,
-            'retail_tariffs': retail_results,
-            'ppas': ppa_results,
-            're_support': re_support_results
-        }
-
-        print(f"Market operations simulation complete for {year}.")
+        market_summary = MarketSummary(
+            wholesale_market=wholesale_results,
+            retail_tariffs=retail_results,
+            ppas=ppa_results,
+            re_support=re_support_results
+        )
+
+        self._memo.put(key, market_summary)
+        logger.info("Market operations simulation complete for %s.", year)
         # Return structure similar to placeholder in main_simulation for now
         # return {"wholesale_price": self.current_wholesale_price, "average_retail_tariff": self.current_retail_tariff}
         return market_summary # Return detailed summary
@@ -1,6 +1,221 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._memo import ResultMemo
+
+logger = logging.getLogger(__name__)
+
+# Year the technology learning curves are anchored to
+LEARNING_BASE_YEAR = 2025
+
+# Fixed-layout results of simulate_transition. Field names match the keys of the
+# former result dicts, so flattened result columns are unchanged.
+@dataclass(frozen=True, slots=True)
+class SolarExpansion:
+    capacity_increase_mw: float
+    lcoe_mwh: float
+
+@dataclass(frozen=True, slots=True)
+class WindExpansion:
+    capacity_increase_mw: float
+    lcoe_mwh: float
+
+@dataclass(frozen=True, slots=True)
+class BioenergyUtilization:
+    capacity_increase_mw: float
+
+@dataclass(frozen=True, slots=True)
+class HydropowerOptimization:
+    domestic_capacity_increase_mw: float
+    imports_mw: float
+
+@dataclass(frozen=True, slots=True)
+class GridIntegration:
+    vre_penetration_level: float
+    estimated_curtailment_factor: float
+    forecasting_accuracy: float
+
+@dataclass(frozen=True, slots=True)
+class CapacityIncreases:
+    solar: float
+    wind: float
+    bioenergy: float
+    hydro_domestic: float
+
+@dataclass(frozen=True, slots=True)
+class TransitionSummary:
+    """RE expansion by technology and grid integration status for one year."""
+    solar: SolarExpansion
+    wind: WindExpansion
+    bioenergy: BioenergyUtilization
+    hydro: HydropowerOptimization
+    grid_integration: GridIntegration
+    # Aggregate increases for feedback to GenerationPortfolioModel
+    total_capacity_increase_mw: CapacityIncreases
+
+@dataclass(frozen=True, slots=True)
+class RenewableConfig:
+    """Scalar renewable settings, resolved from the config dict once at initialisation."""
+    solar_base_cost_mwh: float = 70
+    wind_base_cost_mwh: float = 80
+    solar_lr: float = 0.15
+    wind_lr: float = 0.1
+    max_vre_penetration: float = 0.5
+    base_solar_mw: float = 500
+    base_wind_mw: float = 100
+    start_year: int = LEARNING_BASE_YEAR
+    end_year: int = 2100
+
+    @classmethod
+    def from_config(cls, config):
+        """Reads the settings from a RenewableTransitionModel config dict, applying its defaults."""
+        learning_curves = config.get('learning_curves', {})
+        return cls(
+            solar_base_cost_mwh=config.get('solar_params', {}).get('base_cost_mwh', 70),
+            wind_base_cost_mwh=config.get('wind_params', {}).get('base_cost_mwh', 80),
+            solar_lr=learning_curves.get('solar_lr', 0.15),
+            wind_lr=learning_curves.get('wind_lr', 0.1),
+            max_vre_penetration=config.get('integration_params', {}).get('max_vre_penetration', 0.5),
+            base_solar_mw=config.get('base_solar_mw', 500),
+            base_wind_mw=config.get('base_wind_mw', 100),
+            start_year=int(config.get('start_year', LEARNING_BASE_YEAR)),
+            end_year=int(config.get('end_year', 2100)),
+        )
+
+def _learning_cost(year, base_cost_mwh, learning_rate):
+    """Technology cost for a year (or array of years) on its learning curve."""
+    return base_cost_mwh * (1 - learning_rate)**np.subtract(year, LEARNING_BASE_YEAR)
+
+def _expansion_kernel(lcoe_mwh, target_mw, economic_mw, dampening, wholesale_price_mwh):
+    """
+    Capacity build-out of one renewable technology at a given cost.
+
+    The build-out is the larger of the policy target and the economic expansion (available
+    only while the technology undercuts the wholesale price), dampened. Pure arithmetic, so
+    scalars give one year and broadcastable arrays many years/scenarios at once. The cost
+    is an input, looked up by the caller from the learning curve (see _learning_cost).
+
+    Returns:
+        np.ndarray or float: capacity_increase_mw
+    """
+    # Branchless: the economic build-out is scaled by the 0/1 outcome of the cost comparison
+    return np.maximum(target_mw, economic_mw * np.less(lcoe_mwh, wholesale_price_mwh)) * dampening
+
+def learn_expand(year, base_cost_mwh, learning_rate, wholesale_price_mwh, target_mw, economic_mw, dampening):
+    """
+    Learning-curve cost and resulting build-out of one renewable technology.
+
+    The shared formula behind the solar and wind expansion steps: cost on the learning curve,
+    then the larger of the policy target and the economic build-out (when the cost undercuts the
+    wholesale price), dampened. Like a two-output ufunc, every argument may be a scalar or an array
+    and they broadcast together, e.g. years (Y,) against per-scenario columns (N, 1).
+
+    Returns:
+        tuple: (lcoe_mwh, capacity_increase_mw)
+    """
+    lcoe_mwh = _learning_cost(year, base_cost_mwh, learning_rate)
+    return lcoe_mwh, _expansion_kernel(lcoe_mwh, target_mw, economic_mw, dampening, wholesale_price_mwh)
+
+def _grid_integration_kernel(year, total_vre_mw, total_system_mw, max_penetration):
+    """
+    VRE penetration, curtailment and forecasting accuracy; broadcasts like _expansion_kernel.
+
+    Returns:
+        tuple: (vre_penetration, curtailment_factor, forecasting_accuracy)
+    """
+    has_capacity = np.greater(total_system_mw, 0)
+    vre_penetration = np.where(has_capacity, np.divide(total_vre_mw, np.where(has_capacity, total_system_mw, 1)), 0)
+    curtailment_factor = np.maximum(0, (vre_penetration - max_penetration) * 2) # Example: Curtailment increases sharply above limit
+    forecasting_accuracy = np.minimum(0.95, 0.8 + 0.01 * np.subtract(year, LEARNING_BASE_YEAR)) # Example improvement
+    return vre_penetration, curtailment_factor, forecasting_accuracy
+
+# Metrics returned by _transition_trajectories, in the order of sweep_scenarios' last axis and
+# the columns of RenewableTransitionModel.transition_history()
+TRANSITION_METRICS = ('solar_lcoe_mwh', 'solar_capacity_increase_mw', 'solar_capacity_mw',
+                      'wind_lcoe_mwh', 'wind_capacity_increase_mw', 'wind_capacity_mw',
+                      'vre_penetration_level', 'estimated_curtailment_factor', 'forecasting_accuracy')
+
+def _transition_trajectories(years, solar_base_cost_mwh, wind_base_cost_mwh, solar_lr, wind_lr, max_vre_penetration,
+                             base_solar_mw, base_wind_mw, wholesale_price_mwh, solar_target_mw, wind_target_mw,
+                             total_system_capacity_mw):
+    """
+    Solar/wind expansion and grid integration over consecutive years (last axis).
+
+    Every argument other than ``years`` (shape (n_years,)) may be a scalar or broadcast against
+    (..., n_years); per-scenario settings are passed as (n_scenarios, 1) columns. Capacity
+    accumulates from base_solar_mw/base_wind_mw, summed in year order as the per-year path does.
+
+    Returns:
+        dict: TRANSITION_METRICS name -> array of the broadcast shape.
+    """
+    years = np.asarray(years)
+    shape = np.broadcast_shapes(*(np.shape(value) for value in (
+        years, solar_base_cost_mwh, wind_base_cost_mwh, solar_lr, wind_lr, max_vre_penetration, base_solar_mw,
+        base_wind_mw, wholesale_price_mwh, solar_target_mw, wind_target_mw, total_system_capacity_mw)))
+    results = {}
+    for tech, base_cost_mwh, learning_rate, initial_mw, target_mw, economic_mw, dampening in (
+            ('solar', solar_base_cost_mwh, solar_lr, base_solar_mw, solar_target_mw, 1000, 0.5),
+            ('wind', wind_base_cost_mwh, wind_lr, base_wind_mw, wind_target_mw, 500, 0.3)):
+        lcoe, increase = learn_expand(years, base_cost_mwh, learning_rate, wholesale_price_mwh, target_mw,
+                                      economic_mw, dampening)
+        # Running capacity, summed in year order from the initial capacity
+        steps = np.concatenate((np.broadcast_to(initial_mw, shape[:-1] + (1,)), np.broadcast_to(increase, shape)),
+                               axis=-1, dtype=np.float64)
+        results[f'{tech}_lcoe_mwh'] = np.broadcast_to(lcoe, shape)
+        results[f'{tech}_capacity_increase_mw'] = steps[..., 1:]
+        results[f'{tech}_capacity_mw'] = np.cumsum(steps, axis=-1)[..., 1:]
+
+    penetration, curtailment, accuracy = _grid_integration_kernel(
+        years, results['solar_capacity_mw'] + results['wind_capacity_mw'], total_system_capacity_mw, max_vre_penetration)
+    results['vre_penetration_level'] = np.broadcast_to(penetration, shape)
+    results['estimated_curtailment_factor'] = np.broadcast_to(curtailment, shape)
+    results['forecasting_accuracy'] = np.broadcast_to(accuracy, shape)
+    return results
+
+# Per-scenario settings accepted by sweep_scenarios, with the value used when a field is absent
+# (the RenewableConfig defaults and simulate_transition's driver defaults)
+SWEEP_PARAM_DTYPE = np.dtype([
+    ('solar_base_cost_mwh', 'f8'), ('wind_base_cost_mwh', 'f8'), ('solar_lr', 'f8'), ('wind_lr', 'f8'),
+    ('max_vre_penetration', 'f8'), ('base_solar_mw', 'f8'), ('base_wind_mw', 'f8'),
+    ('wholesale_price_mwh', 'f8'), ('solar_target_mw', 'f8'), ('wind_target_mw', 'f8'),
+    ('total_system_capacity_mw', 'f8'),
+])
+SWEEP_PARAM_DEFAULTS = {
+    'solar_base_cost_mwh': 70, 'wind_base_cost_mwh': 80, 'solar_lr': 0.15, 'wind_lr': 0.1,
+    'max_vre_penetration': 0.5, 'base_solar_mw': 500, 'base_wind_mw': 100,
+    'wholesale_price_mwh': 60, 'solar_target_mw': 500, 'wind_target_mw': 100,
+    'total_system_capacity_mw': 25000,
+}
+
+def sweep_scenarios(years, params):
+    """
+    Runs the renewable transition for many independent scenarios at once.
+
+    The only year-to-year state is installed capacity, a running sum, so the whole
+    (scenarios x years) grid is evaluated by the shared kernels in one vectorised pass.
+
+    Args:
+        years (array-like): Consecutive simulation years, shape (Y,).
+        params (np.ndarray): Structured array with (a subset of) the fields of SWEEP_PARAM_DTYPE,
+                             one element per scenario, shape (N,). Absent fields take
+                             SWEEP_PARAM_DEFAULTS.
+
+    Returns:
+        np.ndarray: Shape (N, Y, len(TRANSITION_METRICS)), metrics ordered as TRANSITION_METRICS.
+    """
+    names = params.dtype.names or ()
+    columns = [params[name][:, None] if name in names else SWEEP_PARAM_DEFAULTS[name] for name in SWEEP_PARAM_DTYPE.names]
+    results = _transition_trajectories(years, *columns)
+    out = np.empty((len(params), np.size(years), len(TRANSITION_METRICS)))
+    for k, name in enumerate(TRANSITION_METRICS):
+        out[..., k] = results[name]
+    return out
+
 class RenewableTransitionModel:
     """Model renewable energy adoption and integration"""
-    def __init__(self, config):
+    def __init__(self, config, memo=None):
         """
         Initializes the renewable transition model.
 
@@ -12,6 +227,8 @@ class RenewableTransitionModel:
                            - hydro_params: Potential, limitations, cross-border aspects.
                            - integration_params: Grid flexibility limits, curtailment rules.
                            - learning_curves: Technology cost reduction parameters.
+            memo (ResultMemo, optional): Memo for the yearly summaries, e.g. one shared by the models a
+                                         simulation rebuilds for each scenario. Defaults to a private one.
         """
         self.config = config
         self.solar_params = config.get('solar_params', {'base_cost_mwh': 70})
@@ -20,58 +237,91 @@ class RenewableTransitionModel:
         self.hydro_params = config.get('hydro_params', {})
         self.integration_params = config.get('integration_params', {'max_vre_penetration': 0.5})
         self.learning_curves = config.get('learning_curves', {'solar_lr': 0.15, 'wind_lr': 0.1})
+        self._cfg = cfg = RenewableConfig.from_config(config)
         # Store current RE state if needed
-        self.current_solar_capacity_mw = config.get('base_solar_mw', 500)
-        self.current_wind_capacity_mw = config.get('base_wind_mw', 100)
+        self.current_solar_capacity_mw = cfg.base_solar_mw
+        self.current_wind_capacity_mw = cfg.base_wind_mw
+        # Learning-curve costs over the configured horizon (rows: solar, wind), looked up by year
+        # offset instead of a pow per call
+        self._cost_year0 = cfg.start_year
+        years = np.arange(cfg.start_year, cfg.end_year + 1)
+        self._cost_curves = np.array([
+            _learning_cost(years, cfg.solar_base_cost_mwh, cfg.solar_lr),
+            _learning_cost(years, cfg.wind_base_cost_mwh, cfg.wind_lr),
+        ])
+        self._cost_curves.flags.writeable = False
+        # Yearly summaries keyed on the config scope plus the resolved drivers and capacities they depend on
+        self._memo = ResultMemo(config.get('memo_size', 256)) if memo is None else memo
+        self._memo_scope = self._memo.scope(config)
+        # Yearly outputs over the horizon, columns ordered as TRANSITION_METRICS (NaN until simulated);
+        # the sub-simulations write the current year into the scratch row
+        self._transition_out = np.full((len(years), len(TRANSITION_METRICS)), np.nan)
+        self._row = np.empty(len(TRANSITION_METRICS))
+
+        logger.info("RenewableTransitionModel initialized.")
+
+    def transition_history(self):
+        """
+        Returns the yearly outputs simulated so far over start_year..end_year.
 
-        print("RenewableTransitionModel initialized.")
+        Returns:
+            tuple: (years array of shape (Y,), read-only array of shape (Y, len(TRANSITION_METRICS))
+                   with columns ordered as TRANSITION_METRICS and NaN rows for years not yet simulated)
+        """
+        out = self._transition_out.view()
+        out.flags.writeable = False
+        return np.arange(self._cost_year0, self._cost_year0 + len(out)), out
 
-    def _simulate_solar_expansion(self, year, policy_support, market_conditions):
+    def _technology_cost(self, row, year, base_cost_mwh, learning_rate):
+        """Learning-curve cost from row ``row`` of the cost table, or the formula outside its horizon."""
+        offset = year - self._cost_year0
+        if 0 <= offset < self._cost_curves.shape[1]:
+            return float(self._cost_curves[row, offset])
+        return float(_learning_cost(year, base_cost_mwh, learning_rate))
+
+    def _simulate_solar_expansion(self, year, policy_support, market_conditions, row):
         # Placeholder: Model utility-scale, rooftop, floating based on costs, policy, land.
-        # Apply learning curve
-        cost_reduction_factor = (1 - self.learning_curves.get('solar_lr', 0.15))**(year - 2025)
-        current_cost_mwh = self.solar_params.get('base_cost_mwh', 70) * cost_reduction_factor
-        # Determine expansion based on economics (vs PPA/wholesale price) & policy targets
+        # Apply learning curve, then expand on economics (vs PPA/wholesale price) & policy targets
         target_expansion = policy_support.get('solar_target_mw', 500) # MW per year
-        economic_expansion = 1000 if current_cost_mwh < market_conditions.get('wholesale_price_mwh', 60) else 0
-        capacity_increase_mw = max(target_expansion, economic_expansion) * 0.5 # Simplified average/dampening
-        self.current_solar_capacity_mw += capacity_increase_mw
-        print(f"  - Solar Expansion: Cost ${current_cost_mwh:.2f}/MWh, Increase {capacity_increase_mw:.0f} MW, Total {self.current_solar_capacity_mw:.0f} MW")
-        return {'capacity_increase_mw': capacity_increase_mw, 'lcoe_mwh': current_cost_mwh}
+        wholesale_price = market_conditions.get('wholesale_price_mwh', 60)
+        current_cost_mwh = self._technology_cost(0, year, self._cfg.solar_base_cost_mwh, self._cfg.solar_lr)
+        capacity_increase_mw = float(_expansion_kernel(current_cost_mwh, target_expansion, 1000, 0.5, wholesale_price)) # Simplified average/dampening
+        row[0:3] = current_cost_mwh, capacity_increase_mw, self.current_solar_capacity_mw + capacity_increase_mw
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Solar Expansion: Cost $%.2f/MWh, Increase %.0f MW, Total %.0f MW", current_cost_mwh, capacity_increase_mw, row[2])
 
-    def _simulate_wind_expansion(self, year, policy_support, market_conditions):
+    def _simulate_wind_expansion(self, year, policy_support, market_conditions, row):
         # Placeholder: Model coastal, offshore potential, costs, policy.
-        cost_reduction_factor = (1 - self.learning_curves.get('wind_lr', 0.1))**(year - 2025)
-        current_cost_mwh = self.wind_params.get('base_cost_mwh', 80) * cost_reduction_factor
         target_expansion = policy_support.get('wind_target_mw', 100) # MW per year
-        economic_expansion = 500 if current_cost_mwh < market_conditions.get('wholesale_price_mwh', 60) else 0
-        capacity_increase_mw = max(target_expansion, economic_expansion) * 0.3 # Simplified average/dampening
-        self.current_wind_capacity_mw += capacity_increase_mw
-        print(f"  - Wind Expansion: Cost ${current_cost_mwh:.2f}/MWh, Increase {capacity_increase_mw:.0f} MW, Total {self.current_wind_capacity_mw:.0f} MW")
-        return {'capacity_increase_mw': capacity_increase_mw, 'lcoe_mwh': current_cost_mwh}
+        wholesale_price = market_conditions.get('wholesale_price_mwh', 60)
+        current_cost_mwh = self._technology_cost(1, year, self._cfg.wind_base_cost_mwh, self._cfg.wind_lr)
+        capacity_increase_mw = float(_expansion_kernel(current_cost_mwh, target_expansion, 500, 0.3, wholesale_price)) # Simplified average/dampening
+        row[3:6] = current_cost_mwh, capacity_increase_mw, self.current_wind_capacity_mw + capacity_increase_mw
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Wind Expansion: Cost $%.2f/MWh, Increase %.0f MW, Total %.0f MW", current_cost_mwh, capacity_increase_mw, row[5])
 
     def _simulate_bioenergy_utilization(self, year, policy_support):
         # Placeholder: Model residue collection, MSW projects, biogas scaling.
         capacity_increase_mw = 10 # Small example increase
-        print(f"  - Bioenergy Utilization: Increase {capacity_increase_mw:.0f} MW")
-        return {'capacity_increase_mw': capacity_increase_mw}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Bioenergy Utilization: Increase %.0f MW", capacity_increase_mw)
+        return BioenergyUtilization(capacity_increase_mw)
 
     def _simulate_hydropower_optimization(self, year, cross_border_agreements):
         # Placeholder: Model micro-hydro, cross-border imports, pumped storage feasibility.
         capacity_increase_mw = 5 # Small example domestic increase
         imports_mw = cross_border_agreements.get('hydro_import_mw', 500)
-        print(f"  - Hydropower Optimization: Domestic Increase {capacity_increase_mw:.0f} MW, Imports {imports_mw} MW")
-        return {'domestic_capacity_increase_mw': capacity_increase_mw, 'imports_mw': imports_mw}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Hydropower Optimization: Domestic Increase %.0f MW, Imports %s MW", capacity_increase_mw, imports_mw)
+        return HydropowerOptimization(capacity_increase_mw, imports_mw)
 
-    def _assess_grid_integration_challenges(self, year, total_vre_capacity_mw, grid_status):
+    def _assess_grid_integration_challenges(self, year, total_vre_capacity_mw, grid_status, row):
         # Placeholder: Model VRE forecasting accuracy, flexibility needs, curtailment risk.
         total_capacity_mw = grid_status.get('total_system_capacity_mw', 25000) # Need total system capacity
-        vre_penetration = total_vre_capacity_mw / total_capacity_mw if total_capacity_mw > 0 else 0
-        max_penetration = self.integration_params.get('max_vre_penetration', 0.5) # From config
-        curtailment_factor = max(0, (vre_penetration - max_penetration) * 2) # Example: Curtailment increases sharply above limit
-        forecasting_accuracy = min(0.95, 0.8 + 0.01 * (year - 2025)) # Example improvement
-        print(f"  - Grid Integration: VRE Penetration {vre_penetration*100:.1f}%, Curtailment Factor {curtailment_factor:.2f}")
-        return {'vre_penetration_level': vre_penetration, 'estimated_curtailment_factor': curtailment_factor, 'forecasting_accuracy': forecasting_accuracy}
+        max_penetration = self._cfg.max_vre_penetration # From config
+        row[6:9] = _grid_integration_kernel(year, total_vre_capacity_mw, total_capacity_mw, max_penetration)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - Grid Integration: VRE Penetration %.1f%%, Curtailment Factor %.2f", row[6]*100, row[7])
 
     def simulate_transition(self, year, policy_support, cost_trajectories, grid_integration_capabilities, market_conditions, cross_border_agreements):
         """
@@ -86,19 +336,38 @@ class RenewableTransitionModel:
             cross_border_agreements (dict): Status of agreements affecting hydro imports, etc.
 
         Returns:
-            dict: Summary of RE expansion and integration status for the year.
+            TransitionSummary: RE expansion and integration status for the year. Repeated inputs
+                               return the memoized (immutable) summary.
         """
-        print(f"Simulating renewable transition for year {year}...")
+        logger.info("Simulating renewable transition for year %s...", year)
+
+        # Every value the summary depends on; a repeat of all of them reuses the stored summary
+        key = (self._memo_scope, year, policy_support.get('solar_target_mw', 500), policy_support.get('wind_target_mw', 100),
+               market_conditions.get('wholesale_price_mwh', 60),
+               grid_integration_capabilities.get('total_generation_capacity_mw', 25000),
+               cross_border_agreements.get('hydro_import_mw', 500),
+               self.current_solar_capacity_mw, self.current_wind_capacity_mw)
+        offset = year - self._cost_year0
+        in_horizon = 0 <= offset < len(self._transition_out)
+        cached = self._memo.get(key)
+        if cached is not None:
+            transition_summary, row = cached
+            self.current_solar_capacity_mw, self.current_wind_capacity_mw = float(row[2]), float(row[5])
+            if in_horizon:
+                self._transition_out[offset] = row
+            return transition_summary
 
-        # Simulate expansion for each RE type
-        solar_results = self._simulate_solar_expansion(year, policy_support, market_conditions)
-        wind_results = self._simulate_wind_expansion(year, policy_support, market_conditions)
+        # Simulate expansion for each RE type; solar, wind and integration outputs (including the new
+        # installed capacities) go into the year's row, and the model state is updated once at the end
+        row = self._row
+        self._simulate_solar_expansion(year, policy_support, market_conditions, row)
+        self._simulate_wind_expansion(year, policy_support, market_conditions, row)
         bio_results = self._simulate_bioenergy_utilization(year, policy_support)
         hydro_results = self._simulate_hydropower_optimization(year, cross_border_agreements)
 
         # Calculate total VRE (Variable Renewable Energy) capacity for integration assessment
         # Note: Need the *current* total capacity from the GenerationPortfolioModel ideally, using internal tracking for now
-        total_vre_capacity_mw = self.current_solar_capacity_mw + self.current_wind_capacity_mw
+        total_vre_capacity_mw = row[2] + row[5]
 
         # Assess integration challenges
         # Need total system capacity and flexibility info from Grid/Generation model
@@ -107,31 +376,63 @@ class RenewableTransitionModel:
             'total_system_capacity_mw': grid_integration_capabilities.get('total_generation_capacity_mw', 25000), # Placeholder
             'flexibility_score': grid_integration_capabilities.get('flexibility_score', 0.5) # Placeholder
         }
-        integration_results = self._assess_grid_integration_challenges(year, total_vre_capacity_mw, grid_status_input)
-
-        # Combine results
-        transition_summary = {
-            'solar': solar_results,
-            'wind': wind_results,
-            'bioenergy': bio_results,
-            'hydro': hydro_results,
-            'grid_integration': integration_results,
-            # Aggregate increases for feedback to GenerationPortfolioModel
-            'total_capacity_increase_mw': {
-                'solar': solar_results['capacity_increase_mw'],
-                'wind': wind_results['capacity_increase_mw'],
-                'bioenergy': bio_results['capacity_increase_mw'],
-                'hydro_domestic': hydro_results['domestic_capacity_increase_mw']
-            }
-        }
+        self._assess_grid_integration_challenges(year, total_vre_capacity_mw, grid_status_input, row)
+        if in_horizon:
+            self._transition_out[offset] = row
 
-        print(f"Renewable transition simulation complete for {year}.")
+        # Combine results, read back from the row once
+        (solar_lcoe, solar_increase, solar_capacity, wind_lcoe, wind_increase, wind_capacity,
+         vre_penetration, curtailment_factor, forecasting_accuracy) = row.tolist()
+        self.current_solar_capacity_mw, self.current_wind_capacity_mw = solar_capacity, wind_capacity
+        transition_summary = TransitionSummary(
+            solar=SolarExpansion(solar_increase, solar_lcoe),
+            wind=WindExpansion(wind_increase, wind_lcoe),
+            bioenergy=bio_results,
+            hydro=hydro_results,
+            grid_integration=GridIntegration(vre_penetration, curtailment_factor, forecasting_accuracy),
+            total_capacity_increase_mw=CapacityIncreases(
+                solar=solar_increase,
+                wind=wind_increase,
+                bioenergy=bio_results.capacity_increase_mw,
+                hydro_domestic=hydro_results.domestic_capacity_increase_mw,
+            ),
+        )
+
+        self._memo.put(key, (transition_summary, row.copy()))
+        logger.info("Renewable transition simulation complete for %s.", year)
         # Return structure similar to placeholder in main_simulation for now
         # return {
-        #     "solar_capacity_increase": solar_results['capacity_increase_mw'],
-        #     "wind_capacity_increase": wind_results['capacity_increase_mw'],
-        #     "curtailment_rate": integration_results['estimated_curtailment_factor']
+        #     "solar_capacity_increase": solar_increase,
+        #     "wind_capacity_increase": wind_increase,
+        #     "curtailment_rate": curtailment_factor
         # }
         return transition_summary # Return detailed summary
 
+    def simulate_transition_batch(self, years, wholesale_price_mwh=60, solar_target_mw=500, wind_target_mw=100,
+                                  total_system_capacity_mw=25000):
+        """
+        Evaluates the solar/wind expansion and grid integration formulas over many years and scenarios at once.
+
+        Years run along the last axis: ``years`` has shape (n_years,) and every other driver may be a
+        scalar or an array broadcastable to (..., n_years), e.g. (n_scenarios, n_years). Capacity
+        accumulates from the model's current solar and wind capacity, which is not updated.
+
+        Args:
+            years (array-like): Consecutive simulation years.
+            wholesale_price_mwh: Wholesale price signal ($/MWh).
+            solar_target_mw: Policy solar target per year (MW).
+            wind_target_mw: Policy wind target per year (MW).
+            total_system_capacity_mw: Total system capacity used for the VRE penetration (MW).
+
+        Returns:
+            dict: Arrays keyed 'solar_lcoe_mwh', 'solar_capacity_increase_mw', 'solar_capacity_mw',
+                  the same three for wind, 'vre_penetration_level', 'estimated_curtailment_factor'
+                  and 'forecasting_accuracy'.
+        """
+        cfg = self._cfg
+        return _transition_trajectories(
+            years, cfg.solar_base_cost_mwh, cfg.wind_base_cost_mwh, cfg.solar_lr, cfg.wind_lr, cfg.max_vre_penetration,
+            self.current_solar_capacity_mw, self.current_wind_capacity_mw,
+            wholesale_price_mwh, solar_target_mw, wind_target_mw, total_system_capacity_mw)
+
     # Add methods for specific technology details (e.g., storage pairing) later 
\ No newline at end of file
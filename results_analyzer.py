@@ -1,60 +1,195 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from plotly.offline import get_plotlyjs_version
 import os
 import json # Keep for printing examples if needed
+import functools
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, is_dataclass
+
+def _items(record):
+    """(key, value) pairs of a Mapping (e.g. MappingProxyType) or a result dataclass, by field name."""
+    if is_dataclass(record):
+        return [(f.name, getattr(record, f.name)) for f in fields(record)]
+    return record.items()
+
+def _flatten(d, prefix='', out=None, sep='_'):
+    """
+    Flatten a nested yearly record into {'outer_inner': leaf}, descending into Mappings and
+    result dataclasses. Columns come out as pd.json_normalize(sep='_') names and orders them:
+    top-level leaves first, then each nested section in turn; empty sections vanish.
+    """
+    if out is None:
+        out = {}
+        nested = []
+        for k, v in _items(d):
+            if isinstance(v, Mapping) or is_dataclass(v):
+                nested.append((k, v))
+            else:
+                out[f"{prefix}{k}"] = v
+        for k, v in nested:
+            _flatten(v, f"{prefix}{k}{sep}", out, sep)
+        return out
+    for k, v in _items(d):
+        if isinstance(v, Mapping) or is_dataclass(v):
+            _flatten(v, f"{prefix}{k}{sep}", out, sep)
+        else:
+            out[f"{prefix}{k}"] = v
+    return out
+
+# Column groups read by the plot methods, matched once per scenario frame
+PLOT_COLUMN_PATTERNS = {
+    'generation_mix': re.compile(r'generation_dispatch_generation_mix_gwh_'),
+    'capacity': re.compile(r'start_of_year_capacity_'),
+    'capacity_details': re.compile(r'generation_dispatch_capacity_details_'),
+}
+
+def _column_groups(columns):
+    """Names in ``columns`` starting with each PLOT_COLUMN_PATTERNS prefix, by group, in frame order."""
+    return {group: [c for c in columns if isinstance(c, str) and pattern.match(c)]
+            for group, pattern in PLOT_COLUMN_PATTERNS.items()}
+
+def _column_block(df, cols):
+    """
+    The columns ``cols`` of ``df`` as (short names after the last '_', float64 values of shape
+    (years, columns)). Reads the block into one array without an intermediate renamed frame.
+    """
+    return [c.rsplit('_', 1)[-1] for c in cols], df[cols].to_numpy(dtype=np.float64, copy=False)
+
+def _cached_per_scenario(method):
+    """
+    Memoize ``method(self, scenario)`` in the analyzer's cache under (scenario, method name).
+    The cache is cleared whenever ``results`` is replaced; cached metrics and figures are
+    shared between callers and must be treated as read-only.
+    """
+    name = method.__name__
+    @functools.wraps(method)
+    def wrapper(self, scenario='baseline'):
+        key = (scenario, name)
+        if key not in self._cache:
+            self._cache[key] = method(self, scenario)
+        return self._cache[key]
+    return wrapper
 
 class EnergyResultsAnalyzer:
     """Analyze and visualize energy simulation results."""
+    __slots__ = ('_results', '_processed', '_combined', '_col_groups', '_cache')
+
     def __init__(self, results_data):
         """
         Initialize the analyzer with simulation results.
         Args:
             results_data (dict): The output dictionary from BangladeshEnergySimulation.run_simulation.
-                                 Expected structure: {scenario_name: [yearly_results_list]}
+                                 Expected structure: {scenario_name: DataFrame} with a 'year' column,
+                                 {scenario_name: {column_name: array_over_years}},
+                                 {scenario_name: parquet_path} when results were streamed to disk,
+                                 or the older {scenario_name: [yearly_results_list]}
         """
         if not isinstance(results_data, dict) or not results_data:
              raise ValueError("Invalid results_data format. Expected a non-empty dictionary.")
         self.results = results_data
-        self.processed_data = self._process_results_to_dataframe()
         print(f"EnergyResultsAnalyzer initialized with results for scenarios: {list(results_data.keys())}")
 
+    @property
+    def results(self):
+        """
+        Results by scenario: the raw results until a scenario is processed, then its processed frame.
+        Assigning new results drops processed frames and cached metrics and plots.
+        """
+        return self._results
+
+    @results.setter
+    def results(self, results_data):
+        # Own copy of the mapping, so processed scenarios can release their raw results
+        self._results = dict(results_data)
+        # Scenarios whose entry in _results is already the processed frame, see get_scenario_dataframe
+        self._processed = set()
+        self._combined = None # All scenarios in one frame, see get_combined_dataframe
+        # Plot column groups by scenario, see _plot_columns
+        self._col_groups = {}
+        # Metrics and figures by (scenario, method name), see _cached_per_scenario
+        self._cache = {}
+
+    @property
+    def processed_data(self):
+        """Processed DataFrames of every scenario, processing any not used yet."""
+        return self._process_results_to_dataframe()
+
     def _process_results_to_dataframe(self):
         """
-        Processes the raw list-of-dicts results into pandas DataFrames for easier analysis.
+        Processes the raw results of every scenario into pandas DataFrames for easier analysis.
         Returns:
             dict: A dictionary where keys are scenario names and values are pandas DataFrames
                   containing the yearly simulation results, flattened.
         """
-        processed = {}
-        for scenario, yearly_results_list in self.results.items():
-            if not yearly_results_list:
-                print(f"Warning: Scenario '{scenario}' has no results.")
-                processed[scenario] = pd.DataFrame()
-                continue
-            # Use json_normalize for flattening the nested dictionaries
-            try:
-                df = pd.json_normalize(yearly_results_list, sep='_')
-                # Ensure 'year' column exists and set as index
-                if 'year' in df.columns:
-                    df['year'] = pd.to_numeric(df['year']) # Ensure year is numeric
-                    df = df.set_index('year')
-                else:
-                     print(f"Warning: 'year' column not found for scenario '{scenario}'. Index not set.")
-                processed[scenario] = df
-            except Exception as e:
-                print(f"Error processing results for scenario '{scenario}': {e}")
-                processed[scenario] = pd.DataFrame() # Assign empty df on error
-
-        return processed
+        return {scenario: self.get_scenario_dataframe(scenario) for scenario in self.results}
+
+    def _process_one(self, scenario):
+        """
+        Processes one scenario's raw results (frame, columnar arrays, Parquet path or list-of-dicts)
+        into a pandas DataFrame of the flattened yearly results, indexed by year.
+        """
+        scenario_results = self.results[scenario]
+        if len(scenario_results) == 0:
+            print(f"Warning: Scenario '{scenario}' has no results.")
+            return pd.DataFrame()
+        try:
+            if isinstance(scenario_results, pd.DataFrame):
+                # Already flattened by the simulation
+                df = scenario_results
+            elif isinstance(scenario_results, (str, os.PathLike)):
+                # Streamed to disk by run_simulation(results_dir=...); load on use
+                df = pd.read_parquet(scenario_results)
+            elif isinstance(scenario_results, Mapping):
+                # Already flattened into one array per column
+                df = pd.DataFrame(scenario_results)
+            else:
+                # Flatten the nested yearly records directly, one flat dict per year
+                df = pd.DataFrame([_flatten(r) for r in scenario_results])
+            # Ensure 'year' column exists and set as index
+            if 'year' in df.columns:
+                df = df.set_index('year')
+                df.index = pd.to_numeric(df.index) # Ensure year is numeric
+            elif df.index.name != 'year': # A frame processed earlier is already indexed by year
+                 print(f"Warning: 'year' column not found for scenario '{scenario}'. Index not set.")
+            return df
+        except Exception as e:
+            print(f"Error processing results for scenario '{scenario}': {e}")
+            return pd.DataFrame() # Empty df on error
 
     def get_scenario_dataframe(self, scenario='baseline'):
-        """Access the processed DataFrame for a specific scenario."""
-        if scenario not in self.processed_data:
+        """Access the processed DataFrame for a specific scenario, processing its results on first use."""
+        if scenario not in self.results:
             print(f"Error: Processed data for scenario '{scenario}' not found.")
             return None
-        return self.processed_data[scenario]
+        if scenario not in self._processed:
+            # The processed frame replaces the raw results, so only one copy is kept
+            self._results[scenario] = self._process_one(scenario)
+            self._processed.add(scenario)
+        return self._results[scenario]
+
+    def _plot_columns(self, scenario, group):
+        """Columns of the scenario's frame in the PLOT_COLUMN_PATTERNS ``group``; all groups are matched on first use."""
+        groups = self._col_groups.get(scenario)
+        if groups is None:
+            groups = self._col_groups[scenario] = _column_groups(self.get_scenario_dataframe(scenario).columns)
+        return groups[group]
+
+    def get_combined_dataframe(self):
+        """
+        All scenarios' processed results in one DataFrame indexed by (scenario, year), built once
+        with a single pd.concat. Use it for cross-scenario comparisons, e.g.
+        ``df.groupby(level='scenario')[column].agg(...)``; columns missing from a scenario are NaN.
+        """
+        if self._combined is None:
+            self._combined = pd.concat(self.processed_data, names=['scenario', 'year'])
+        return self._combined
 
+    @_cached_per_scenario
     def generate_energy_security_metrics(self, scenario='baseline'):
         """
         Calculate energy security indicators for a given scenario.
@@ -68,20 +203,18 @@ class EnergyResultsAnalyzer:
             print(f"Error: Scenario '{scenario}' not found in results.")
             return None
 
-        yearly_metrics = []
-        for year_data in self.results[scenario]:
-            # Placeholder calculations - needs actual data fields
-            import_dependency = year_data.get('fuel', {}).get('import_share', 0.5) # Example
-            reserve_margin = year_data.get('generation', {}).get('reserve_margin', 0.15) # Example
-            yearly_metrics.append({
-                'year': year_data['year'],
-                'import_dependency': import_dependency,
-                'reserve_margin': reserve_margin
-            })
+        df = self.get_scenario_dataframe(scenario)
+        # Placeholder calculations - needs actual data fields; whole columns at once, one record per year
+        metrics = pd.DataFrame({
+            'import_dependency': df['fuel_import_share'] if 'fuel_import_share' in df else 0.5, # Example
+            'reserve_margin': df['generation_reserve_margin'] if 'generation_reserve_margin' in df else 0.15, # Example
+        }, index=df.index)
+        yearly_metrics = metrics.rename_axis('year').reset_index().to_dict(orient='records')
 
         print("Energy security metrics generated.")
         return {scenario: yearly_metrics}
 
+    @_cached_per_scenario
     def analyze_transition_pathways(self, scenario='baseline'):
         """
         Assess energy transition trajectories (e.g., generation mix, emissions).
@@ -95,18 +228,26 @@ class EnergyResultsAnalyzer:
             print(f"Error: Scenario '{scenario}' not found in results.")
             return None
 
-        pathway_data = []
-        for year_data in self.results[scenario]:
-            # Placeholder calculations
-            generation_mix = year_data.get('generation', {}).get('mix', {'gas': 0.6, 'coal': 0.3, 'renewables': 0.1}) # Example
-            emissions = year_data.get('environmental_impact', {}).get('total_co2_emissions', 0)
-            renewable_share = generation_mix.get('renewables', 0)
-            pathway_data.append({
-                'year': year_data['year'],
-                'generation_mix': generation_mix,
-                'total_co2_emissions': emissions,
-                'renewable_share': renewable_share
-            })
+        df = self.get_scenario_dataframe(scenario)
+        emissions_col = 'environmental_impact_total_co2_emissions'
+        mix_prefix = 'generation_mix_'
+        # Placeholder calculations
+        default_mix = {'gas': 0.6, 'coal': 0.3, 'renewables': 0.1} # Example, for years without a reported mix
+        mix_cols = [c for c in df.columns if isinstance(c, str) and c.startswith(mix_prefix)]
+        if mix_cols:
+            # One block for all mix columns; NaN marks a technology absent that year
+            names = [c[len(mix_prefix):] for c in mix_cols]
+            generation_mixes = [{name: share for name, share in zip(names, row) if not np.isnan(share)} or dict(default_mix)
+                                for row in df[mix_cols].to_numpy(dtype=np.float64).tolist()]
+        else:
+            generation_mixes = [dict(default_mix) for _ in range(len(df))]
+        emissions = df[emissions_col].tolist() if emissions_col in df else [0] * len(df)
+        pathway_data = [{
+            'year': year,
+            'generation_mix': generation_mix,
+            'total_co2_emissions': total_co2_emissions,
+            'renewable_share': generation_mix.get('renewables', 0)
+        } for year, generation_mix, total_co2_emissions in zip(df.index.tolist(), generation_mixes, emissions)]
 
         print("Transition pathway analysis complete.")
         return {scenario: pathway_data}
@@ -139,29 +280,28 @@ class EnergyResultsAnalyzer:
 
     # --- Plotting Methods --- 
 
+    @_cached_per_scenario
     def plot_generation_mix(self, scenario='baseline'):
         """Generate plot of generation mix (GWh) over time."""
         df = self.get_scenario_dataframe(scenario)
         if df is None or df.empty:
             return None
         
-        # Identify generation mix columns (assuming prefix 'generation_dispatch_generation_mix_gwh_')
-        gen_cols = [col for col in df.columns if col.startswith('generation_dispatch_generation_mix_gwh_')]
-        if not gen_cols:
+        # Select generation mix columns (assuming prefix 'generation_dispatch_generation_mix_gwh_'),
+        # named by technology for clarity
+        techs, values = _column_block(df, self._plot_columns(scenario, 'generation_mix'))
+        if not techs:
             print(f"Warning: No generation mix columns found for scenario '{scenario}'.")
             return None
-        
-        gen_df = df[gen_cols].copy()
-        # Rename columns for clarity
-        gen_df.columns = [col.split('_')[-1] for col in gen_cols]
 
-        fig = go.Figure()
-        for tech in gen_df.columns:
-            fig.add_trace(go.Bar(
-                x=gen_df.index, 
-                y=gen_df[tech],
-                name=tech
-            ))
+        # Plain ndarrays (float64 values) so Plotly serializes each trace as one buffer;
+        # the figure is built from the full trace list in one go
+        x = df.index.to_numpy()
+        fig = go.Figure(data=[go.Bar(
+            x=x,
+            y=values[:, i],
+            name=tech
+        ) for i, tech in enumerate(techs)])
         
         fig.update_layout(
             title=f'Generation Mix by Technology (GWh) - {scenario}',
@@ -171,38 +311,30 @@ class EnergyResultsAnalyzer:
         )
         return fig
 
+    @_cached_per_scenario
     def plot_installed_capacity(self, scenario='baseline'):
         """Generate plot of installed capacity (MW) over time."""
         df = self.get_scenario_dataframe(scenario)
         if df is None or df.empty:
             return None
         
-        # Identify capacity columns (assuming prefix 'start_of_year_capacity_')
-        cap_cols = [col for col in df.columns if col.startswith('start_of_year_capacity_')]
-        if not cap_cols:
+        # Select capacity columns (assuming prefix 'start_of_year_capacity_'), named by technology
+        techs, values = _column_block(df, self._plot_columns(scenario, 'capacity'))
+        if not techs:
              # Fallback: Try finding capacity from generation dispatch results
-             cap_cols = [col for col in df.columns if col.startswith('generation_dispatch_capacity_details_')]
-             if not cap_cols:
+             techs, values = _column_block(df, self._plot_columns(scenario, 'capacity_details'))
+             if not techs:
                  print(f"Warning: No capacity columns found for scenario '{scenario}'.")
                  return None
-             # Rename based on fallback structure
-             cap_df = df[cap_cols].copy()
-             cap_df.columns = [col.split('_')[-1] for col in cap_cols]
-        else:
-            # Rename based on primary structure
-            cap_df = df[cap_cols].copy()
-            cap_df.columns = [col.split('_')[-1] for col in cap_cols]
-            
 
-        fig = go.Figure()
-        for tech in cap_df.columns:
-             fig.add_trace(go.Scatter(
-                 x=cap_df.index, 
-                 y=cap_df[tech],
-                 mode='lines+markers', 
-                 name=tech,
-                 stackgroup='one' # Create stacked area chart
-             ))
+        x = df.index.to_numpy()
+        fig = go.Figure(data=[go.Scatter(
+            x=x,
+            y=values[:, i],
+            mode='lines+markers',
+            name=tech,
+            stackgroup='one' # Create stacked area chart
+        ) for i, tech in enumerate(techs)])
         
         fig.update_layout(
             title=f'Installed Capacity by Technology (MW) - {scenario}',
@@ -211,6 +343,7 @@ class EnergyResultsAnalyzer:
         )
         return fig
 
+    @_cached_per_scenario
     def plot_emissions(self, scenario='baseline'):
         """Generate plot of CO2 emissions over time."""
         df = self.get_scenario_dataframe(scenario)
@@ -220,8 +353,8 @@ class EnergyResultsAnalyzer:
 
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df['environmental_impact_ghg_emissions_total_co2eq_tonnes'] / 1e6, # Convert to Million Tonnes
+            x=df.index.to_numpy(),
+            y=df['environmental_impact_ghg_emissions_total_co2eq_tonnes'].to_numpy(dtype=np.float64) / 1e6, # Convert to Million Tonnes
             mode='lines+markers',
             name='Total CO2eq Emissions'
         ))
@@ -232,6 +365,7 @@ class EnergyResultsAnalyzer:
         )
         return fig
 
+    @_cached_per_scenario
     def plot_access_rates(self, scenario='baseline'):
         """Generate plot of electricity access rates over time."""
         df = self.get_scenario_dataframe(scenario)
@@ -244,26 +378,35 @@ class EnergyResultsAnalyzer:
             'Rural': 'energy_access_aggregate_access_rates_rural'
         }
         
-        fig = go.Figure()
+        present = {}
         for name, col in access_cols.items():
             if col in df.columns:
-                fig.add_trace(go.Scatter(
-                    x=df.index,
-                    y=df[col] * 100, # Convert to percentage
-                    mode='lines+markers',
-                    name=name
-                ))
+                present[name] = col
             else:
                 print(f"Warning: Access rate column '{col}' not found for scenario '{scenario}'.")
-
+        # All rates as one (years, series) block, scaled to percent in a single operation
+        rates = df[list(present.values())].to_numpy(dtype=np.float64)
+        percent = rates * 100
+
+        x = df.index.to_numpy()
+        fig = go.Figure(data=[go.Scatter(x=x, y=percent[:, i], mode='lines+markers', name=name)
+                              for i, name in enumerate(present)])
+
+        # Lower bound from the lowest rural rate; NaN years are ignored and an all-NaN column falls back to 90%
+        y_min = 90
+        if 'Rural' in present:
+            rural = rates[:, list(present).index('Rural')]
+            if not np.isnan(rural).all():
+                y_min = np.nanmin(rural) * 99
         fig.update_layout(
             title=f'Electricity Access Rates (%) - {scenario}',
             xaxis_title='Year',
             yaxis_title='Access Rate (%)',
-            yaxis_range=[df[access_cols['Rural']].min()*99 if access_cols['Rural'] in df else 90, 101] # Adjust range
+            yaxis_range=[y_min, 101] # Adjust range
         )
         return fig
 
+    @_cached_per_scenario
     def plot_investment_gap(self, scenario='baseline'):
         """Generate plot of energy investment needs vs mobilized funds."""
         df = self.get_scenario_dataframe(scenario)
@@ -278,12 +421,15 @@ class EnergyResultsAnalyzer:
             print(f"Warning: Investment data columns not found for scenario '{scenario}'.")
             return None
 
-        fig = go.Figure()
-        fig.add_trace(go.Bar(x=df.index, y=df[mobilized_col], name='Mobilized Investment'))
-        # Use scatter for needs to show the target line clearly
-        fig.add_trace(go.Scatter(x=df.index, y=df[needs_col], mode='lines+markers', name='Investment Needs', line=dict(dash='dash')))
-        # Optional: Plot the gap as a separate bar or line
-        fig.add_trace(go.Bar(x=df.index, y=df[gap_col], name='Financing Gap', marker_color='red'))
+        x = df.index.to_numpy()
+        mobilized, needs, gap = df[[mobilized_col, needs_col, gap_col]].to_numpy(dtype=np.float64).T
+        fig = go.Figure(data=[
+            go.Bar(x=x, y=mobilized, name='Mobilized Investment'),
+            # Use scatter for needs to show the target line clearly
+            go.Scatter(x=x, y=needs, mode='lines+markers', name='Investment Needs', line=dict(dash='dash')),
+            # Optional: Plot the gap as a separate bar or line
+            go.Bar(x=x, y=gap, name='Financing Gap', marker_color='red'),
+        ])
         
         fig.update_layout(
             title=f'Energy Sector Investment (Million USD) - {scenario}',
@@ -295,6 +441,25 @@ class EnergyResultsAnalyzer:
 
     # --- HTML Report Generation --- 
 
+    def _figure_html(self, scenario, plot_name):
+        """
+        Embeddable HTML for the figure built by the ``plot_name`` method, or None if it could not be
+        generated: an empty div plus one Plotly.newPlot call on the figure JSON, which is far smaller
+        than to_html's wrapper markup. Serialized once per scenario and cached with the figures, since
+        serialization dominates report time.
+        """
+        key = (scenario, f'{plot_name}_html')
+        if key not in self._cache:
+            fig = getattr(self, plot_name)(scenario)
+            # plotly.js itself is loaded once by the report's <head> script tag. The div id is the plot
+            # method's name, unique within a report; to_json escapes '</' so the JSON is safe in a script.
+            self._cache[key] = (
+                f'<div id="{plot_name}" class="plotly-graph-div" style="height:100%; width:100%;"></div>'
+                f'<script>(function(f){{Plotly.newPlot("{plot_name}", f.data, f.layout, {{"responsive": true}});}})'
+                f'({fig.to_json()});</script>'
+            ) if fig else None
+        return self._cache[key]
+
     def generate_html_report(self, scenario='baseline', output_dir='results'):
         """
         Generates an HTML report summarizing simulation results for a scenario,
@@ -318,15 +483,16 @@ class EnergyResultsAnalyzer:
         report_filename = f"simulation_report_{scenario}.html"
         report_path = os.path.join(output_dir, report_filename)
 
-        # Generate plots
-        fig_gen_mix = self.plot_generation_mix(scenario)
-        fig_capacity = self.plot_installed_capacity(scenario)
-        fig_emissions = self.plot_emissions(scenario)
-        fig_access = self.plot_access_rates(scenario)
-        fig_investment = self.plot_investment_gap(scenario)
+        # Generate plots (as cached embeddable HTML)
+        html_gen_mix = self._figure_html(scenario, 'plot_generation_mix')
+        html_capacity = self._figure_html(scenario, 'plot_installed_capacity')
+        html_emissions = self._figure_html(scenario, 'plot_emissions')
+        html_access = self._figure_html(scenario, 'plot_access_rates')
+        html_investment = self._figure_html(scenario, 'plot_investment_gap')
 
-        # --- Assemble HTML --- 
-        html_content = f"""\
+        # --- Write HTML --- 
+        # Streamed section by section, so the full document is never held as one string
+        head = f"""\
 <!DOCTYPE html>
 <html>
 <head>
@@ -336,52 +502,65 @@ class EnergyResultsAnalyzer:
         h1, h2 {{ color: #333; }}
         .plot-container {{ margin-bottom: 40px; border: 1px solid #ddd; padding: 10px; }}
     </style>
-    <script src='https://cdn.plot.ly/plotly-latest.min.js'></script>
+    <script src='https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js'></script>
 </head>
 <body>
 
 <h1>Bangladesh Energy Simulation Results</h1>
 <h2>Scenario: {scenario}</h2>
-
-<div class="plot-container">
-    <h2>Installed Capacity</h2>
-    {fig_capacity.to_html(full_html=False, include_plotlyjs='cdn') if fig_capacity else '<p>Capacity plot could not be generated.</p>'}
-</div>
-
-<div class="plot-container">
-    <h2>Generation Mix</h2>
-    {fig_gen_mix.to_html(full_html=False, include_plotlyjs='cdn') if fig_gen_mix else '<p>Generation mix plot could not be generated.</p>'}
-</div>
-
-<div class="plot-container">
-    <h2>GHG Emissions</h2>
-    {fig_emissions.to_html(full_html=False, include_plotlyjs='cdn') if fig_emissions else '<p>Emissions plot could not be generated.</p>'}
-</div>
-
-<div class="plot-container">
-    <h2>Electricity Access Rates</h2>
-    {fig_access.to_html(full_html=False, include_plotlyjs='cdn') if fig_access else '<p>Access rates plot could not be generated.</p>'}
-</div>
-
-<div class="plot-container">
-    <h2>Energy Sector Investment</h2>
-    {fig_investment.to_html(full_html=False, include_plotlyjs='cdn') if fig_investment else '<p>Investment plot could not be generated.</p>'}
-</div>
-
-</body>
-</html>
 """
-
-        # Write HTML to file
+        sections = (
+            ('Installed Capacity', html_capacity, 'Capacity plot could not be generated.'),
+            ('Generation Mix', html_gen_mix, 'Generation mix plot could not be generated.'),
+            ('GHG Emissions', html_emissions, 'Emissions plot could not be generated.'),
+            ('Electricity Access Rates', html_access, 'Access rates plot could not be generated.'),
+            ('Energy Sector Investment', html_investment, 'Investment plot could not be generated.'),
+        )
         try:
             with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.write(head)
+                for title, html, fallback in sections:
+                    f.write(f'\n<div class="plot-container">\n    <h2>{title}</h2>\n    ')
+                    f.write(html if html else f'<p>{fallback}</p>')
+                    f.write('\n</div>\n')
+                f.write('\n</body>\n</html>\n')
             print(f"Report successfully saved to {report_path}")
             return report_path
         except Exception as e:
             print(f"Error writing HTML report file: {e}")
             return None
 
+    def generate_all_reports(self, scenarios=None, output_dir='results', workers=None):
+        """
+        Generates the HTML reports of several scenarios, in parallel worker processes.
+
+        Reports are independent, so each worker gets only its scenario's results (a frame,
+        column arrays or a Parquet path) and renders and writes the report itself.
+
+        Args:
+            scenarios (list, optional): Scenario names to report; defaults to every scenario in results.
+            output_dir (str): The directory to save the report files in.
+            workers (int, optional): Maximum worker processes (default: one per scenario, up to the
+                                     CPU count). 1 renders the reports in this process, using the
+                                     analyzer's caches.
+
+        Returns:
+            dict: {scenario: path to the generated HTML file, or None if it failed}, in request order.
+        """
+        scenarios = list(self.results) if scenarios is None else list(scenarios)
+        known = [s for s in scenarios if s in self.results]
+        max_workers = min(len(known), workers or os.cpu_count() or 1)
+        if max_workers < 2:
+            return {s: self.generate_html_report(s, output_dir) for s in scenarios}
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {s: ex.submit(_generate_report_worker, s, self.results[s], output_dir) for s in known}
+        # Unknown scenarios go through generate_html_report here, which reports the error
+        return {s: futures[s].result() if s in futures else self.generate_html_report(s, output_dir) for s in scenarios}
+
+def _generate_report_worker(scenario, scenario_results, output_dir):
+    """Builds one scenario's HTML report in a worker process from that scenario's results alone."""
+    return EnergyResultsAnalyzer({scenario: scenario_results}).generate_html_report(scenario, output_dir)
+
 # Example Usage (assumes 'results' dict exists from main_simulation run):
 if __name__ == "__main__":
     # Dummy results data matching the expected structure
@@ -410,8 +589,5 @@ if __name__ == "__main__":
     print("\nDashboard Data Structure (Baseline):")
     print(json.dumps(dash_data, indent=2))
 
-    report_file = analyzer.generate_html_report(scenario='baseline')
-    print(f"Report generated: {report_file}")
-
-    report_file_hr = analyzer.generate_html_report(scenario='high_renewables')
-    print(f"Report generated: {report_file_hr}") 
\ No newline at end of file
+    for report_file in analyzer.generate_all_reports().values():
+        print(f"Report generated: {report_file}") 
\ No newline at end of file
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from data_handler import EnergyDataHandler
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return EnergyDataHandler({'data_dir': str(tmp_path), 'cache_dir': str(tmp_path / 'cache'), 'precision': 'fp64'})
+
+
+@pytest.fixture
+def loaded(handler, tmp_path):
+    (tmp_path / 'gen.csv').write_text(
+        "key,year,region,value\n"
+        "gen,2020,dhaka,1.5\n"
+        "gen,2021,dhaka,2.5\n"
+        "gen,2022,dhaka,3.5\n"
+        "gen,2021,khulna,4\n"
+    )
+    handler.load_historical_data(['gen'])
+    return handler
+
+
+def test_range_before_load_is_empty(handler):
+    assert handler.get_data_range('x').empty
+
+
+def test_range_for_unknown_region_is_empty(loaded):
+    assert loaded.get_data_range('gen', 2020, 2022, 'sylhet').empty
+
+
+def test_range_values_are_numeric(loaded):
+    values = loaded.get_data_range('gen', 2020, 2021, 'dhaka')
+
+    assert values.dtype == np.float64
+    assert values.sum() == 4.0
@@ -0,0 +1,19 @@
+from models.energy_finance import EnergyFinanceModel
+
+
+def _investment_needs(model, year, pipeline):
+    summary = model.simulate_financial_flows(
+        year=year, project_pipeline=pipeline, financing_sources={}, risk_mitigation_tools={},
+        grid_investment_needs={'annual_investment_m_usd': 0}, fiscal_space={}, investment_climate={},
+        climate_finance_access={}, local_market_depth={}, household_adoption={},
+    )
+    return summary.investment_needs.total_investment_needs_m_usd
+
+
+def test_pipeline_appended_in_place_is_picked_up():
+    model = EnergyFinanceModel({'investment_needs': {'cost_per_mw_new': 2.5}})
+    pipeline = [{'year': 2025, 'capacity': 100}]
+    assert _investment_needs(model, 2025, pipeline) == 250.0
+
+    pipeline.append({'year': 2026, 'capacity': 1000})
+    assert _investment_needs(model, 2026, pipeline) == 2500.0
@@ -0,0 +1,27 @@
+import pytest
+
+from models.grid_infrastructure import GridInfrastructureModel
+
+GRID_PARAMS = {
+    'loss_params': {'base_technical_loss': 0.06, 'base_non_technical_loss': 0.05},
+    'interconnection_params': {'base_import_capacity_mw': 1160},
+}
+
+
+def _run(start_year, n_years=3):
+    model = GridInfrastructureModel({**GRID_PARAMS, 'start_year': start_year, 'end_year': start_year + n_years - 1})
+    dispatch = {'total_generation_gwh': 100000}
+    return [model.simulate_grid_operations(year, dispatch, {}, {}, {}) for year in range(start_year, start_year + n_years)]
+
+
+@pytest.mark.parametrize('start_year', [2025, 2030])
+def test_trajectories_start_from_first_simulated_year(start_year):
+    results = _run(start_year)
+    technical, non_technical = 0.06, 0.05
+    for i, year_results in enumerate(results):
+        # Same recurrence as applying the yearly reductions from the base levels in the first year
+        technical *= 0.99
+        non_technical *= 1 - year_results['smart_grid']['smart_meter_penetration'] * 0.1
+        assert year_results['losses']['technical_losses_pct'] == pytest.approx(technical)
+        assert year_results['losses']['non_technical_losses_pct'] == pytest.approx(non_technical)
+        assert year_results['interconnections']['import_capacity_mw'] == 1160 + 100 * (i + 1)
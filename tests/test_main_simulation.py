@@ -0,0 +1,81 @@
+import logging
+
+import pandas as pd
+
+from main_simulation import BangladeshEnergySimulation
+
+# Small synthetic config: enough generation data for dispatch, everything else on model defaults
+CONFIG = {
+    'generation_params': {
+        'base_year_capacity': {'gas_cc': 8000, 'coal': 6000, 'solar_util': 800},
+        'technology_parameters': {
+            'gas_cc': {'vom_cost': 3, 'fuel_cost_mmbtu': 6, 'heat_rate_btu_kwh': 6560, 'co2_factor_t_mwh': 0.38},
+            'coal': {'vom_cost': 4, 'co2_factor_t_mwh': 0.95},
+            'solar_util': {'vom_cost': 5, 'co2_factor_t_mwh': 0.02},
+        },
+        'expansion_pipeline': [{'year': 2026, 'tech': 'solar_util', 'capacity': 600}],
+        'dispatch_merit_order': ['solar_util', 'gas_cc', 'coal'],
+    },
+}
+
+SCENARIOS = [
+    {'name': 'baseline', 'config_overrides': {}},
+    {'name': 'high_growth', 'config_overrides': {'economic_growth_rate': 0.08}},
+]
+
+
+def test_parallel_matches_serial():
+    serial = BangladeshEnergySimulation(CONFIG).run_simulation(2025, 2030, SCENARIOS)
+    parallel = BangladeshEnergySimulation(CONFIG).run_simulation(2025, 2030, SCENARIOS, parallel=True)
+
+    assert list(serial) == list(parallel) == ['baseline', 'high_growth']
+    for name in serial:
+        pd.testing.assert_frame_equal(serial[name], parallel[name])
+
+
+def test_scenarios_start_from_base_year_state():
+    # A scenario's results don't depend on which scenarios ran before it in the same simulation
+    simulation = BangladeshEnergySimulation(CONFIG)
+    after_baseline = simulation.run_simulation(2025, 2030, SCENARIOS)['high_growth']
+    alone = BangladeshEnergySimulation(CONFIG).run_simulation(2025, 2030, SCENARIOS[1:])['high_growth']
+
+    pd.testing.assert_frame_equal(after_baseline, alone)
+
+
+def test_result_flags_keep_bool_dtype():
+    frame = BangladeshEnergySimulation(CONFIG).run_simulation(2025, 2027)['baseline']
+
+    assert frame['governance_planning_processes_irp_adopted'].dtype == bool
+    assert 'scenario' not in frame
+
+
+def test_quiet_run_logs_no_model_progress(caplog):
+    simulation = BangladeshEnergySimulation(CONFIG)
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        simulation.run_simulation(2025, 2027, verbose=False)
+
+    assert not [r for r in caplog.records if r.levelno < logging.WARNING]
+
+
+def test_memo_is_shared_across_scenarios():
+    simulation = BangladeshEnergySimulation(CONFIG)
+    scenarios = [{'name': 'first', 'config_overrides': {}}, {'name': 'repeat', 'config_overrides': {}}]
+    results = simulation.run_simulation(2025, 2030, scenarios)
+
+    assert all(memo.cache_info().hits == 6 for memo in simulation._memos.values())
+    pd.testing.assert_frame_equal(results['first'], results['repeat'])
+
+
+def test_nested_overrides_reach_the_models():
+    # Overriding one base capacity entry replaces that entry only; the rest is inherited
+    overrides = {'generation_params': {'base_year_capacity': {'solar_util': 2000}},
+                 'market_params': {'re_support_params': {'fit_solar': 120}}}
+    scenarios = [SCENARIOS[0], {'name': 'more_solar', 'config_overrides': overrides}]
+    results = BangladeshEnergySimulation(CONFIG).run_simulation(2025, 2027, scenarios)
+    first_year = results['more_solar'].iloc[0]
+
+    assert first_year['start_of_year_capacity_solar_util'] == 2000
+    assert first_year['start_of_year_capacity_gas_cc'] == 8000
+    assert first_year['market_outcomes_re_support_feed_in_tariff_solar_mwh'] > \
+        results['baseline'].iloc[0]['market_outcomes_re_support_feed_in_tariff_solar_mwh']
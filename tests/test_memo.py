@@ -0,0 +1,9 @@
+from models._memo import ResultMemo
+
+
+def test_scope_identifies_configs_by_value():
+    memo = ResultMemo()
+    base = memo.scope({'tariff_params': {'subsidy_level': 0.1}, 'ppa_params': {'avg_ppa_price': 60}})
+
+    assert memo.scope({'ppa_params': {'avg_ppa_price': 60}, 'tariff_params': {'subsidy_level': 0.1}}) == base
+    assert memo.scope({'tariff_params': {'subsidy_level': 0.2}, 'ppa_params': {'avg_ppa_price': 60}}) != base